@@ -0,0 +1 @@
+# Existiert, damit /benchmarks als Package gefunden wird.
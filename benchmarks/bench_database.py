@@ -0,0 +1,329 @@
+"""Benchmarks für die Persistenzschicht des Dashboards.
+
+Die Benchmarks arbeiten ausschließlich mit temporären Datenbanken und berühren
+``data/data.db`` nicht.
+
+Aufruf:
+    ``python -m benchmarks.bench_database [--runden N]``
+"""
+
+from __future__ import annotations
+import argparse
+import datetime
+import shutil
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from src.database import DatabaseManager, ENGINE_PROFILE
+from src.main import Controller
+from src.models import EnrollmentStatus, Kurs, Modul
+from src.statistik import NUMPY_VERFUEGBAR, berechne_statistik, packe_versuche
+
+EMAIL = "bench@gmail.com"
+
+
+def erstelle_testdaten(db: DatabaseManager, anzahl_enrollments: int) -> Controller:
+    """Legt einen Student mit ``anzahl_enrollments`` Enrollments an und loggt ihn ein.
+
+    Args:
+        db: DatabaseManager der Benchmark-Datenbank.
+        anzahl_enrollments: Anzahl der anzulegenden Enrollments (je 1 Prüfungsleistung).
+
+    Returns:
+        Controller mit eingeloggtem Student.
+    """
+    controller = Controller(db=db, seed=False)
+    hs = db.add_hochschule("Bench HS")
+    sg = db.add_studiengang("Bench SG", 180)
+    sg.hochschule = hs
+    db.commit_or_rollback(action="bench")
+    controller.erstelle_account(
+        {
+            "name": "Bench",
+            "matrikelnummer": "1",
+            "email": EMAIL,
+            "password": "pw",
+            "semesteranzahl": 6,
+            "modulanzahl": max(36, anzahl_enrollments),
+            "startdatum": "2024-01-01",
+            "zieldatum": "2027-01-01",
+            "zielnote": 2.0,
+            "hochschulid": hs.id,
+            "studiengang_id": sg.id,
+        }
+    )
+    for i in range(anzahl_enrollments):
+        enrollment = controller.erstelle_enrollment(
+            {
+                "modul_name": f"Modul {i}",
+                "modul_code": f"M{i:04d}",
+                "modul_ects": 5,
+                "kurse_dict": {f"K{i:04d}": f"Kurs {i}"},
+                "pl_anzahl": 1,
+                "startdatum": "2024-02-01",
+            }
+        )
+        if i % 2 == 0:
+            pl = enrollment["pruefungsleistungen"][0]
+            controller.change_pl(
+                enrollment["id"],
+                {"id": pl["id"], "datum": "2024-06-01", "note": 1.0 + (i % 30) / 10},
+            )
+    return controller
+
+
+def messe(funktion, runden: int) -> tuple[float, float]:
+    """Führt ``funktion`` ``runden``-mal aus und gibt Median und p95 in Millisekunden zurück."""
+    zeiten = []
+    for _ in range(runden):
+        start = time.perf_counter()
+        funktion()
+        zeiten.append((time.perf_counter() - start) * 1000)
+    zeiten.sort()
+    return statistics.median(zeiten), zeiten[int(len(zeiten) * 0.95) - 1]
+
+
+def bench_engine_profile(runden: int) -> None:
+    """Vergleicht Commit-Latenz von ``change_pl`` und Ladezeit von
+    ``lade_student_mit_beziehungen`` für alle Engine-Profile."""
+    print("Engine-Profile (40 Enrollments)")
+    print(f"{'Profil':<10} {'change_pl ms (med/p95)':>24} {'laden ms (med/p95)':>22}")
+    with tempfile.TemporaryDirectory() as verzeichnis:
+        for profil in ENGINE_PROFILE:
+            url = f"sqlite+pysqlite:///{Path(verzeichnis) / f'{profil}.db'}"
+            schreib_profil = "fast" if profil == "readonly" else profil
+            controller = erstelle_testdaten(
+                DatabaseManager(profil=schreib_profil, url=url), 40
+            )
+            change_pl = "n/a"
+            if profil != "readonly":
+                enrollment = controller.get_list_of_enrollments()[1]
+                pl = enrollment["pruefungsleistungen"][0]
+                zaehler = iter(range(runden))
+
+                def aendere_pl() -> None:
+                    tag = datetime.date(2024, 6, 1) + datetime.timedelta(
+                        days=next(zaehler) % 28
+                    )
+                    controller.change_pl(
+                        enrollment["id"],
+                        {"id": pl["id"], "datum": tag.isoformat(), "note": 2.3},
+                    )
+
+                med, p95 = messe(aendere_pl, runden)
+                change_pl = f"{med:.2f} / {p95:.2f}"
+            controller.db.session.close()
+
+            db = DatabaseManager(profil=profil, url=url)
+
+            def lade() -> None:
+                db.recreate_session()
+                db.lade_student_mit_beziehungen(EMAIL)
+
+            med, p95 = messe(lade, runden)
+            print(f"{profil:<10} {change_pl:>24} {f'{med:.2f} / {p95:.2f}':>22}")
+            db.session.close()
+            db.engine.dispose()
+            controller.db.engine.dispose()
+
+
+def bench_dashboard_kennzahlen(runden: int) -> None:
+    """Vergleicht die Kennzahlen des Dashboard-Kopfs über ORM-Objekte (``get_*``),
+    die gruppierte SQL-Abfrage und die gespeicherten Kennzahlen am Student.
+
+    Jede Runde startet mit einer frischen Session, damit keine Objekte aus der
+    Identity Map wiederverwendet werden.
+    """
+    print("Dashboard-Kennzahlen")
+    print(
+        f"{'Enrollments':<12} {'ORM ms (med/p95)':>20} {'SQL ms (med/p95)':>20}"
+        f" {'gespeichert ms (med/p95)':>26}"
+    )
+    with tempfile.TemporaryDirectory() as verzeichnis:
+        for anzahl in (10, 100, 1000):
+            url = f"sqlite+pysqlite:///{Path(verzeichnis) / f'kennzahlen_{anzahl}.db'}"
+            db = DatabaseManager(profil="fast", url=url)
+            controller = erstelle_testdaten(db, anzahl)
+            student_id = controller.student.id
+
+            def orm() -> None:
+                db.recreate_session()
+                controller.student = db.lade_student_mit_id(student_id)
+                controller.student.berechne_kennzahlen_neu()
+                for status in (
+                    EnrollmentStatus.ABGESCHLOSSEN,
+                    EnrollmentStatus.IN_BEARBEITUNG,
+                    EnrollmentStatus.NICHT_BESTANDEN,
+                ):
+                    controller.get_number_of_enrollments_with_status(status)
+                controller.get_erarbeitete_ects()
+                controller.get_notendurchschnitt()
+
+            def sql() -> None:
+                db.recreate_session()
+                db.lade_dashboard_kennzahlen(student_id)
+
+            def gespeichert() -> None:
+                db.recreate_session()
+                controller.student = db.lade_student_mit_id(student_id)
+                controller.get_erarbeitete_ects()
+                controller.get_notendurchschnitt()
+
+            spalten = [
+                "{:.2f} / {:.2f}".format(*messe(funktion, runden))
+                for funktion in (orm, sql, gespeichert)
+            ]
+            print(f"{anzahl:<12} {spalten[0]:>20} {spalten[1]:>20} {spalten[2]:>26}")
+            db.session.close()
+            db.engine.dispose()
+
+
+def bench_loeschen(runden: int) -> None:
+    """Vergleicht die Latenz beim Löschen eines Accounts über die ORM-Kaskade
+    (``session.delete`` auf dem geladenen Student-Graphen, ein DELETE pro Zeile) und
+    über ``ON DELETE CASCADE`` (``loesche_student``, ein DELETE).
+
+    Jede Runde arbeitet auf einer frischen Kopie einer Vorlage-Datenbank, gemessen wird
+    nur das Löschen inkl. Commit.
+    """
+    runden = min(runden, 50)
+    print("Account löschen")
+    print(
+        f"{'Enrollments':<12} {'ORM-Kaskade ms (med/p95)':>26}"
+        f" {'ON DELETE CASCADE ms (med/p95)':>32}"
+    )
+    with tempfile.TemporaryDirectory() as verzeichnis:
+        for anzahl in (10, 40, 200):
+            vorlage = Path(verzeichnis) / f"vorlage_{anzahl}.db"
+            db = DatabaseManager(profil="fast", url=f"sqlite+pysqlite:///{vorlage}")
+            erstelle_testdaten(db, anzahl)
+            db.session.close()
+            db.engine.dispose()
+
+            spalten = []
+            for orm in (True, False):
+                zeiten = []
+                for runde in range(runden):
+                    kopie = Path(verzeichnis) / f"loeschen_{runde}.db"
+                    shutil.copy(vorlage, kopie)
+                    db = DatabaseManager(
+                        profil="fast", url=f"sqlite+pysqlite:///{kopie}"
+                    )
+                    student = db.lade_student_mit_beziehungen(EMAIL)
+                    start = time.perf_counter()
+                    if orm:
+                        db.session.delete(student)
+                        db.commit_or_rollback(action="bench")
+                    else:
+                        db.loesche_student(student)
+                    zeiten.append((time.perf_counter() - start) * 1000)
+                    db.session.close()
+                    db.engine.dispose()
+                    kopie.unlink()
+                zeiten.sort()
+                spalten.append(
+                    f"{statistics.median(zeiten):.2f} / "
+                    f"{zeiten[int(len(zeiten) * 0.95) - 1]:.2f}"
+                )
+            print(f"{anzahl:<12} {spalten[0]:>26} {spalten[1]:>32}")
+
+
+def bench_katalog_suche(runden: int) -> None:
+    """Misst die Antwortzeit von ``suche_module`` (Autovervollständigung) für verschieden
+    große Kataloge mit je einem Kurs pro Modul, inklusive Laden der Module und Kurse.
+    """
+    eingaben = ("m", "Mathe", "data sci", "DLB012", "K0042")
+    print("Katalogsuche (ms med/p95 je Eingabe)")
+    print(f"{'Module':<8} " + " ".join(f"{e!r:>16}" for e in eingaben))
+    with tempfile.TemporaryDirectory() as verzeichnis:
+        for anzahl in (1000, 5000, 20000):
+            url = f"sqlite+pysqlite:///{Path(verzeichnis) / f'katalog_{anzahl}.db'}"
+            db = DatabaseManager(profil="fast", url=url)
+            db._fuege_ein(
+                Modul,
+                [
+                    {
+                        "_name": f"Data Science {i}"
+                        if i % 10 == 0
+                        else f"Mathematik {i}",
+                        "_modulcode": f"DLB{i:05d}",
+                        "_ects_punkte": 5,
+                    }
+                    for i in range(anzahl)
+                ],
+            )
+            db._fuege_ein(
+                Kurs,
+                [
+                    {"_name": f"Kurs {i}", "_nummer": f"K{i:05d}", "modul_id": i + 1}
+                    for i in range(anzahl)
+                ],
+            )
+            db.commit_or_rollback(action="bench")
+            spalten = [
+                "{:.2f} / {:.2f}".format(
+                    *messe(lambda e=eingabe: db.suche_module(e, limit=8), runden)
+                )
+                for eingabe in eingaben
+            ]
+            print(f"{anzahl:<8} " + " ".join(f"{s:>16}" for s in spalten))
+            db.session.close()
+            db.engine.dispose()
+
+
+def bench_statistik(runden: int) -> None:
+    """Vergleicht die Neuberechnung der Kennzahlen je Enrollment (``aendere_kennzahlen``)
+    mit dem Statistik-Kern in reinem Python und mit NumPy.
+
+    Die Enrollments sind geladen, gemessen wird nur die Rechnung im Speicher.
+    """
+    print("Statistik-Kern")
+    print(
+        f"{'Enrollments':<12} {'einzeln ms (med/p95)':>22} {'Python ms (med/p95)':>22}"
+        f" {'NumPy ms (med/p95)':>22}"
+    )
+    with tempfile.TemporaryDirectory() as verzeichnis:
+        for anzahl in (10, 100, 1000):
+            url = f"sqlite+pysqlite:///{Path(verzeichnis) / f'statistik_{anzahl}.db'}"
+            db = DatabaseManager(profil="fast", url=url)
+            controller = erstelle_testdaten(db, anzahl)
+            student = db.lade_student_mit_beziehungen(EMAIL)
+
+            def einzeln() -> None:
+                student.setze_kennzahlen_zurueck()
+                for enrollment in student.enrollments:
+                    student.aendere_kennzahlen(enrollment, 1)
+
+            def python() -> None:
+                berechne_statistik(packe_versuche(student.enrollments), False)
+
+            def numpy() -> None:
+                berechne_statistik(packe_versuche(student.enrollments), True)
+
+            spalten = [
+                "{:.2f} / {:.2f}".format(*messe(funktion, runden))
+                for funktion in (einzeln, python, numpy)
+                if funktion is not numpy or NUMPY_VERFUEGBAR
+            ]
+            spalten += ["n/a"] * (3 - len(spalten))
+            print(f"{anzahl:<12} {spalten[0]:>22} {spalten[1]:>22} {spalten[2]:>22}")
+            controller.db.session.close()
+            db.engine.dispose()
+
+
+def main() -> None:
+    """Parsed Argumente und führt alle Benchmarks aus."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runden", type=int, default=200, help="Wiederholungen")
+    args = parser.parse_args()
+    bench_engine_profile(args.runden)
+    bench_dashboard_kennzahlen(args.runden)
+    bench_loeschen(args.runden)
+    bench_katalog_suche(args.runden)
+    bench_statistik(args.runden)
+
+
+if __name__ == "__main__":
+    main()
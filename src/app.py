@@ -13,6 +13,11 @@ import argparse
 import logging
 
 from src.main import Controller
+from src.models import normalisiere_name
+from src.database import DB_URL, DatabaseManager, ENGINE_PROFILE
+from src.schreib_warteschlange import SchreibWarteschlange
+from src.sharding import ROUTER, ShardedDatabaseManager
+from src.wartung import WartungsPlaner
 from utils.logging_config import setup_logging
 
 logger = logging.getLogger(__name__)
@@ -36,6 +41,12 @@ HELLBLAU = "#B5D0FF"
 # GLOBAL - Pfade
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+# GLOBAL - Verzögerung der Katalogsuche nach dem letzten Tastendruck (ms)
+SUCHE_VERZOEGERUNG_MS = 150
+
+# GLOBAL - Abstand der Prüfung, ob das angezeigte Dashboard veraltet ist (ms)
+DASHBOARD_PRUEFUNG_MS = 250
+
 
 def from_iso_to_ddmmyyyy(date: str | datetime.date | None) -> str:
     """Wandelt ein ISO-Datum in das deutsches Datumsformat ``dd.mm.yyyy``.
@@ -66,6 +77,22 @@ def from_iso_to_ddmmyyyy(date: str | datetime.date | None) -> str:
         return ""
 
 
+def im_widget(
+    widget: tk.Misc, rueckmeldung: Callable[..., None]
+) -> Callable[..., None]:
+    """Rückmeldung der Schreib-Warteschlange, die nur ausgeführt wird, solange ``widget`` existiert.
+
+    Schreiboperationen laufen im Hintergrund weiter, wenn der Benutzer den Frame bereits
+    verlassen hat; Label-Updates auf zerstörten Widgets werden dann übersprungen.
+    """
+
+    def _rueckmeldung(*args) -> None:
+        if widget.winfo_exists():
+            rueckmeldung(*args)
+
+    return _rueckmeldung
+
+
 def parse_args() -> argparse.Namespace:
     """Parsed Command Line Argumente und fügt mögliche Argumente hinzu.
 
@@ -74,6 +101,12 @@ def parse_args() -> argparse.Namespace:
         * ``--debug``: Aktivert Logging-DEBUG-Level.
         * ``--log_to_console``: Aktiviert Log-Anzeige in der Console
         * ``--follow_system_mode``: Light-/Dark-Mode wird von System übernommen
+        * ``--db_profile``: Engine-Profil der Datenbank (durable, fast, readonly)
+        * ``--sql_stats``: Loggt SQL-Statements, Zeilen und Zeiten jeder Controller-Operation
+        * ``--shards``: Verteilt die Studentendaten auf N SQLite-Dateien (0: eine Datenbank)
+        * ``--shard_router``: Routing der Studenten auf die Shards (email, hochschule)
+        * ``--snapshots``: Erstellt beim Start einen Snapshot und behält die letzten N
+        * ``--db_url``: Datenbank-URL, z. B. PostgreSQL (default: ``DB_URL``)
     """
     parser = argparse.ArgumentParser()
     parser.add_argument(
@@ -92,7 +125,47 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Light-/Dark-Mode wird von System übernommen",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--db_profile",
+        choices=sorted(ENGINE_PROFILE),
+        default="durable",
+        help="Engine-Profil der Datenbank (PRAGMAs), default: durable",
+    )
+    parser.add_argument(
+        "--sql_stats",
+        action="store_true",
+        help="Loggt SQL-Statistik (Statements, Zeilen, Zeit) jeder Controller-Operation",
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=0,
+        help="Anzahl der Shard-Dateien für Studentendaten, default: 0 (eine Datenbank)",
+    )
+    parser.add_argument(
+        "--shard_router",
+        choices=sorted(ROUTER),
+        default="email",
+        help="Routing der Studenten auf die Shards, default: email",
+    )
+    parser.add_argument(
+        "--snapshots",
+        type=int,
+        default=0,
+        help="Erstellt beim Start einen Snapshot (data/backups) und behält die letzten N, default: 0 (aus)",
+    )
+    parser.add_argument(
+        "--db_url",
+        default=DB_URL,
+        help="Datenbank-URL, z. B. postgresql+psycopg://user@host/iu_dashboard, "
+        "default: IU_DASHBOARD_DB_URL oder data/data.db",
+    )
+    args = parser.parse_args()
+    if args.shards > 0 and args.db_url != DB_URL:
+        parser.error(
+            "--shards ist nur mit der SQLite-Datei möglich, nicht mit --db_url"
+        )
+    return args
 
 
 class Icons:
@@ -444,6 +517,8 @@ class DynamicEntries(ctk.CTkFrame):
             master, fg_color="transparent", border_color="black", border_width=2
         )
         self.max_rows = max_rows
+        self.placeholder_links = placeholder_links
+        self.placeholder_rechts = placeholder_rechts
         self.rows: list[dict[str, object]] = []
 
         # Layout
@@ -558,6 +633,28 @@ class DynamicEntries(ctk.CTkFrame):
                 values.update({entry_links: entry_rechts})
         return values
 
+    def set_values(self, values: dict[str, str]) -> None:
+        """Befüllt die Eingabezeilen mit den übergebenen Werten.
+
+        Fehlende Zeilen werden bis ``max_rows`` ergänzt, überzählige Zeilen geleert.
+
+        Args:
+            values (dict[str, str]):
+                Ein Dictionary in der Form ``{entry_links: entry_rechts}``.
+        """
+        while len(self.rows) < min(len(values), self.max_rows):
+            self.add_row(self.placeholder_links, self.placeholder_rechts)
+        eintraege = list(values.items())
+        for i, row in enumerate(self.rows):
+            links, rechts = eintraege[i] if i < len(eintraege) else ("", "")
+            for entry, wert in (
+                (row["entry_links"], links),
+                (row["entry_rechts"], rechts),
+            ):
+                entry.delete(0, "end")  # type: ignore
+                if wert:
+                    entry.insert(0, wert)  # type: ignore
+
 
 class CalendarMixin:
     """Mixin für CTk-Widgets, das ein Kalender-Popup bereitstellt.
@@ -1500,7 +1597,7 @@ class StudiengangAuswahlFrame(ctk.CTkFrame):
             return
 
         if (
-            self.selected_studiengang_name.lower()
+            normalisiere_name(self.selected_studiengang_name)
             not in self.controller.get_studiengaenge_von_hs(
                 self.cache["hochschulid"]
             ).values()
@@ -1514,7 +1611,9 @@ class StudiengangAuswahlFrame(ctk.CTkFrame):
                 self.selected_studiengang_name, self.cache["hochschulid"]
             )
         for k, v in studiengang.items():
-            if v.lower() == self.selected_studiengang_name.lower():
+            if normalisiere_name(v) == normalisiere_name(
+                self.selected_studiengang_name
+            ):
                 self.selected_studiengang_id = k
             else:
                 raise ValueError(
@@ -1595,6 +1694,7 @@ class DashboardFrame(ctk.CTkFrame, MenuMixin):
 
         self.fonts = master.fonts
         self.icons = master.icons
+        self.schreiber: SchreibWarteschlange = master.schreiber
 
         self.data = self.controller.load_dashboard_data()
 
@@ -1798,7 +1898,7 @@ class DashboardFrame(ctk.CTkFrame, MenuMixin):
         )
 
         balken_frame = ctk.CTkFrame(relative_balken_frame, fg_color="transparent")
-        balken_frame.place(relwidth=self.controller.get_semester_amount(), relheight=1)
+        balken_frame.place(relwidth=self.data["semester_amount"], relheight=1)
 
         semester_frame.grid_columnconfigure(0, weight=1)
 
@@ -2192,6 +2292,8 @@ class DashboardFrame(ctk.CTkFrame, MenuMixin):
         Controller aus und navigiert anschließend zum Login-Frame.
         """
         self.close_menu()
+        # ausstehende Schreiboperationen gehören noch zum angemeldeten Studenten
+        self.schreiber.warte()
         self.controller.logout()
         self.after(0, self.go_to_login)
 
@@ -2230,6 +2332,7 @@ class AddEnrollmentFrame(ctk.CTkScrollableFrame, CalendarMixin):
 
         self.fonts = master.fonts
         self.icons = master.icons
+        self.schreiber: SchreibWarteschlange = master.schreiber
 
         self.grid_columnconfigure(0, weight=1)
         self.grid_columnconfigure(1, weight=1)
@@ -2375,6 +2478,19 @@ class AddEnrollmentFrame(ctk.CTkScrollableFrame, CalendarMixin):
 
         self.selected_startdatum_real: str | None = None
 
+        # Vorschläge aus dem Modulkatalog (Autovervollständigung)
+        self.vorschlaege_frame = ctk.CTkFrame(
+            left_frame, fg_color=(BACKGROUND, BACKGROUND_DARK)
+        )
+        self.vorschlaege_frame.grid(
+            row=7, column=0, columnspan=2, padx=5, pady=5, sticky="ew"
+        )
+        self._suche_job: str | None = None
+        for entry in (self.modul_name_entry, self.modul_code_entry):
+            entry.bind(
+                "<KeyRelease>", lambda e, entry=entry: self._plane_suche(entry.get())
+            )
+
         # RIGHT FRAME
         # Welcher Kurs oder welche Kurse müssen absolviert werden?
         kurs_name_label = ctk.CTkLabel(
@@ -2411,6 +2527,57 @@ class AddEnrollmentFrame(ctk.CTkScrollableFrame, CalendarMixin):
             row=1, column=0, columnspan=2, sticky="ew", padx=10, pady=5
         )
 
+    def _plane_suche(self, eingabe: str) -> None:
+        """Startet die Katalogsuche verzögert, damit nicht bei jedem Tastendruck gesucht wird.
+
+        Args:
+            eingabe (str): Aktueller Inhalt des Modulnamen- oder Modulcode-Felds.
+        """
+        if self._suche_job is not None:
+            self.after_cancel(self._suche_job)
+        self._suche_job = self.after(
+            SUCHE_VERZOEGERUNG_MS, self._zeige_vorschlaege, eingabe
+        )
+
+    def _zeige_vorschlaege(self, eingabe: str) -> None:
+        """Zeigt die gefundenen Module als Buttons unter dem Formular an.
+
+        Args:
+            eingabe (str): Suchbegriff.
+        """
+        self._suche_job = None
+        for widget in self.vorschlaege_frame.winfo_children():
+            widget.destroy()
+        if len(eingabe.strip()) < 2:
+            return
+        for vorschlag in self.controller.suche_module(eingabe):
+            ctk.CTkButton(
+                self.vorschlaege_frame,
+                text=f"{vorschlag['modul_code']} – {vorschlag['modul_name']}",
+                text_color="black",
+                fg_color="transparent",
+                hover_color="gray95",
+                anchor="w",
+                command=lambda v=vorschlag: self._uebernehme_vorschlag(v),
+            ).pack(fill="x", padx=2, pady=1)
+
+    def _uebernehme_vorschlag(self, vorschlag: dict) -> None:
+        """Übernimmt Modulname, Modul-Code, ECTS-Punkte und Kurse eines Vorschlags ins Formular.
+
+        Args:
+            vorschlag (dict): Eintrag aus ``Controller.suche_module``.
+        """
+        for entry, wert in (
+            (self.modul_name_entry, vorschlag["modul_name"]),
+            (self.modul_code_entry, vorschlag["modul_code"]),
+            (self.modul_ects_entry, str(vorschlag["modul_ects"])),
+        ):
+            entry.delete(0, "end")
+            entry.insert(0, wert)
+        self.kurse_eingabe_feld.set_values(vorschlag["kurse_dict"])
+        for widget in self.vorschlaege_frame.winfo_children():
+            widget.destroy()
+
     def on_submit(self) -> None:
         """Validiert die Eingaben und legt bei Erfolg ein neues Enrollment an.
 
@@ -2419,8 +2586,8 @@ class AddEnrollmentFrame(ctk.CTkScrollableFrame, CalendarMixin):
             * Kursliste auslesen und prüfen, ob mindestens ein Kurs angegeben ist.
             * Enrollment-Daten in einem Cache-Dictionary sammeln und prüfen,
             ob bereits eine Einschreibung für dieses Modul existiert.
-            * Bei Erfolg Enrollment über den Controller anlegen und zur
-            entsprechenden Detailansicht navigieren.
+            * Bei Erfolg Enrollment über die Schreib-Warteschlange anlegen und
+            nach dem Speichern zur entsprechenden Detailansicht navigieren.
 
         Bei Validierungsfehlern werden entsprechende Fehlermeldungen in den
         dafür vorgesehenen Labels angezeigt und die Methode bricht ab.
@@ -2468,12 +2635,22 @@ class AddEnrollmentFrame(ctk.CTkScrollableFrame, CalendarMixin):
             )
             return
 
-        enrollment_dict = self.controller.erstelle_enrollment(
-            enrollment_cache=enrollment_cache
+        self.leere_felder_label.configure(text="Wird gespeichert ...")
+        self.schreiber.einreihen(
+            self.controller.erstelle_enrollment,
+            enrollment_cache=enrollment_cache,
+            bei_erfolg=im_widget(
+                self,
+                lambda enrollment_dict: self.go_to_enrollment(enrollment_dict["id"]),
+            ),
+            bei_fehler=im_widget(
+                self,
+                lambda e: self.leere_felder_label.configure(
+                    text="Speichern fehlgeschlagen."
+                ),
+            ),
         )
 
-        self.after(0, lambda: self.go_to_enrollment(enrollment_dict["id"]))
-
     def validate_ects(self, ects: str) -> bool:
         """Prüft, ob der ECTS-Wert eine Ganzzahl zwischen 1 und 50 ist.
 
@@ -3036,6 +3213,7 @@ class PLAddFrame(ctk.CTkFrame, CalendarMixin):
 
         self.fonts = master.fonts
         self.icons = master.icons
+        self.schreiber: SchreibWarteschlange = master.schreiber
 
         self.grid_columnconfigure(0, weight=1)
         self.grid_columnconfigure(1, weight=1)
@@ -3221,7 +3399,10 @@ class PLAddFrame(ctk.CTkFrame, CalendarMixin):
         pl_show_datum_label.pack(pady=15)
 
     def on_submit(self) -> None:
-        """Validiert Eingaben, speichert Note und Datum über den Controller und navigiert zurück."""
+        """Validiert Eingaben, speichert Note und Datum im Hintergrund und navigiert zurück.
+
+        Navigiert wird erst nach dem Speichern, damit die Enrollment-Ansicht die neue Note zeigt.
+        """
         if str(self.pl_add_note_entry.get()).strip() == "":
             self.label_leere_felder.configure(text="Keine Note eingegeben.")
             return
@@ -3234,9 +3415,22 @@ class PLAddFrame(ctk.CTkFrame, CalendarMixin):
         self.pl_data["note"] = float(self.pl_add_note_entry.get())
         self.pl_data["datum"] = self.selected_pl_datum_str
 
-        self.controller.change_pl(self.enrollment_id, self.pl_data)
-
-        self.after(0, self.go_to_enrollment, self.enrollment_id)
+        self.label_leere_felder.configure(text="Wird gespeichert ...")
+        self.schreiber.einreihen(
+            self.controller.change_pl,
+            self.enrollment_id,
+            dict(self.pl_data),
+            schluessel=("change_pl", self.pl_id),
+            bei_erfolg=im_widget(
+                self, lambda _: self.go_to_enrollment(self.enrollment_id)
+            ),
+            bei_fehler=im_widget(
+                self,
+                lambda e: self.label_leere_felder.configure(
+                    text="Speichern fehlgeschlagen."
+                ),
+            ),
+        )
 
     def pl_datum_calendar_at_button(self) -> None:
         """Öffnet den Kalender zur Auswahl des Prüfungsdatums."""
@@ -3297,6 +3491,7 @@ class SettingsFrame(ctk.CTkScrollableFrame, CalendarMixin):
 
         self.fonts = master.fonts
         self.icons = master.icons
+        self.schreiber: SchreibWarteschlange = master.schreiber
 
         self.grid_columnconfigure(0, weight=1)
         self.grid_columnconfigure(1, weight=1)
@@ -3489,7 +3684,7 @@ class SettingsFrame(ctk.CTkScrollableFrame, CalendarMixin):
             button_color="gray95",
             button_hover_color="gray85",
         )
-        self.entry_semesteranzahl.set(f"{len(self.data['semester'])}")
+        self.entry_semesteranzahl.set(f"{self.data['semesteranzahl']}")
         self.entry_semesteranzahl.grid(row=4, column=1, sticky="ew", padx=10, pady=10)
         self.semester_button = ctk.CTkButton(
             st_change_frame,
@@ -3724,42 +3919,95 @@ class SettingsFrame(ctk.CTkScrollableFrame, CalendarMixin):
         )
         self.button_delete_account.grid(row=3, column=3, padx=10, pady=10)
 
+    def _speichere(
+        self,
+        label: ctk.CTkLabel,
+        text: str,
+        funktion: Callable,
+        *args,
+        bei_erfolg: Callable[[], None] | None = None,
+    ) -> None:
+        """Reiht eine Änderung in die Schreib-Warteschlange ein und zeigt sie sofort an.
+
+        Das Label zeigt optimistisch ``text``; schlägt das Speichern fehl, wird die
+        Meldung durch einen Hinweis ersetzt. Mehrfaches Speichern desselben Feldes vor
+        dem Commit wird zusammengefasst.
+
+        Args:
+            label (ctk.CTkLabel): Label für Status- und Fehlermeldung.
+            text (str): Meldung nach dem Einreihen.
+            funktion (Callable): Controller-Methode, z. B. ``controller.change_name``.
+            *args: Argumente für ``funktion``.
+            bei_erfolg: Optionaler Callback nach dem Commit (in der Tk-Hauptschleife).
+        """
+        label.configure(text=text)
+        self.schreiber.einreihen(
+            funktion,
+            *args,
+            schluessel=funktion.__name__,
+            bei_erfolg=im_widget(self, lambda _: bei_erfolg()) if bei_erfolg else None,
+            bei_fehler=im_widget(
+                self, lambda e: label.configure(text="Speichern fehlgeschlagen")
+            ),
+        )
+
     def save_email(self) -> None:
         """Validiert und speichert die neue E-Mail-Adresse"""
         if self.verify_email():
-            self.controller.change_email(self.selected_email)
-            self.label_email_not_valid.configure(text="Neue Email gespeichert")
+            self._speichere(
+                self.label_email_not_valid,
+                "Neue Email gespeichert",
+                self.controller.change_email,
+                self.selected_email,
+            )
 
     def save_password(self) -> None:
         """Validiert und speichert das neue Passwort."""
         if self.verify_input(self.entry_password.get()):
-            self.controller.change_password(self.entry_password.get())
-            self.password_not_valid.configure(text="Neues Passwort gespeichert")
+            self._speichere(
+                self.password_not_valid,
+                "Neues Passwort gespeichert",
+                self.controller.change_password,
+                self.entry_password.get(),
+            )
         else:
             self.password_not_valid.configure(text="Nicht ausgefüllt")
 
     def save_name(self) -> None:
         """Validiert und speichert den neuen Namen."""
         if self.verify_input(self.entry_name.get()):
-            self.controller.change_name(self.entry_name.get())
-            self.name_not_valid.configure(text="Neuer Name gespeichert")
+            self._speichere(
+                self.name_not_valid,
+                "Neuer Name gespeichert",
+                self.controller.change_name,
+                self.entry_name.get(),
+            )
         else:
             self.name_not_valid.configure(text="Nicht ausgefüllt")
 
     def save_matrikelnummer(self) -> None:
         """Validiert und speichert die neue Matrikelnummer."""
         if self.verify_input(self.entry_matrikelnummer.get()):
-            self.controller.change_matrikelnummer(self.entry_matrikelnummer.get())
-            self.matrikel_not_valid.configure(text="Neue Matrikelnummer gespeichert")
+            self._speichere(
+                self.matrikel_not_valid,
+                "Neue Matrikelnummer gespeichert",
+                self.controller.change_matrikelnummer,
+                self.entry_matrikelnummer.get(),
+            )
         else:
             self.matrikel_not_valid.configure(text="Nicht ausgefüllt")
 
     def save_semester_anzahl(self) -> None:
         """Speichert die neue Semesteranzahl, falls sie vom bisherigen Wert abweicht."""
         neu_semester_anzahl = int(self.entry_semesteranzahl.get())
-        if neu_semester_anzahl != len(self.data["semester"]):
-            self.controller.change_semester_anzahl(neu_semester_anzahl)
-            self.semester_anzahl_not_valid.configure(text="Semester Gespeichert")
+        if neu_semester_anzahl != self.data["semesteranzahl"]:
+            self._speichere(
+                self.semester_anzahl_not_valid,
+                "Semester Gespeichert",
+                self.controller.change_semester_anzahl,
+                neu_semester_anzahl,
+            )
+            self.data["semesteranzahl"] = neu_semester_anzahl
         else:
             self.semester_anzahl_not_valid.configure(text="Entspricht bisherigen Wert")
 
@@ -3772,10 +4020,16 @@ class SettingsFrame(ctk.CTkScrollableFrame, CalendarMixin):
             ):
                 self.startdatum_not_valid.configure(text="Entspricht bisherigen Wert")
             else:
-                self.controller.change_startdatum(
-                    datetime.date.fromisoformat(self.selected_startdatum_real)
+                neu_startdatum = datetime.date.fromisoformat(
+                    self.selected_startdatum_real
                 )
-                self.startdatum_not_valid.configure(text="Gespeichert")
+                self._speichere(
+                    self.startdatum_not_valid,
+                    "Gespeichert",
+                    self.controller.change_startdatum,
+                    neu_startdatum,
+                )
+                self.data["startdatum"] = neu_startdatum
         else:
             self.startdatum_not_valid.configure(text="Kein Datum gewählt")
 
@@ -3802,8 +4056,13 @@ class SettingsFrame(ctk.CTkScrollableFrame, CalendarMixin):
                     text="Du hast schon mehr Module begonnen"
                 )
             else:
-                self.controller.change_modul_anzahl(neu_modulanzahl)
-                self.modulanzahl_not_valid.configure(text="Gespeichert")
+                self._speichere(
+                    self.modulanzahl_not_valid,
+                    "Gespeichert",
+                    self.controller.change_modul_anzahl,
+                    neu_modulanzahl,
+                )
+                self.data["modulanzahl"] = neu_modulanzahl
         else:
             self.modulanzahl_not_valid.configure(text="Entspricht bisherigen Wert")
 
@@ -3824,9 +4083,15 @@ class SettingsFrame(ctk.CTkScrollableFrame, CalendarMixin):
             if self.search_combo.get_value() == self.data["hochschule"]:
                 self.hochschule_not_valid.configure(text="Entspricht bisherigen Wert")
                 return
-            hs_id, hs = self.check_or_create_hochschule()
-            self.controller.change_hochschule(hochschul_id=hs_id, hochschul_name=hs)
-            self.after(0, self.go_to_dashboard)
+            name, hs_id = self.search_combo.get_value(), self.search_combo.get_id()
+            self._speichere(
+                self.hochschule_not_valid,
+                "Wird gespeichert ...",
+                self.wechsle_hochschule,
+                name,
+                hs_id,
+                bei_erfolg=self.go_to_dashboard,
+            )
         else:
             self.hochschule_not_valid.configure(text="Nicht ausgefüllt")
 
@@ -3846,8 +4111,13 @@ class SettingsFrame(ctk.CTkScrollableFrame, CalendarMixin):
             if self.entry_studiengang.get() == self.data["studiengang"]:
                 self.studiengang_not_valid.configure(text="Entspricht bisherigen Wert")
                 return
-            self.controller.change_studiengang(self.entry_studiengang.get())
-            self.after(0, self.go_to_dashboard)
+            self._speichere(
+                self.studiengang_not_valid,
+                "Wird gespeichert ...",
+                self.controller.change_studiengang,
+                self.entry_studiengang.get(),
+                bei_erfolg=self.go_to_dashboard,
+            )
         else:
             self.studiengang_not_valid.configure(text="Nicht ausgefüllt")
 
@@ -3908,10 +4178,26 @@ class SettingsFrame(ctk.CTkScrollableFrame, CalendarMixin):
             command=self.delete_account,
         ).pack(pady=10)
 
+        self.label_delete_status = ctk.CTkLabel(
+            top, text="", text_color=ROT, font=self.fonts.TEXT
+        )
+        self.label_delete_status.pack(pady=5)
+
     def delete_account(self) -> None:
-        """Löscht den Account über den Controller und navigiert zum Login"""
-        self.controller.delete_student()
-        self.after(0, self.go_to_login)
+        """Löscht den Account im Hintergrund und navigiert danach zum Login.
+
+        Vorher eingereihte Änderungen werden noch ausgeführt, die Löschung folgt als
+        letzter Auftrag. Schlägt die Löschung fehl, zeigt das Popup einen Hinweis.
+        """
+        label = self.label_delete_status
+        label.configure(text="Wird gelöscht ...")
+        self.schreiber.einreihen(
+            self.controller.delete_student,
+            bei_erfolg=im_widget(self, lambda _: self.go_to_login()),
+            bei_fehler=im_widget(
+                label, lambda e: label.configure(text="Löschen fehlgeschlagen.")
+            ),
+        )
 
     def verify_input(self, value) -> bool:
         """Gibt ``True``zurück, wenn der übergebene String nach ``.strip()``nicht leer ist."""
@@ -3940,26 +4226,28 @@ class SettingsFrame(ctk.CTkScrollableFrame, CalendarMixin):
             self.selected_email = valid
             return True
 
-    def check_or_create_hochschule(self) -> tuple[int, str]:
-        """Ermittelt Hochschule (ID, Name) aus der SearchableComboBox, legt sie ggf. neu an."""
-        self.selected_hochschule_name = self.search_combo.get_value()
-        self.selected_hochschule_id = self.search_combo.get_id()
+    def wechsle_hochschule(self, name: str, hs_id: int | None) -> None:
+        """Legt die Hochschule ggf. neu an und wechselt den Studenten dorthin.
 
-        if self.selected_hochschule_id is None:
-            hochschule = self.controller.erstelle_hochschule(
-                self.selected_hochschule_name
-            )
+        Läuft in der Schreib-Warteschlange und greift deshalb nicht auf Widgets zu;
+        Name und ID der SearchableComboBox werden vorher ausgelesen.
+
+        Args:
+            name (str): Name der Hochschule.
+            hs_id (int | None): ID der Hochschule, ``None``, wenn sie neu ist.
+        """
+        if hs_id is None:
+            hochschule = self.controller.erstelle_hochschule(name)
             for k, v in hochschule.items():
-                if v == self.selected_hochschule_name:
-                    self.selected_hochschule_id = k
+                if v == name:
+                    hs_id = k
                 else:
                     raise ValueError(
                         "Datenbankrückgabe entspricht nicht Eingabewert: Hochschule"
                     )
-        if self.selected_hochschule_id:
-            return (self.selected_hochschule_id, self.selected_hochschule_name)
-        else:
+        if not hs_id:
             raise ValueError("Hochschule hat keine ID.")
+        self.controller.change_hochschule(hochschul_id=hs_id, hochschul_name=name)
 
     def start_datum_calendar_at_button(self) -> None:
         """Öffnet den Kalender zur Auswahl des Studienstartdatums."""
@@ -4040,6 +4328,7 @@ class ExFrame(ctk.CTkFrame, CalendarMixin):
 
         self.fonts = master.fonts
         self.icons = master.icons
+        self.schreiber: SchreibWarteschlange = master.schreiber
 
         self._init_header()
         self._init_form()
@@ -4153,8 +4442,12 @@ class ExFrame(ctk.CTkFrame, CalendarMixin):
     def delete_ex_date(self) -> None:
         """Löscht das gespeicherte Exmatrikulationsdatum und navigiert zum Dashboard."""
         if self.data["exmatrikulationsdatum"]:
-            self.controller.change_exmatrikulationsdatum(None)
-            self.after(0, self.go_to_dashboard)
+            self.schreiber.einreihen(
+                self.controller.change_exmatrikulationsdatum,
+                None,
+                schluessel="change_exmatrikulationsdatum",
+                bei_erfolg=im_widget(self, lambda _: self.go_to_dashboard()),
+            )
 
     def datum_submit(self) -> None:
         """Speichert das Exmatrikulationsdatum und navigiert zum Dashboard.
@@ -4168,10 +4461,18 @@ class ExFrame(ctk.CTkFrame, CalendarMixin):
             return
         self.selected_exdatum_str = self.selected_exdatum_real
 
-        self.controller.change_exmatrikulationsdatum(
-            datetime.date.fromisoformat(self.selected_exdatum_str)
+        self.schreiber.einreihen(
+            self.controller.change_exmatrikulationsdatum,
+            datetime.date.fromisoformat(self.selected_exdatum_str),
+            schluessel="change_exmatrikulationsdatum",
+            bei_erfolg=im_widget(self, lambda _: self.go_to_dashboard()),
+            bei_fehler=im_widget(
+                self,
+                lambda e: self.label_leere_felder.configure(
+                    text="Speichern fehlgeschlagen."
+                ),
+            ),
         )
-        self.after(0, self.go_to_dashboard)
 
     def ex_datum_calendar_at_button(self) -> None:
         """Öffnet den Kalender zur Auswahl des Exmatrikulationsdatums."""
@@ -4219,6 +4520,7 @@ class ZieleFrame(ctk.CTkFrame, CalendarMixin):
 
         self.fonts = master.fonts
         self.icons = master.icons
+        self.schreiber: SchreibWarteschlange = master.schreiber
 
         self._init_header()
         self._init_form()
@@ -4368,8 +4670,11 @@ class ZieleFrame(ctk.CTkFrame, CalendarMixin):
             return
         self.selected_zieldatum_str = self.selected_zieldatum_real
 
-        self.controller.change_zieldatum(
-            datetime.date.fromisoformat(self.selected_zieldatum_str)
+        self.schreiber.einreihen(
+            self.controller.change_zieldatum,
+            datetime.date.fromisoformat(self.selected_zieldatum_str),
+            schluessel="change_zieldatum",
+            bei_fehler=im_widget(self, self._zeige_speicherfehler),
         )
         self.label_leere_felder.configure(
             text="Zieldatum gespeichert", text_color=GRUEN
@@ -4378,11 +4683,22 @@ class ZieleFrame(ctk.CTkFrame, CalendarMixin):
     def noten_submit(self) -> None:
         """Speichert die aktuell ausgewählte Zielnote."""
         self.selected_zielnote = self.entry_zielnote
-        self.controller.change_zielnote(self.selected_zielnote)
+        self.schreiber.einreihen(
+            self.controller.change_zielnote,
+            self.selected_zielnote,
+            schluessel="change_zielnote",
+            bei_fehler=im_widget(self, self._zeige_speicherfehler),
+        )
         self.label_leere_felder.configure(
             text="Wunschnote gespeichert", text_color=GRUEN
         )
 
+    def _zeige_speicherfehler(self, fehler: Exception) -> None:
+        """Ersetzt die optimistische Erfolgsmeldung, wenn das Speichern fehlschlägt."""
+        self.label_leere_felder.configure(
+            text="Speichern fehlgeschlagen.", text_color=ROT
+        )
+
     def ziel_datum_calendar_at_button(self) -> None:
         """Öffnet den Kalender zur Auswahl des Zieldatums."""
         self._open_calendar_popup(
@@ -4527,8 +4843,10 @@ class App(ctk.CTk):
 
     Attribute:
         controller (Controller): Anwendungssteuerung mit Geschäftslogik.
+        schreiber (SchreibWarteschlange): Führt Änderungen im Hintergrund aus.
         fonts (Fonts): Font Manager der Anwendung.
         current_frame (ctk.CTkFrame): Der aktuell angezeigte Frame.
+        _dashboard (DashboardFrame | None): Zuletzt angezeigtes Dashboard (siehe ``show_dashboard``).
     """
 
     def __init__(
@@ -4538,6 +4856,12 @@ class App(ctk.CTk):
         debug: bool = False,
         log_to_console: bool = False,
         follow_system_mode: bool = False,
+        db_profile: str = "durable",
+        sql_stats: bool = False,
+        shards: int = 0,
+        shard_router: str = "email",
+        snapshots: int = 0,
+        db_url: str = DB_URL,
     ) -> None:
         """
         Initialisiert das Dashboard Programm.
@@ -4549,6 +4873,13 @@ class App(ctk.CTk):
             debug (bool): Wenn True, aktiviert Logging auf DEBUG Level.
             log_to_console (bool): Wenn True, aktiviert Logging-Anzeige in der Console.
             follow_system_mode (bool): Wenn True, wird Light-/Dark-Mode vom System übernommen.
+            db_profile (str): Engine-Profil der Datenbank (siehe ``ENGINE_PROFILE``).
+            sql_stats (bool): Wenn True, wird die SQL-Statistik jeder Controller-Operation geloggt.
+            shards (int): Anzahl der Shard-Dateien, 0: eine gemeinsame Datenbank.
+            shard_router (str): Routing der Studenten auf die Shards (siehe ``ROUTER``).
+            snapshots (int): Wenn > 0, wird beim Start im Hintergrund ein Snapshot erstellt
+                und die letzten ``snapshots`` Snapshots werden behalten.
+            db_url (str): Datenbank-URL (SQLite-Datei oder PostgreSQL), ohne Shards.
         """
         setup_logging(debug=debug, log_to_console=log_to_console)
         logger.info(
@@ -4560,7 +4891,40 @@ class App(ctk.CTk):
         self.fonts = Fonts()
         self.icons = Icons()
 
-        self.controller = Controller(seed=True, offline=offline)
+        if shards > 0:
+            db = ShardedDatabaseManager(
+                anzahl_shards=shards,
+                router=shard_router,
+                profil=db_profile,
+                log_sql_statistik=sql_stats,
+            )
+        else:
+            db = DatabaseManager(
+                profil=db_profile, url=db_url, log_sql_statistik=sql_stats
+            )
+        # Im readonly-Profil kann nicht geseedet werden.
+        self.controller = Controller(
+            db=db,
+            seed=db_profile != "readonly",
+            offline=offline,
+        )
+        if snapshots > 0:
+            # läuft im Backup-Thread, Ergebnis und Fehler werden geloggt
+            try:
+                db.snapshot(behalte=snapshots)
+            except ValueError as e:
+                logger.warning("Kein Snapshot: %s", e)
+        # Ältere Dateien einmalig auf auto_vacuum=INCREMENTAL umstellen (VACUUM ohne
+        # Zeitbudget, im Backup-Thread), danach Wartung (incremental_vacuum, ANALYZE,
+        # optimize) im Leerlauf, max. 200 ms pro Takt
+        self.wartungsplaner = WartungsPlaner(db)
+        if db_profile != "readonly":
+            db.stelle_auto_vacuum_um()
+            self.wartungsplaner.starte_mit_after(self)
+        # Änderungen werden im Schreib-Thread committet, Rückmeldungen über after()
+        self.schreiber = SchreibWarteschlange()
+        self.schreiber.starte_mit_after(self)
+        self.protocol("WM_DELETE_WINDOW", self.beenden)
 
         # Konfiguriere Programmfenster
         self.title("Dashboard")
@@ -4579,9 +4943,23 @@ class App(ctk.CTk):
         # Zentriere Fenster auf Bildschirm
         self.center_window()
         self.current_frame = None
+        # zuletzt angezeigtes Dashboard, wird bei unveränderten Daten wiederverwendet
+        self._dashboard: DashboardFrame | None = None
+        self._pruefe_dashboard()
         # Zeige Login zu Programmstart
         self.show_login()
 
+    def beenden(self) -> None:
+        """Führt ausstehende Änderungen aus und schließt das Programmfenster."""
+        if self.schreiber.ausstehend:
+            logger.info(
+                "Programmende: %s ausstehende Änderung(en) werden gespeichert.",
+                self.schreiber.ausstehend,
+            )
+        self.schreiber.stoppe()
+        self.wartungsplaner.stoppe()
+        self.destroy()
+
     def center_window(self) -> None:
         """Zentriert das Fenster auf dem Bildschirm."""
 
@@ -4600,6 +4978,40 @@ class App(ctk.CTk):
 
         self.geometry(f"{window_width}x{window_height}+{x}+{y}")
 
+    def _blende_aktuellen_frame_aus(self) -> None:
+        """Blendet den aktiven Frame aus und zerstört ihn.
+
+        Das Dashboard wird nur ausgeblendet und in ``_dashboard`` gehalten, damit
+        ``show_dashboard`` es ohne Änderungen unverändert wieder anzeigen kann.
+        """
+        if self.current_frame:
+            self.current_frame.pack_forget()
+            if self.current_frame is not self._dashboard:
+                self.current_frame.destroy()
+            self.update_idletasks()
+
+    def _verwerfe_dashboard(self) -> None:
+        """Zerstört das gehaltene Dashboard (z. B. beim Logout oder wenn es veraltet ist)."""
+        if self._dashboard is not None:
+            if self.current_frame is self._dashboard:
+                self.current_frame = None
+            self._dashboard.destroy()
+            self._dashboard = None
+
+    def _pruefe_dashboard(self) -> None:
+        """Lädt das angezeigte Dashboard neu, sobald es veraltet ist.
+
+        Änderungen aus der Schreib-Warteschlange können nach dem Wechsel zum Dashboard
+        abgeschlossen werden; ``dashboard_veraltet`` greift nicht auf die Datenbank zu.
+        """
+        if (
+            self._dashboard is not None
+            and self.current_frame is self._dashboard
+            and self.controller.dashboard_veraltet(self._dashboard.data["version"])
+        ):
+            self.show_dashboard()
+        self.after(DASHBOARD_PRUEFUNG_MS, self._pruefe_dashboard)
+
     def show_login(self) -> None:
         """
         Blendet aktuellen Inhalt aus und zeigt den Login-Frame an.
@@ -4611,10 +5023,8 @@ class App(ctk.CTk):
         oder zum 'NewUserFrame'-Frame wechseln kann.
         """
 
-        if self.current_frame:
-            self.current_frame.pack_forget()
-            self.current_frame.destroy()
-            self.update_idletasks()
+        self._blende_aktuellen_frame_aus()
+        self._verwerfe_dashboard()
         self.current_frame = LoginFrame(
             self,
             controller=self.controller,
@@ -4634,10 +5044,7 @@ class App(ctk.CTk):
         Der 'NewUserFrame'-Frame erhält Callback-Funktionen, mit denen er zum Login-Frame zurück
         oder zum 'StudiengangAuswahlFrame'-Frame wechseln kann.
         """
-        if self.current_frame:
-            self.current_frame.pack_forget()
-            self.current_frame.destroy()
-            self.update_idletasks()
+        self._blende_aktuellen_frame_aus()
         self.current_frame = NewUserFrame(
             self,
             controller=self.controller,
@@ -4659,10 +5066,7 @@ class App(ctk.CTk):
         """
         self.cache = cache
         self.hochschule_id = self.cache["hochschulid"]
-        if self.current_frame:
-            self.current_frame.pack_forget()
-            self.current_frame.destroy()
-            self.update_idletasks()
+        self._blende_aktuellen_frame_aus()
         self.current_frame = StudiengangAuswahlFrame(
             self,
             controller=self.controller,
@@ -4677,15 +5081,21 @@ class App(ctk.CTk):
 
         Dieser Frame ist das zentrale Fenster der Anwendung.
         Falls ein Frame aktiv ist, wird er entfernt und zerstört.
-        Anschließend wird ein neuer 'DashboardFrame' erzeugt und als aktuelles UI-Element angezeigt.
+        Ist das zuletzt angezeigte Dashboard nicht veraltet (``Controller.dashboard_veraltet``),
+        wird es ohne Datenbankzugriff wieder angezeigt, sonst wird ein neuer 'DashboardFrame'
+        erzeugt und als aktuelles UI-Element angezeigt.
 
         Der 'DashboardFrame'-Frame erhält Callback-Funktionen, mit denen er zu allen Frames, außer denen zur User-Registrierung, wechseln kann.
         """
-        if self.current_frame:
-            self.current_frame.pack_forget()
-            self.current_frame.destroy()
-            self.update_idletasks()
-        self.current_frame = DashboardFrame(
+        self._blende_aktuellen_frame_aus()
+        if self._dashboard is not None and not self.controller.dashboard_veraltet(
+            self._dashboard.data["version"]
+        ):
+            self.current_frame = self._dashboard
+            self.current_frame.pack(fill="both", expand=True)
+            return
+        self._verwerfe_dashboard()
+        self.current_frame = self._dashboard = DashboardFrame(
             self,
             controller=self.controller,
             go_to_login=self.show_login,
@@ -4709,10 +5119,7 @@ class App(ctk.CTk):
         Der 'AddEnrollmentFrame'-Frame erhält Callback-Funktionen, mit denen er zum Dashboard zurück
         oder zum 'EnrollmentFrame' wechseln kann.
         """
-        if self.current_frame:
-            self.current_frame.pack_forget()
-            self.current_frame.destroy()
-            self.update_idletasks()
+        self._blende_aktuellen_frame_aus()
         self.current_frame = AddEnrollmentFrame(
             self,
             controller=self.controller,
@@ -4732,10 +5139,7 @@ class App(ctk.CTk):
         Der 'EnrollmentFrame'-Frame erhält Callback-Funktionen, mit denen er zum Dashboard zurück
         oder zum 'PLAddFrame' wechseln kann.
         """
-        if self.current_frame:
-            self.current_frame.pack_forget()
-            self.current_frame.destroy()
-            self.update_idletasks()
+        self._blende_aktuellen_frame_aus()
         self.current_frame = EnrollmentFrame(
             self,
             controller=self.controller,
@@ -4755,10 +5159,7 @@ class App(ctk.CTk):
 
         Der 'PLAddFrame'-Frame erhält eine Callback-Funktion, mit der er zum Enrollment zurück wechseln kann.
         """
-        if self.current_frame:
-            self.current_frame.pack_forget()
-            self.current_frame.destroy()
-            self.update_idletasks()
+        self._blende_aktuellen_frame_aus()
         self.current_frame = PLAddFrame(
             self,
             controller=self.controller,
@@ -4779,10 +5180,7 @@ class App(ctk.CTk):
         Der 'SettingsFrame'-Frame erhält Callback-Funktionen, mit denen er sich selbst neu laden, zum Dashboard zurück
         oder zum 'LoginFrame' wechseln kann.
         """
-        if self.current_frame:
-            self.current_frame.pack_forget()
-            self.current_frame.destroy()
-            self.update_idletasks()
+        self._blende_aktuellen_frame_aus()
         self.current_frame = SettingsFrame(
             self,
             controller=self.controller,
@@ -4802,10 +5200,7 @@ class App(ctk.CTk):
 
         Der 'ExFrame'-Frame erhält eine Callback-Funktion, mit der er zum Dashboard zurück wechseln kann.
         """
-        if self.current_frame:
-            self.current_frame.pack_forget()
-            self.current_frame.destroy()
-            self.update_idletasks()
+        self._blende_aktuellen_frame_aus()
         self.current_frame = ExFrame(
             self,
             controller=self.controller,
@@ -4823,10 +5218,7 @@ class App(ctk.CTk):
 
         Der 'ZieleFrame'-Frame erhält eine Callback-Funktion, mit der er zum Dashboard zurück wechseln kann.
         """
-        if self.current_frame:
-            self.current_frame.pack_forget()
-            self.current_frame.destroy()
-            self.update_idletasks()
+        self._blende_aktuellen_frame_aus()
         self.current_frame = ZieleFrame(
             self,
             controller=self.controller,
@@ -4843,10 +5235,7 @@ class App(ctk.CTk):
 
         Der 'UeberFrame'-Frame erhält eine Callback-Funktion, mit der er zum Dashboard zurück wechseln kann.
         """
-        if self.current_frame:
-            self.current_frame.pack_forget()
-            self.current_frame.destroy()
-            self.update_idletasks()
+        self._blende_aktuellen_frame_aus()
         self.current_frame = UeberFrame(
             self, controller=self.controller, go_to_dashboard=self.show_dashboard
         )
@@ -4860,5 +5249,11 @@ if __name__ == "__main__":
         debug=args.debug,
         log_to_console=args.log_to_console,
         follow_system_mode=args.follow_system_mode,
+        db_profile=args.db_profile,
+        sql_stats=args.sql_stats,
+        shards=args.shards,
+        shard_router=args.shard_router,
+        snapshots=args.snapshots,
+        db_url=args.db_url,
     )
     app.mainloop()
@@ -0,0 +1,123 @@
+"""Asynchrone Fassade über die Lesepfade des Controllers.
+
+Für einen lokalen API-Server oder eine asyncio-integrierte UI. ``login``,
+``load_dashboard_data`` und ``get_enrollment_data`` blockieren den Event-Loop nicht:
+Datenbankzugriffe laufen über ``AsyncDatabaseManager`` (aiosqlite), die Passwortprüfung
+(Argon2) in einem Worker-Thread.
+"""
+
+from __future__ import annotations
+from email_validator import validate_email, EmailNotValidError
+from sqlalchemy.orm import Session
+from src.async_database import AsyncDatabaseManager
+from src.database import DatabaseManager
+from src.main import Controller
+from src.models import Student
+
+import asyncio
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncController:
+    """Asynchrone Fassade über die Lesepfade des ``Controller``.
+
+    Die Dictionaries werden von der synchronen Controller-Logik erzeugt. Diese läuft
+    innerhalb von ``AsyncSession.run_sync`` auf der ``sync_session`` einer kurzlebigen
+    AsyncSession, Lazy Loading wird dort asynchron über aiosqlite ausgeführt.
+    Jeder Aufruf nutzt eine eigene Session, parallele Aufrufe sind voneinander isoliert.
+
+    Attribute:
+        db: AsyncDatabaseManager-Instanz.
+        student_id: ID des eingeloggten Studenten oder ``None``.
+    """
+
+    def __init__(self, db: AsyncDatabaseManager, offline: bool = False):
+        """Initialisiert die Fassade.
+
+        Args:
+            db: AsyncDatabaseManager-Instanz (Schema bereits initialisiert).
+            offline: Wird an den synchronen Controller weitergegeben.
+        """
+        self.db = db
+        self.offline = offline
+        self.student_id: int | None = None
+
+    async def login(self, email: str, password: str) -> bool:
+        """Authentifiziert einen Nutzer und merkt sich bei Erfolg die Student-ID.
+
+        Args:
+            email (str): Email-Adresse.
+            password (str): Passwort im Klartext.
+
+        Returns:
+            bool: True bei erfolgreichem Login, sonst False.
+        """
+        try:
+            verified_email = validate_email(
+                email, check_deliverability=False
+            ).normalized
+        except EmailNotValidError as e:
+            logger.debug("EmailNotValidError: %s", e)
+            return False
+        student = await self.db.lade_student(verified_email)
+        if student and await asyncio.to_thread(student.verify_password, password):
+            self.student_id = student.id
+            logger.info("Login erfolgreich: %s", student.email)
+            return True
+        logger.info("Login fehlgeschlagen: %s", verified_email)
+        return False
+
+    def logout(self) -> None:
+        """Meldet den Nutzer ab."""
+        self.student_id = None
+
+    async def load_dashboard_data(self) -> dict:
+        """Asynchrone Variante von ``Controller.load_dashboard_data``.
+
+        Raises: RuntimeError: Wenn kein Student eingeloggt ist.
+        """
+        return await self._lese("load_dashboard_data")
+
+    async def get_enrollment_data(self, enrollment_id: int) -> dict:
+        """Asynchrone Variante von ``Controller.get_enrollment_data``.
+
+        Raises: RuntimeError: Wenn kein Student eingeloggt ist.
+        """
+        return await self._lese("get_enrollment_data", enrollment_id)
+
+    async def _lese(self, methode: str, *args: Any) -> Any:
+        """Führt eine Controller-Methode in einer eigenen AsyncSession aus.
+
+        Statusänderungen, die der Controller beim Lesen vornimmt (``aktualisiere_status``),
+        werden anschließend committet.
+
+        Args:
+            methode: Name der Controller-Methode.
+            *args: Argumente der Methode.
+
+        Returns:
+            Rückgabewert der Controller-Methode.
+
+        Raises:
+            RuntimeError: Wenn kein Student eingeloggt ist.
+        """
+        if self.student_id is None:
+            logger.warning("Nicht eingeloggt: %s aufgerufen.", methode)
+            raise RuntimeError("Nicht eingeloggt")
+        async with self.db.session_scope() as session:
+            ergebnis = await session.run_sync(self._fuehre_aus, methode, args)
+            await self.db.commit_or_rollback(session, action=methode)
+        return ergebnis
+
+    def _fuehre_aus(self, session: Session, methode: str, args: tuple) -> Any:
+        """Synchroner Teil von ``_lese``, läuft innerhalb von ``run_sync``."""
+        controller = Controller(
+            db=DatabaseManager.fuer_session(session), seed=False, offline=self.offline
+        )
+        controller.student = session.get(Student, self.student_id)
+        if controller.student is None:
+            raise RuntimeError("Nicht eingeloggt")
+        return getattr(controller, methode)(*args)
@@ -0,0 +1,414 @@
+"""Asynchrone Variante des DatabaseManager auf Basis von ``sqlalchemy.ext.asyncio``.
+
+Die Datenbankzugriffe laufen über ``aiosqlite`` und blockieren den Event-Loop nicht.
+Schema-Initialisierung, Migrationen und Engine-Profile werden aus ``src.database``
+übernommen, die ``add_*``/``lade_*``-Methoden spiegeln die API des ``DatabaseManager``.
+"""
+
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import selectinload
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm.exc import StaleDataError
+from src.database import (
+    DB_PATH,
+    ENGINE_PROFILE,
+    DBKonfliktError,
+    DBTransactionError,
+    initialisiere_ohne_fremdschluessel,
+    registriere_pragmas,
+)
+from src.models import (
+    Base,
+    EnrollmentStatus,
+    Student,
+    Hochschule,
+    Studiengang,
+    Modul,
+    Kurs,
+    Enrollment,
+    Pruefungsleistung,
+    Semester,
+    Metadaten,
+    normalisiere_name,
+)
+
+from contextlib import asynccontextmanager
+import datetime
+import logging
+from typing import AsyncIterator, Sequence
+
+ASYNC_DB_URL = f"sqlite+aiosqlite:///{DB_PATH}"
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncDatabaseManager:
+    """Asynchrones Gegenstück zum ``DatabaseManager``.
+
+    Jeder Zugriff nutzt eine eigene, kurzlebige ``AsyncSession``. Zurückgegebene Objekte
+    sind detached, ihre Attribute bleiben durch ``expire_on_commit=False`` lesbar.
+    Beziehungen werden nicht nachgeladen (kein Lazy Loading in asyncio), sie müssen
+    über ``lade_student_mit_beziehungen`` oder ``AsyncSession.run_sync`` geladen werden.
+
+    Hinweis:
+        Das Schema wird in ``initialisiere`` (oder über ``erstelle``) angelegt bzw. migriert,
+        da ``__init__`` nicht asynchron sein kann.
+    """
+
+    def __init__(self, profil: str = "durable", url: str = ASYNC_DB_URL) -> None:
+        """Erstellt AsyncEngine und Session-Factory.
+
+        Args:
+            profil: Engine-Profil aus ``ENGINE_PROFILE`` ("durable", "fast" oder "readonly").
+            url: Async-Datenbank-URL, default: ``ASYNC_DB_URL``.
+
+        Raises:
+            ValueError: Wenn das Profil unbekannt ist.
+        """
+        if profil not in ENGINE_PROFILE:
+            raise ValueError(f"Unbekanntes Engine-Profil: {profil}")
+        self.profil = profil
+        self.engine: AsyncEngine = create_async_engine(url, echo=False)
+        registriere_pragmas(self.engine.sync_engine, profil)
+        logger.info(
+            "Async-Datenbank-Engine erstellt: %s (Profil: %s)", self.engine.url, profil
+        )
+        self.SessionLocal = async_sessionmaker(bind=self.engine, expire_on_commit=False)
+
+    @classmethod
+    async def erstelle(
+        cls, profil: str = "durable", url: str = ASYNC_DB_URL
+    ) -> "AsyncDatabaseManager":
+        """Erstellt einen AsyncDatabaseManager und initialisiert das Schema.
+
+        Args:
+            profil: Engine-Profil aus ``ENGINE_PROFILE``.
+            url: Async-Datenbank-URL, default: ``ASYNC_DB_URL``.
+
+        Returns:
+            Einsatzbereiter AsyncDatabaseManager.
+        """
+        manager = cls(profil=profil, url=url)
+        await manager.initialisiere()
+        return manager
+
+    async def initialisiere(self) -> None:
+        """Erstellt Tabellen bzw. migriert ein bestehendes Schema (außer bei ``readonly``).
+
+        Raises:
+            RuntimeError: Wenn das Schema nicht initialisiert werden kann.
+        """
+        if self.profil == "readonly":
+            logger.info("Profil readonly: Schema-Initialisierung wird übersprungen.")
+            return
+        try:
+            async with self.engine.connect() as connection:
+                version = await connection.run_sync(initialisiere_ohne_fremdschluessel)
+        except Exception:
+            logger.critical("Datenbank-Initialisierung fehlgeschlagen.", exc_info=True)
+            raise RuntimeError("Datenbank-Initialisierung fehlgeschlagen.")
+        logger.info("Tabellen vorhanden oder erstellt, Schema-Version %s.", version)
+
+    async def dispose(self) -> None:
+        """Schließt alle Verbindungen der Engine."""
+        await self.engine.dispose()
+
+    @asynccontextmanager
+    async def session_scope(self) -> AsyncIterator[AsyncSession]:
+        """Stellt eine kurzlebige ``AsyncSession`` bereit und schließt sie danach.
+
+        Yields:
+            AsyncSession: Session für die Dauer des ``async with``-Blocks.
+        """
+        async with self.SessionLocal() as session:
+            yield session
+
+    async def commit_or_rollback(
+        self, session: AsyncSession, action: str | None = None
+    ) -> None:
+        """Committet die Session; bei Fehlern Rollback und ``DBTransactionError``.
+
+        Args:
+            session: AsyncSession, deren Änderungen persistiert werden.
+            action: Name der Aktion (für Logging).
+
+        Raises:
+            DBKonfliktError: Wenn ein anderer Prozess die Zeilen zwischenzeitlich geändert hat.
+            DBTransactionError: Bei IntegrityError oder sonstigem SQLAlchemyError.
+        """
+        try:
+            await session.commit()
+            logger.debug("Commit erfolgreich: %s", action)
+        except StaleDataError as e:
+            await session.rollback()
+            logger.warning("Konflikt bei %s - Rollback ausgeführt.", action)
+            raise DBKonfliktError() from e
+        except IntegrityError as e:
+            await session.rollback()
+            logger.exception("IntegrityError bei %s - Rollback ausgeführt.", action)
+            raise DBTransactionError(
+                "Transaktion wurde zurückgerollt. Integritätsfehler."
+            ) from e
+        except SQLAlchemyError as e:
+            await session.rollback()
+            logger.exception("SQLAlchemyError bei %s - Rollback ausgeführt.", action)
+            raise DBTransactionError(
+                "Transaktion wurde zurückgerollt. Technischer DB-Fehler."
+            ) from e
+
+    async def _speichere(self, objekt: Base, action: str) -> None:
+        """Fügt ein Objekt in einer eigenen Session hinzu und committet.
+
+        Args:
+            objekt: Neues oder detached ORM-Objekt.
+            action: Name der Aktion (für Logging).
+
+        Raises:
+            DBTransactionError: Wenn Commit/Rollback fehlschlägt.
+        """
+        async with self.session_scope() as session:
+            session.add(objekt)
+            await self.commit_or_rollback(session, action=action)
+
+    async def _lade_erstes(self, stmt) -> Base | None:
+        """Führt ein Select in einer eigenen Session aus und gibt das erste Objekt zurück."""
+        async with self.session_scope() as session:
+            return (await session.scalars(stmt)).first()
+
+    async def _lade_alle(self, stmt) -> Sequence[Base]:
+        """Führt ein Select in einer eigenen Session aus und gibt alle Objekte zurück."""
+        async with self.session_scope() as session:
+            return (await session.scalars(stmt)).all()
+
+    async def add_student(
+        self,
+        name: str,
+        matrikelnummer: str,
+        email: str,
+        password: str,
+        semester_anzahl: int,
+        modul_anzahl: int,
+        start_datum: datetime.date,
+        ziel_datum: datetime.date,
+        ziel_note: float,
+    ) -> Student:
+        """Legt einen Student in der Datenbank an (siehe ``DatabaseManager.add_student``).
+
+        Raises:
+            DBTransactionError: Wenn Commit/Rollback fehlschlägt (z. B. Unique-Verletzung bei E-Mail).
+        """
+        student = Student(
+            name=name,
+            matrikelnummer=matrikelnummer,
+            email=email,
+            password=password,
+            semester_anzahl=semester_anzahl,
+            modul_anzahl=modul_anzahl,
+            start_datum=start_datum,
+            ziel_datum=ziel_datum,
+            ziel_note=ziel_note,
+        )
+        await self._speichere(student, action="add_student")
+        return student
+
+    async def add_enrollment(
+        self,
+        student: Student,
+        modul: Modul,
+        status: EnrollmentStatus,
+        einschreibe_datum: datetime.date,
+        anzahl_pruefungsleistungen: int,
+    ) -> Enrollment:
+        """Legt ein Enrollment in der Datenbank an (siehe ``DatabaseManager.add_enrollment``).
+
+        Die Kennzahlen des Studenten werden als unbekannt (``NULL``) markiert.
+
+        Raises:
+            DBTransactionError: Wenn Commit/Rollback fehlschlägt.
+        """
+        enrollment = Enrollment(
+            student_id=student.id,
+            modul_id=modul.id,
+            status=status,
+            einschreibe_datum=einschreibe_datum,
+            anzahl_pruefungsleistungen=anzahl_pruefungsleistungen,
+        )
+        async with self.session_scope() as session:
+            session.add(enrollment)
+            # Kennzahlen des Studenten werden hier nicht inkrementell gepflegt,
+            # NULL: Neuberechnung beim nächsten Lesen.
+            await session.execute(
+                update(Student)
+                .where(Student.id == student.id)
+                .values(dict.fromkeys(Student.KENNZAHL_SPALTEN))
+            )
+            await self.commit_or_rollback(session, action="add_enrollment")
+        return enrollment
+
+    async def add_pruefungsleistung(
+        self,
+        teilpruefung: int,
+        teilpruefung_gewicht: float,
+        versuch: int,
+        note: float | None,
+        datum: datetime.date | None,
+    ) -> Pruefungsleistung:
+        """Legt eine Prüfungsleistung in der Datenbank an (siehe ``DatabaseManager.add_pruefungsleistung``).
+
+        Raises:
+            DBTransactionError: Wenn Commit/Rollback fehlschlägt.
+        """
+        pruefungsleistung = Pruefungsleistung(
+            teilpruefung=teilpruefung,
+            teilpruefung_gewicht=teilpruefung_gewicht,
+            versuch=versuch,
+            note=note,
+            datum=datum,
+        )
+        await self._speichere(pruefungsleistung, action="add_pruefungsleistung")
+        return pruefungsleistung
+
+    async def add_kurs(self, name: str, nummer: str) -> Kurs:
+        """Legt einen Kurs in der Datenbank an.
+
+        Raises:
+            DBTransactionError: Wenn Commit/Rollback fehlschlägt.
+        """
+        kurs = Kurs(name=name, nummer=nummer)
+        await self._speichere(kurs, action="add_kurs")
+        return kurs
+
+    async def add_modul(
+        self,
+        name: str,
+        modulcode: str,
+        ects_punkte: int,
+        studiengang_id: int,
+    ) -> Modul:
+        """Legt ein Modul in der Datenbank an.
+
+        Raises:
+            DBTransactionError: Wenn Commit/Rollback fehlschlägt.
+        """
+        modul = Modul(
+            name=name,
+            modulcode=modulcode,
+            ects_punkte=ects_punkte,
+            studiengang_id=studiengang_id,
+        )
+        await self._speichere(modul, action="add_modul")
+        return modul
+
+    async def add_semester(
+        self, student: Student, nummer: int, beginn: datetime.date, ende: datetime.date
+    ) -> Semester:
+        """Legt ein Semester in der Datenbank an.
+
+        Raises:
+            DBTransactionError: Wenn Commit/Rollback fehlschlägt.
+        """
+        semester = Semester(
+            nummer=nummer, beginn=beginn, ende=ende, student_id=student.id
+        )
+        await self._speichere(semester, action="add_semester")
+        return semester
+
+    async def add_studiengang(self, name: str, gesamt_ects_punkte: int) -> Studiengang:
+        """Legt einen Studiengang in der Datenbank an.
+
+        Raises:
+            DBTransactionError: Wenn Commit/Rollback fehlschlägt.
+        """
+        studiengang = Studiengang(name=name, gesamt_ects_punkte=gesamt_ects_punkte)
+        await self._speichere(studiengang, action="add_studiengang")
+        return studiengang
+
+    async def add_hochschule(self, name: str) -> Hochschule:
+        """Legt eine Hochschule in der Datenbank an.
+
+        Raises:
+            DBTransactionError: Wenn Commit/Rollback fehlschlägt.
+        """
+        hochschule = Hochschule(name=name)
+        await self._speichere(hochschule, action="add_hochschule")
+        return hochschule
+
+    async def lade_student(self, email: str) -> Student | None:
+        """Lädt einen Student anhand der E-Mail."""
+        return await self._lade_erstes(select(Student).where(Student.email == email))
+
+    async def lade_student_mit_id(self, student_id: int) -> Student | None:
+        """Lädt einen Student anhand seiner ID."""
+        async with self.session_scope() as session:
+            return await session.get(Student, student_id)
+
+    async def lade_student_mit_beziehungen(self, email: str) -> Student | None:
+        """Lädt einen Student anhand der E-Mail inkl. häufiger Beziehungen (``selectinload``)."""
+        stmt = (
+            select(Student)
+            .options(
+                selectinload(Student.hochschule),
+                selectinload(Student.studiengang),
+                selectinload(Student.enrollments),
+                selectinload(Student.semester),
+            )
+            .where(Student.email == email)
+        )
+        return await self._lade_erstes(stmt)
+
+    async def lade_kurs(self, kursnummer: str) -> Kurs | None:
+        """Lädt einen Kurs anhand der Kursnummer."""
+        return await self._lade_erstes(select(Kurs).where(Kurs.nummer == kursnummer))
+
+    async def lade_modul(self, modulcode: str) -> Modul | None:
+        """Lädt ein Modul anhand des Modulcodes."""
+        return await self._lade_erstes(
+            select(Modul).where(Modul.modulcode == modulcode)
+        )
+
+    async def lade_studiengang_mit_id(self, studiengang_id: int) -> Studiengang | None:
+        """Lädt einen Studiengang anhand seiner ID."""
+        return await self._lade_erstes(
+            select(Studiengang).where(Studiengang.id == studiengang_id)
+        )
+
+    async def lade_studiengang_mit_name(
+        self, hochschule_id: int, studiengang_name: str
+    ) -> Studiengang | None:
+        """Lädt einen Studiengang einer Hochschule anhand des normalisierten Namens (``name_key``)."""
+        stmt = (
+            select(Studiengang)
+            .where(Studiengang.hochschule_id == hochschule_id)
+            .where(Studiengang.name_key == normalisiere_name(studiengang_name))
+        )
+        return await self._lade_erstes(stmt)
+
+    async def lade_alle_studiengaenge_von_hochschule(
+        self, hochschule: Hochschule
+    ) -> Sequence[Studiengang]:
+        """Lädt alle Studiengänge, die einer Hochschule zugeordnet sind."""
+        return await self._lade_alle(
+            select(Studiengang).where(Studiengang.hochschule_id == hochschule.id)
+        )
+
+    async def lade_hochschule_mit_id(self, hochschule_id: int) -> Hochschule | None:
+        """Lädt eine Hochschule anhand ihrer ID."""
+        return await self._lade_erstes(
+            select(Hochschule).where(Hochschule.id == hochschule_id)
+        )
+
+    async def lade_alle_hochschulen(self) -> Sequence[Hochschule]:
+        """Lädt alle Hochschulen, die in der Datenbank sind."""
+        return await self._lade_alle(select(Hochschule))
+
+    async def lade_metadaten(self, schluessel: str) -> str | None:
+        """Lädt einen Wert aus der Metadaten-Tabelle."""
+        async with self.session_scope() as session:
+            eintrag = await session.get(Metadaten, schluessel)
+            return eintrag.wert if eintrag else None
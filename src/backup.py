@@ -0,0 +1,97 @@
+"""Online-Backups und Snapshots der SQLite-Datenbank.
+
+Backups laufen über die Backup-API von SQLite (``sqlite3.Connection.backup``) in Schritten
+von ``seiten_pro_schritt`` Seiten, zwischen den Schritten ist die Datenbank für andere
+Verbindungen frei. Snapshots werden mit ``VACUUM INTO`` als kompakte Kopie erstellt und
+rotiert. Beides läuft in einem Hintergrund-Thread, die Aufrufer erhalten ein ``Future``.
+Bei mehreren Dateien (Sharding) ist ein Backup oder Snapshot ein Verzeichnis.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+import logging
+import shutil
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+BACKUP_PFAD = Path(__file__).resolve().parent.parent / "data" / "backups"
+
+# Ein Worker: Backups und Snapshots laufen nacheinander.
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+class BackupErgebnis:
+    """Ergebnis eines Backups oder Snapshots.
+
+    Attribute:
+        ziel (Path): Erstellte Datei (oder Verzeichnis bei mehreren Dateien).
+        dauer (float): Laufzeit in Sekunden.
+        seiten (int): Anzahl kopierter Seiten (nur Backup, sonst 0).
+        schritte (int): Anzahl der Backup-Schritte (nur Backup, sonst 0).
+        groesse (int): Dateigröße in Bytes (bei einem Verzeichnis die Summe der Dateien).
+        entfernt (list[Path]): Durch Rotation gelöschte Snapshots.
+    """
+
+    def __init__(
+        self, ziel: Path, dauer: float, seiten: int = 0, schritte: int = 0
+    ) -> None:
+        self.ziel = ziel
+        self.dauer = dauer
+        self.seiten = seiten
+        self.schritte = schritte
+        if ziel.is_dir():
+            self.groesse = sum(pfad.stat().st_size for pfad in ziel.glob("*.db"))
+        else:
+            self.groesse = ziel.stat().st_size
+        self.entfernt: list[Path] = []
+
+    def __repr__(self) -> str:
+        return (
+            f"BackupErgebnis(ziel={self.ziel}, dauer_ms={self.dauer * 1000:.1f}, "
+            f"seiten={self.seiten}, schritte={self.schritte}, groesse={self.groesse})"
+        )
+
+
+def im_hintergrund(funktion, *args, **kwargs) -> Future:
+    """Führt ``funktion`` im Backup-Thread aus.
+
+    Returns:
+        Future mit dem Rückgabewert von ``funktion``.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="db-backup"
+            )
+    return _executor.submit(funktion, *args, **kwargs)
+
+
+def rotiere_snapshots(verzeichnis: Path, muster: str, behalte: int) -> list[Path]:
+    """Löscht die ältesten Snapshots, sodass höchstens ``behalte`` übrig bleiben.
+
+    Die Dateinamen enthalten einen Zeitstempel, die Reihenfolge der Namen entspricht
+    damit der zeitlichen Reihenfolge.
+
+    Args:
+        verzeichnis: Verzeichnis der Snapshots.
+        muster: Glob-Muster der Snapshots, z. B. ``"data-*.db"``, Verzeichnisse werden
+            samt Inhalt gelöscht.
+        behalte: Anzahl der Snapshots, die erhalten bleiben.
+
+    Returns:
+        list[Path]: Gelöschte Dateien bzw. Verzeichnisse.
+    """
+    snapshots = sorted(verzeichnis.glob(muster))
+    entfernt = snapshots[: max(len(snapshots) - behalte, 0)]
+    for pfad in entfernt:
+        if pfad.is_dir():
+            shutil.rmtree(pfad)
+        else:
+            pfad.unlink()
+        logger.debug("Snapshot rotiert: %s", pfad)
+    return entfernt
@@ -0,0 +1,184 @@
+"""SQL-Instrumentierung pro Controller-Operation.
+
+Über die Engine-Events ``before_cursor_execute``/``after_cursor_execute`` werden Anzahl der
+Statements, betroffene Zeilen und SQL-Zeit gemessen und der gerade laufenden Operation
+(``login``, ``load_dashboard_data``, ``change_pl``, ...) des aktuellen Threads zugeordnet.
+Zusätzlich wird gezählt, wie viele ORM-Objekte aus der Datenbank geladen wurden.
+"""
+
+from __future__ import annotations
+from sqlalchemy import Engine, event
+from sqlalchemy.orm import sessionmaker
+
+from contextlib import contextmanager
+import logging
+import threading
+import time
+from typing import Iterator
+
+logger = logging.getLogger(__name__)
+
+
+class OperationStatistik:
+    """Aufsummierte Messwerte einer Operation.
+
+    Attribute:
+        aufrufe (int): Anzahl der gemessenen Aufrufe.
+        statements (int): Anzahl ausgeführter SQL-Statements.
+        zeilen (int): Von INSERT/UPDATE/DELETE betroffene Zeilen.
+        geladene_objekte (int): Aus Ergebniszeilen erzeugte ORM-Objekte.
+        sql_zeit (float): Zeit in der Datenbank (Sekunden).
+        gesamt_zeit (float): Wall-Time der Operation (Sekunden).
+    """
+
+    def __init__(self) -> None:
+        self.aufrufe = 0
+        self.statements = 0
+        self.zeilen = 0
+        self.geladene_objekte = 0
+        self.sql_zeit = 0.0
+        self.gesamt_zeit = 0.0
+
+    def addiere(self, andere: OperationStatistik) -> None:
+        """Addiert die Messwerte einer anderen Statistik."""
+        self.aufrufe += andere.aufrufe
+        self.statements += andere.statements
+        self.zeilen += andere.zeilen
+        self.geladene_objekte += andere.geladene_objekte
+        self.sql_zeit += andere.sql_zeit
+        self.gesamt_zeit += andere.gesamt_zeit
+
+    def als_dict(self) -> dict:
+        """Gibt die Messwerte als Dictionary zurück (Zeiten in Millisekunden)."""
+        return {
+            "aufrufe": self.aufrufe,
+            "statements": self.statements,
+            "zeilen": self.zeilen,
+            "geladene_objekte": self.geladene_objekte,
+            "sql_ms": round(self.sql_zeit * 1000, 3),
+            "gesamt_ms": round(self.gesamt_zeit * 1000, 3),
+        }
+
+    def __repr__(self) -> str:
+        return f"OperationStatistik({self.als_dict()})"
+
+
+class SQLInstrumentierung:
+    """Ordnet SQL-Statements der laufenden Operation des aktuellen Threads zu.
+
+    Statements außerhalb einer Operation werden unter ``"(ohne Operation)"`` gezählt.
+    Verschachtelte Operationen werden der äußersten zugerechnet.
+
+    Attribute:
+        log_operationen (bool): Wenn True, wird am Ende jeder Operation eine Zeile geloggt.
+    """
+
+    OHNE_OPERATION = "(ohne Operation)"
+
+    def __init__(self, log_operationen: bool = False) -> None:
+        """Initialisiert eine leere Statistik.
+
+        Args:
+            log_operationen (bool): Messwerte am Ende jeder Operation loggen (INFO).
+        """
+        self.log_operationen = log_operationen
+        self._statistik: dict[str, OperationStatistik] = {}
+        self._lock = threading.Lock()
+        self._lokal = threading.local()
+
+    def registriere(
+        self, engine: Engine, session_factory: sessionmaker | None = None
+    ) -> None:
+        """Registriert die Event-Listener an Engine (und optional an der Session-Factory).
+
+        Args:
+            engine: Synchrone Engine des DatabaseManager.
+            session_factory: Session-Factory, deren geladene Objekte gezählt werden.
+        """
+        event.listen(engine, "before_cursor_execute", self._vor_statement)
+        event.listen(engine, "after_cursor_execute", self._nach_statement)
+        if session_factory is not None:
+            event.listen(session_factory, "loaded_as_persistent", self._objekt_geladen)
+
+    def entferne(self, engine: Engine) -> None:
+        """Entfernt die Event-Listener von der Engine."""
+        event.remove(engine, "before_cursor_execute", self._vor_statement)
+        event.remove(engine, "after_cursor_execute", self._nach_statement)
+
+    @contextmanager
+    def operation(self, name: str) -> Iterator[OperationStatistik]:
+        """Misst alle Statements im ``with``-Block als Operation ``name``.
+
+        Args:
+            name: Name der Operation.
+
+        Yields:
+            OperationStatistik: Messwerte dieses Aufrufs (nach dem Block vollständig).
+        """
+        aktuell = getattr(self._lokal, "aktuell", None)
+        if aktuell is not None:
+            # verschachtelte Operation: zählt zur äußeren
+            yield aktuell
+            return
+        messung = OperationStatistik()
+        messung.aufrufe = 1
+        self._lokal.aktuell = messung
+        start = time.perf_counter()
+        try:
+            yield messung
+        finally:
+            messung.gesamt_zeit = time.perf_counter() - start
+            self._lokal.aktuell = None
+            self._buche(name, messung)
+            if self.log_operationen:
+                logger.info(
+                    "SQL-Statistik %s: %s Statements, %s Zeilen, %s Objekte, "
+                    "%.2f ms SQL / %.2f ms gesamt",
+                    name,
+                    messung.statements,
+                    messung.zeilen,
+                    messung.geladene_objekte,
+                    messung.sql_zeit * 1000,
+                    messung.gesamt_zeit * 1000,
+                )
+
+    def statistik(self) -> dict[str, OperationStatistik]:
+        """Gibt eine Kopie der aufsummierten Messwerte pro Operation zurück."""
+        with self._lock:
+            kopie = {}
+            for name, werte in self._statistik.items():
+                kopie[name] = OperationStatistik()
+                kopie[name].addiere(werte)
+            return kopie
+
+    def zuruecksetzen(self) -> None:
+        """Verwirft alle bisherigen Messwerte."""
+        with self._lock:
+            self._statistik.clear()
+
+    def _buche(self, name: str, messung: OperationStatistik) -> None:
+        with self._lock:
+            self._statistik.setdefault(name, OperationStatistik()).addiere(messung)
+
+    def _vor_statement(
+        self, conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        conn.info.setdefault("instrumentierung_start", []).append(time.perf_counter())
+
+    def _nach_statement(
+        self, conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        dauer = time.perf_counter() - conn.info["instrumentierung_start"].pop()
+        aktuell = getattr(self._lokal, "aktuell", None)
+        messung = aktuell if aktuell is not None else OperationStatistik()
+        messung.statements += 1
+        messung.sql_zeit += dauer
+        if cursor.rowcount > 0:
+            messung.zeilen += cursor.rowcount
+        if aktuell is None:
+            self._buche(self.OHNE_OPERATION, messung)
+
+    def _objekt_geladen(self, session, instance) -> None:
+        aktuell = getattr(self._lokal, "aktuell", None)
+        if aktuell is not None:
+            aktuell.geladene_objekte += 1
@@ -0,0 +1,126 @@
+"""Volltextsuche über den Modul- und Kurskatalog (SQLite FTS5).
+
+Die FTS5-Tabellen ``modul_suche`` und ``kurs_suche`` sind External-Content-Tabellen über
+``modul`` (Name, Modulcode) und ``kurs`` (Name, Kursnummer): Sie speichern nur den Index,
+die Inhalte bleiben in den Tabellen der Modelle. Trigger halten den Index bei INSERT,
+UPDATE und DELETE synchron, auch bei gebündelten Core-INSERTs (``_fuege_ein``).
+
+Eine Suche liefert Module, die über ihren Namen, ihren Code oder einen ihrer Kurse
+gefunden wurden, sortiert nach ``bm25`` (Treffer im Code vor Treffern im Namen, Treffer
+im Modul vor Treffern in einem Kurs).
+"""
+
+from __future__ import annotations
+from sqlalchemy import Connection, inspect, text
+from sqlalchemy.exc import OperationalError
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Tokenizer: Groß-/Kleinschreibung und Akzente ignorieren, Präfix-Indizes für 2 und 3
+# Zeichen beschleunigen die ersten Tastendrücke der Autovervollständigung.
+_OPTIONEN = "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'"
+
+# (FTS-Tabelle, Inhaltstabelle, indizierte Spalten)
+SUCH_TABELLEN: tuple[tuple[str, str, tuple[str, ...]], ...] = (
+    ("modul_suche", "modul", ("_name", "_modulcode")),
+    ("kurs_suche", "kurs", ("_name", "_nummer")),
+)
+
+# bm25-Gewichte je Spalte (Name, Code/Nummer); kleinerer Rang = besserer Treffer
+GEWICHTE = {"modul_suche": "5.0, 10.0", "kurs_suche": "1.0, 2.0"}
+
+# Anzahl der Treffer je FTS-Tabelle, die gerankt werden. ``bm25`` kostet pro Treffer; bei
+# sehr unspezifischen Eingaben (ein Buchstabe) werden nur die ersten Treffer gerankt,
+# damit die Antwortzeit der Autovervollständigung unabhängig von der Katalog-Größe bleibt.
+KANDIDATEN = 200
+
+SUCHE_SQL = text(
+    f"""
+    SELECT modul_id, MIN(rang) AS rang FROM (
+        SELECT * FROM (
+            SELECT rowid AS modul_id, bm25(modul_suche, {GEWICHTE["modul_suche"]}) AS rang
+            FROM modul_suche WHERE modul_suche MATCH :anfrage LIMIT {KANDIDATEN}
+        )
+        UNION ALL
+        SELECT kurs.modul_id, treffer.rang FROM (
+            SELECT rowid AS kurs_id, bm25(kurs_suche, {GEWICHTE["kurs_suche"]}) AS rang
+            FROM kurs_suche WHERE kurs_suche MATCH :anfrage LIMIT {KANDIDATEN}
+        ) AS treffer
+        JOIN kurs ON kurs.id = treffer.kurs_id
+        WHERE kurs.modul_id IS NOT NULL
+    )
+    GROUP BY modul_id ORDER BY rang, modul_id LIMIT :limit
+    """
+)
+
+
+def _ddl(fts: str, tabelle: str, spalten: tuple[str, ...]) -> list[str]:
+    """CREATE-Statements für FTS-Tabelle und Trigger einer Inhaltstabelle."""
+    liste = ", ".join(spalten)
+    neu = ", ".join(f"new.{spalte}" for spalte in spalten)
+    alt = ", ".join(f"old.{spalte}" for spalte in spalten)
+    loeschen = (
+        f"INSERT INTO {fts} ({fts}, rowid, {liste}) VALUES ('delete', old.id, {alt});"
+    )
+    einfuegen = f"INSERT INTO {fts} (rowid, {liste}) VALUES (new.id, {neu});"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({liste}, "
+        f"content = '{tabelle}', content_rowid = 'id', {_OPTIONEN})",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {tabelle} "
+        f"BEGIN {einfuegen} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {tabelle} "
+        f"BEGIN {loeschen} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {liste} ON {tabelle} "
+        f"BEGIN {loeschen} {einfuegen} END",
+    ]
+
+
+def erstelle_katalog_suche(connection: Connection) -> bool:
+    """Legt FTS-Tabellen und Trigger an und baut den Index aus den vorhandenen Zeilen auf.
+
+    Tabellen ohne ``modul``/``kurs`` (z. B. eine reduzierte Shard-Datei) werden übersprungen.
+    Ist SQLite ohne FTS5 übersetzt oder ist die Datenbank keine SQLite-Datenbank, wird
+    nichts angelegt; ``suche_module`` fällt dann auf ``LIKE`` zurück.
+
+    Args:
+        connection: Verbindung mit offener Transaktion.
+
+    Returns:
+        bool: ``True``, wenn die Volltextsuche verfügbar ist.
+    """
+    if connection.dialect.name != "sqlite":
+        return False
+    inspektor = inspect(connection)
+    if not all(inspektor.has_table(tabelle) for _, tabelle, _ in SUCH_TABELLEN):
+        return False
+    try:
+        for fts, tabelle, spalten in SUCH_TABELLEN:
+            for statement in _ddl(fts, tabelle, spalten):
+                connection.exec_driver_sql(statement)
+            connection.exec_driver_sql(f"INSERT INTO {fts} ({fts}) VALUES ('rebuild')")
+    except OperationalError as e:
+        logger.warning("Volltextsuche nicht verfügbar (FTS5): %s", e)
+        return False
+    return True
+
+
+def fts_anfrage(eingabe: str) -> str | None:
+    """Wandelt eine Benutzereingabe in eine FTS5-Präfixanfrage um.
+
+    Jedes Wort wird als Phrase mit Präfix gesucht (``"Dat"* "Sci"*``), alle Wörter
+    müssen vorkommen. Anführungszeichen werden entfernt, FTS5-Operatoren in der Eingabe
+    haben damit keine Wirkung.
+
+    Args:
+        eingabe: Eingabe aus dem Suchfeld.
+
+    Returns:
+        Anfrage für ``MATCH`` oder ``None`` bei leerer Eingabe.
+    """
+    woerter = [wort.replace('"', "") for wort in eingabe.split()]
+    woerter = [wort for wort in woerter if any(c.isalnum() for c in wort)]
+    if not woerter:
+        return None
+    return " ".join(f'"{wort}"*' for wort in woerter)
@@ -1,16 +1,157 @@
 from __future__ import annotations
 from email_validator import validate_email, EmailNotValidError
-from src.database import DatabaseManager
+from src.database import DatabaseManager, DBKonfliktError
 from src.models import Enrollment, EnrollmentStatus, Student, Modul, Pruefungsleistung
 from data.hochschulen import hs_dict
 from data.hs_dict_kurz import hs_dict_kurz
 
+from contextlib import contextmanager
+import copy
 import datetime
 from dateutil.relativedelta import relativedelta
+import functools
 import logging
+import threading
+import time
+from typing import Callable, Iterable, Iterator, ParamSpec, TypeVar
 
 logger = logging.getLogger(__name__)
 
+# Ab dieser Anzahl Enrollments werden die Dashboard-Kennzahlen per SQL aggregiert,
+# statt alle Enrollments und Prüfungsleistungen als ORM-Objekte zu laden.
+SQL_KENNZAHLEN_AB = 100
+
+# Lade-Profile (siehe ``LADE_PROFILE``), mit denen der Student bei der Session-Strategie
+# ``pro_operation`` zu Beginn einer Operation geladen wird. Sonst: ohne Eager Loading.
+OPERATION_PROFILE: dict[str, str] = {
+    "load_dashboard_data": "dashboard",
+    "get_list_of_enrollments": "dashboard",
+    "get_enrollment_data": "enrollment_detail",
+    "get_pl_with_id": "enrollment_detail",
+    "change_pl": "enrollment_detail",
+    "check_if_already_enrolled": "enrollment_detail",
+    "change_hochschule": "settings",
+    "change_studiengang": "settings",
+    "change_semester_anzahl": "settings",
+    "change_startdatum": "settings",
+}
+
+# Operationen, die nach einem Konflikt mit einem anderen Prozess (``DBKonfliktError``)
+# wiederholt werden. Sie schreiben in genau einem Commit oder einer ``unit_of_work``; nach
+# dem Rollback sind die Objekte abgelaufen, die Wiederholung arbeitet auf frischen Daten.
+WIEDERHOLBARE_OPERATIONEN = frozenset(
+    {
+        "berechne_kennzahlen_neu",
+        "erstelle_enrollment",
+        "change_pl",
+        "change_email",
+        "change_password",
+        "change_name",
+        "change_matrikelnummer",
+        "change_semester_anzahl",
+        "change_startdatum",
+        "change_gesamt_ects",
+        "change_modul_anzahl",
+        "change_hochschule",
+        "change_studiengang",
+        "change_zieldatum",
+        "change_zielnote",
+        "change_exmatrikulationsdatum",
+    }
+)
+# Teile des Dashboard-View-Models (siehe ``Controller.load_dashboard_data``)
+DASHBOARD_TEILE = ("kopf", "semester", "enrollments", "kennzahlen")
+_ALLE_TEILE = frozenset(DASHBOARD_TEILE)
+# Teile des View-Models, die eine Operation nach erfolgreichem Abschluss verwirft.
+# Nicht aufgeführte Operationen (Lesezugriffe, ``change_password``) lassen es unverändert.
+DASHBOARD_INVALIDIERUNG: dict[str, frozenset[str]] = {
+    "login": _ALLE_TEILE,
+    "logout": _ALLE_TEILE,
+    "erstelle_account": _ALLE_TEILE,
+    "delete_student": _ALLE_TEILE,
+    "change_hochschule": _ALLE_TEILE,
+    "change_studiengang": _ALLE_TEILE,
+    "add_hochschule_zu_student": frozenset({"kopf"}),
+    "add_studiengang_zu_student": frozenset({"kopf"}),
+    "erstelle_semester_fuer_student": frozenset({"semester"}),
+    "berechne_kennzahlen_neu": frozenset({"kennzahlen"}),
+    "erstelle_enrollment": frozenset({"enrollments", "kennzahlen"}),
+    "change_pl": frozenset({"enrollments", "kennzahlen"}),
+    "change_email": frozenset({"kopf"}),
+    "change_name": frozenset({"kopf"}),
+    "change_matrikelnummer": frozenset({"kopf"}),
+    "change_gesamt_ects": frozenset({"kopf"}),
+    "change_zielnote": frozenset({"kopf"}),
+    "change_semester_anzahl": frozenset({"semester"}),
+    "change_startdatum": frozenset({"kopf", "semester"}),
+    "change_zieldatum": frozenset({"kopf", "semester"}),
+    "change_exmatrikulationsdatum": frozenset({"kopf", "semester"}),
+    "change_modul_anzahl": frozenset({"kopf", "kennzahlen"}),
+}
+
+# Versuche je Operation; vor dem n-ten Versuch wird n * KONFLIKT_PAUSE Sekunden gewartet.
+KONFLIKT_VERSUCHE = 3
+KONFLIKT_PAUSE = 0.05
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+def plane_semester(
+    start_datum: datetime.date, anzahl: int
+) -> list[tuple[int, datetime.date, datetime.date]]:
+    """Berechnet die Semester eines Studiums zu je 6 Monaten.
+
+    Das Enddatum berechnet sich: Enddatum = Beginn + 6 Monate - 1 Tag.
+
+    Args:
+        start_datum: Studienstart (Beginn des ersten Semesters).
+        anzahl: Anzahl der Semester.
+
+    Returns:
+        list[tuple[int, datetime.date, datetime.date]]: ``(nummer, beginn, ende)`` je Semester.
+    """
+    plan = []
+    for i in range(anzahl):
+        beginn = start_datum + relativedelta(months=6 * i)
+        ende = (beginn + relativedelta(months=6)) - relativedelta(days=1)
+        plan.append((i + 1, beginn, ende))
+    return plan
+
+
+def operation(func: Callable[P, R]) -> Callable[P, R]:
+    """Dekorator: führt eine Controller-Methode als Operation aus (siehe ``Controller._operation``).
+
+    Operationen aus ``WIEDERHOLBARE_OPERATIONEN`` werden bei ``DBKonfliktError`` bis zu
+    ``KONFLIKT_VERSUCHE``-mal ausgeführt, verschachtelte Operationen nur über die äußerste.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        controller = args[0]
+        wiederholbar = func.__name__ in WIEDERHOLBARE_OPERATIONEN
+        versuche = KONFLIKT_VERSUCHE if wiederholbar else 1
+        with controller._lock:  # type: ignore[attr-defined]
+            aeusserste = controller._operation_tiefe == 0  # type: ignore[attr-defined]
+            versuch = 1
+            while True:
+                try:
+                    with controller._operation(func.__name__):  # type: ignore[attr-defined]
+                        return func(*args, **kwargs)
+                except DBKonfliktError:
+                    if not aeusserste or versuch >= versuche:
+                        raise
+                    logger.warning(
+                        "Konflikt in %s, Versuch %s von %s.",
+                        func.__name__,
+                        versuch + 1,
+                        versuche,
+                    )
+                    time.sleep(KONFLIKT_PAUSE * versuch)
+                    versuch += 1
+
+    return wrapper
+
 
 class Controller:
     """Die Controller-Klasse kapselt die Geschäftslogik und kommuniziert zwischen Model und UI nach dem MVC-Pattern.
@@ -39,13 +180,28 @@ class Controller:
             offline: Wenn ``True`` ist Offline-Modus aktiv, sodass ``email_validator`` keine DNS-Abfragen macht (``check_deliverability=False``).
 
         Attribute:
-            db: DatabaseManager-Instanz, für Datenbankzugriffe (langlebige Session).
+            db: DatabaseManager-Instanz, für Datenbankzugriffe (langlebige Session oder Session pro Operation).
             student: Student-Instanz, User-Objekt wird bei Login oder Registrierung zugewiesen.
         """
         self.db = db or DatabaseManager()
 
         self.student: Student | None = None
 
+        # Serialisiert Operationen, damit der Controller auch aus Worker-Threads nutzbar ist.
+        self._lock = threading.RLock()
+        self._operation_tiefe = 0
+
+        # Indizes über Enrollments und Prüfungsleistungen von ``student`` (siehe ``_baue_indizes``)
+        self._index_student: Student | None = None
+        self._enrollments: dict[int, Enrollment] = {}
+        self._pruefungsleistungen: dict[int, Pruefungsleistung] = {}
+        self._enrollments_nach_modulcode: dict[str, Enrollment] = {}
+
+        # Dashboard-View-Model je Teil (siehe ``load_dashboard_data``), gültig für einen Tag
+        self._dashboard_teile: dict[str, dict] = {}
+        self._dashboard_tag: datetime.date | None = None
+        self.dashboard_version = 0
+
         self.offline = offline
         if self.offline:
             logger.info("Offline-Modus aktiv.")
@@ -55,7 +211,147 @@ class Controller:
             logger.debug("Hochschulen aus hs_dict erstellt, falls nicht vorhanden.")
         logger.debug("Controller initialisiert")
 
+    @contextmanager
+    def _operation(self, name: str) -> Iterator[None]:
+        """Rahmen für jede öffentliche Controller-Methode.
+
+        Operationen werden über einen Lock serialisiert. Bei der Session-Strategie
+        ``pro_operation`` wird der Student zu Beginn der äußersten Operation in die
+        Session des aktuellen Threads geladen (mit dem Lade-Profil aus ``OPERATION_PROFILE``);
+        nach der Operation ist er detached,
+        zurückgegeben werden ohnehin nur Dictionaries.
+
+        Args:
+            name: Name der Operation (für Logging).
+        """
+        with self._lock:
+            aeusserste = self._operation_tiefe == 0
+            self._operation_tiefe += 1
+            try:
+                with self.db.operation(name):
+                    if (
+                        aeusserste
+                        and self.db.session_pro_operation
+                        and self.student is not None
+                    ):
+                        self.student = self.db.lade_student_neu(
+                            self.student, profil=OPERATION_PROFILE.get(name)
+                        )
+                    yield
+            except Exception:
+                # nach einem Rollback können indizierte Objekte verworfen sein
+                if aeusserste:
+                    self._verwerfe_indizes()
+                    self._invalidiere_dashboard(_ALLE_TEILE)
+                raise
+            else:
+                teile = DASHBOARD_INVALIDIERUNG.get(name)
+                if teile:
+                    self._invalidiere_dashboard(teile)
+            finally:
+                self._operation_tiefe -= 1
+        if aeusserste:
+            logger.debug("Operation beendet: %s", name)
+
+    # --- Dashboard-View-Model ---
+    def _invalidiere_dashboard(self, teile: Iterable[str]) -> None:
+        """Verwirft Teile des Dashboard-View-Models und erhöht ``dashboard_version``.
+
+        Args:
+            teile: Teile aus ``DASHBOARD_TEILE``.
+        """
+        verworfen = False
+        for teil in teile:
+            verworfen |= self._dashboard_teile.pop(teil, None) is not None
+        if verworfen:
+            self.dashboard_version += 1
+
+    def dashboard_veraltet(self, version: int) -> bool:
+        """Prüft ohne Datenbankzugriff, ob ein Dashboard der Version ``version`` veraltet ist.
+
+        Veraltet ist es nach jeder Operation, die einen Teil des View-Models verworfen hat,
+        und nach einem Datumswechsel (Zeitfortschritt, Semester- und Modulstatus).
+
+        Args:
+            version (int): ``version`` aus ``load_dashboard_data``.
+
+        Returns:
+            bool: ``True``, wenn das Dashboard neu geladen werden muss.
+        """
+        return (
+            version != self.dashboard_version
+            or self._dashboard_tag != datetime.date.today()
+        )
+
+    # --- Indizes ---
+    def _baue_indizes(self) -> None:
+        """Baut die Indizes ID -> Enrollment, ID -> Prüfungsleistung und Modulcode -> Enrollment neu auf.
+
+        Die Indizes gehören zur Instanz ``self.student``: Beim Login und beim Anlegen eines
+        Accounts werden sie neu aufgebaut, beim Anlegen und Löschen von Enrollments
+        fortgeschrieben. Lädt die Session-Strategie ``pro_operation`` den Studenten pro
+        Operation neu, werden sie beim ersten Zugriff der Operation neu aufgebaut.
+        """
+        self._verwerfe_indizes()
+        if self.student is None:
+            return
+        for enrollment in self.student.enrollments:
+            self._indiziere_enrollment(enrollment)
+        self._index_student = self.student
+
+    def _verwerfe_indizes(self) -> None:
+        """Leert die Indizes, der nächste Zugriff baut sie neu auf."""
+        self._index_student = None
+        self._enrollments.clear()
+        self._pruefungsleistungen.clear()
+        self._enrollments_nach_modulcode.clear()
+
+    def _indiziere_enrollment(self, enrollment: Enrollment) -> None:
+        """Nimmt ein Enrollment und seine Prüfungsleistungen in die Indizes auf."""
+        self._enrollments[enrollment.id] = enrollment
+        self._enrollments_nach_modulcode[enrollment.modul.modulcode] = enrollment
+        for pl in enrollment.pruefungsleistungen:
+            self._pruefungsleistungen[pl.id] = pl
+
+    def _finde_enrollment(self, enrollment_id: int) -> Enrollment | None:
+        """Sucht ein Enrollment des Studenten über den Index.
+
+        Bei einem Fehltreffer wird der Index einmal neu aufgebaut, damit auch Enrollments
+        gefunden werden, die am Controller vorbei angelegt wurden.
+
+        Args:
+            enrollment_id (int): ID des Enrollments.
+
+        Returns:
+            Enrollment oder ``None``, wenn der Student kein Enrollment mit dieser ID hat.
+        """
+        if self._index_student is not self.student:
+            self._baue_indizes()
+        enrollment = self._enrollments.get(enrollment_id)
+        if enrollment is None:
+            self._baue_indizes()
+            enrollment = self._enrollments.get(enrollment_id)
+        return enrollment
+
+    def _finde_pl(self, enrollment_id: int, pl_id: int) -> Pruefungsleistung | None:
+        """Sucht eine Prüfungsleistung eines Enrollments des Studenten über den Index.
+
+        Args:
+            enrollment_id (int): ID des Enrollments.
+            pl_id (int): ID der Prüfungsleistung.
+
+        Returns:
+            Prüfungsleistung oder ``None``, wenn sie nicht zum Enrollment gehört.
+        """
+        if self._finde_enrollment(enrollment_id) is None:
+            return None
+        pl = self._pruefungsleistungen.get(pl_id)
+        if pl is None or pl.enrollment_id != enrollment_id:
+            return None
+        return pl
+
     # --- Account & Login ---
+    @operation
     def login(self, email: str, password: str) -> bool:
         """Authentifiziert einen Nutzer und setzt ``self.student`` bei Erfolg.
 
@@ -79,18 +375,22 @@ class Controller:
         student = self.db.lade_student_mit_beziehungen(verified_email)
         if student and student.verify_password(password):
             self.student = student
+            self._baue_indizes()
+            if not student.kennzahlen_gueltig:
+                # z. B. nach Migration: Kennzahlen einmalig neu berechnen und speichern
+                self.berechne_kennzahlen_neu()
             logger.info("Login erfolgreich: %s", self.student.email)
             return True
         else:
             logger.info("Login fehlgeschlagen: %s", verified_email)
             return False
 
+    @operation
     def erstelle_account(self, cache: dict) -> None:
         """Legt einen neuen Student inkl. Basis-Beziehungen und Semestern an.
 
-        Erstellt Datenbank-Datensätze und Beziehungen.
+        Erstellt Datenbank-Datensätze und Beziehungen in einer Transaktion (ein Commit).
         Setzt ``self.student`` auf den neu angelegten Student.
-        Aktuell mehrere Commits durch Unterfunktionen.
 
         Args:
             cache (dict):
@@ -102,26 +402,35 @@ class Controller:
         start_datum = datetime.date.fromisoformat(cache["startdatum"])
         zieldatum = datetime.date.fromisoformat(cache["zieldatum"])
 
-        self.student = self.db.add_student(
-            name=cache["name"],
-            matrikelnummer=cache["matrikelnummer"],
-            email=cache["email"],
-            password=cache["password"],
-            semester_anzahl=cache["semesteranzahl"],
-            modul_anzahl=cache["modulanzahl"],
-            start_datum=start_datum,
-            ziel_datum=zieldatum,
-            ziel_note=cache["zielnote"],
-        )
-        logger.info("Student erstellt: %s", self.student.email)
-        self.erstelle_semester_fuer_student()
-        self.add_hochschule_zu_student(cache=cache)
-        self.add_studiengang_zu_student(cache=cache)
-        self.add_studiengang_zu_hochschule(cache=cache)
-
-        self.db.session.commit()
+        try:
+            with self.db.unit_of_work(action="erstelle_account"):
+                self.student = self.db.add_student(
+                    name=cache["name"],
+                    matrikelnummer=cache["matrikelnummer"],
+                    email=cache["email"],
+                    password=cache["password"],
+                    semester_anzahl=cache["semesteranzahl"],
+                    modul_anzahl=cache["modulanzahl"],
+                    start_datum=start_datum,
+                    ziel_datum=zieldatum,
+                    ziel_note=cache["zielnote"],
+                    hochschule_id=int(cache["hochschulid"]),
+                )
+                logger.info("Student erstellt: %s", self.student.email)
+                self.erstelle_semester_fuer_student()
+                self.add_hochschule_zu_student(cache=cache)
+                self.add_studiengang_zu_student(cache=cache)
+                self.add_studiengang_zu_hochschule(cache=cache)
+        except Exception:
+            # Transaktion wurde zurückgerollt, der Student existiert nicht.
+            self.student = None
+            raise
+        # neuer Account: noch keine Enrollments, die Indizes sind leer
+        self._verwerfe_indizes()
+        self._index_student = self.student
         logger.info("Account mit Beziehungen erstellt: %s", self.student.email)
 
+    @operation
     def add_hochschule_zu_student(self, cache: dict) -> None:
         """Fügt dem Student eine Hochschule zu und committet.
 
@@ -143,9 +452,10 @@ class Controller:
                 f"Hochschule ({cache['hochschulid']}) wurde nicht gefunden!"
             )
         self.student.hochschule = hs
-        self.db.session.commit()
+        self.db.commit_or_rollback(action="add_hochschule_zu_student")
         logger.info("Hochschule %s Student %s zugeordnet", hs.name, self.student.email)
 
+    @operation
     def add_studiengang_zu_student(self, cache: dict) -> None:
         """Fügt einem Student einen Studiengang hinzu und committet.
 
@@ -167,9 +477,10 @@ class Controller:
                 f"Studiengang ({cache['studiengang_id']}) wurde nicht gefunden!"
             )
         self.student.studiengang = sg
-        self.db.session.commit()
+        self.db.commit_or_rollback(action="add_studiengang_zu_student")
         logger.info("Studiengang %s Student %s zugeordnet", sg.name, self.student.email)
 
+    @operation
     def add_studiengang_zu_hochschule(self, cache: dict) -> None:
         """Fügt einer Hochschule einen Studiengang hinzu und committet.
 
@@ -193,58 +504,107 @@ class Controller:
             )
         if sg not in hs.studiengaenge:
             hs.studiengaenge.append(sg)
-            self.db.session.commit()
+            self.db.commit_or_rollback(action="add_studiengang_zu_hochschule")
             logger.info("Studiengang %s Hochschule %s zugeordnet", sg.name, hs.name)
 
+    @operation
     def load_dashboard_data(self) -> dict:
         """Gibt ein Dictionary mit allen benötigten Daten für die UI zurück.
 
+        Das View-Model besteht aus den Teilen ``DASHBOARD_TEILE`` (Kopfdaten, Semester,
+        Enrollments, Kennzahlen). Berechnet werden nur Teile, die eine Operation seit dem
+        letzten Aufruf verworfen hat (``DASHBOARD_INVALIDIERUNG``), nach einem Datumswechsel
+        alle. Ohne Änderungen wird das View-Model ohne Datenbankzugriff zurückgegeben.
+
         Returns:
-            dict: Daten für das Dashboard (GUI).
+            dict: Daten für das Dashboard (GUI), inkl. ``version`` (``dashboard_version``).
+            Das Dictionary ist eine tiefe Kopie, die UI darf es (auch die Listen der
+            Enrollments und Semester) verändern.
 
         Raises: RuntimeError: Wenn kein Student eingeloggt ist.
         """
         if not self.student:
             logger.warning("Nicht eingeloggt: load_dashboard_data aufgerufen.")
             raise RuntimeError("Nicht eingeloggt")
+        heute = datetime.date.today()
+        if self._dashboard_tag != heute:
+            self._invalidiere_dashboard(_ALLE_TEILE)
+            self._dashboard_tag = heute
+        if not self.student.kennzahlen_gueltig:
+            self.berechne_kennzahlen_neu()
+
+        teile = self._dashboard_teile
+        if "kennzahlen" not in teile:
+            abgeschlossen = self.get_number_of_enrollments_with_status(
+                EnrollmentStatus.ABGESCHLOSSEN
+            )
+            in_bearbeitung = self.get_number_of_enrollments_with_status(
+                EnrollmentStatus.IN_BEARBEITUNG
+            )
+            nicht_bestanden = self.get_number_of_enrollments_with_status(
+                EnrollmentStatus.NICHT_BESTANDEN
+            )
+            teile["kennzahlen"] = {
+                "abgeschlossen": abgeschlossen,
+                "in_bearbeitung": in_bearbeitung,
+                "nicht_bestanden": nicht_bestanden,
+                "ausstehend": self.student.modul_anzahl
+                - (abgeschlossen + in_bearbeitung + nicht_bestanden),
+                "erarbeitete_ects": self.get_erarbeitete_ects(),
+                "notendurchschnitt": self.get_notendurchschnitt(),
+            }
+        if "kopf" not in teile:
+            teile["kopf"] = {
+                "email": self.student.email,
+                "name": self.student.name,
+                "matrikelnummer": self.student.matrikelnummer,
+                "studiengang": self.student.studiengang.name,
+                "hochschule": self.student.hochschule.name,
+                "startdatum": self.student.start_datum,
+                "zieldatum": self.student.ziel_datum,
+                "zielnote": self.student.ziel_note,
+                "modulanzahl": self.student.modul_anzahl,
+                "gesamt_ects": self.student.studiengang.gesamt_ects_punkte,
+                "time_progress": self.get_time_progress(),
+                "exmatrikulationsdatum": self.student.exmatrikulationsdatum,
+            }
+        if "semester" not in teile:
+            teile["semester"] = {
+                "semester": self.get_list_of_semester(),
+                "semesteranzahl": self.student.semester_anzahl,
+                "semester_amount": self.get_semester_amount(),
+            }
+        if "enrollments" not in teile:
+            teile["enrollments"] = {"enrollments": self.get_list_of_enrollments()}
 
-        abgeschlossen = self.get_number_of_enrollments_with_status(
-            EnrollmentStatus.ABGESCHLOSSEN
-        )
-        in_bearbeitung = self.get_number_of_enrollments_with_status(
-            EnrollmentStatus.IN_BEARBEITUNG
-        )
-        nicht_bestanden = self.get_number_of_enrollments_with_status(
-            EnrollmentStatus.NICHT_BESTANDEN
-        )
-        ausstehend = self.student.modul_anzahl - (
-            abgeschlossen + in_bearbeitung + nicht_bestanden
-        )
+        daten = {"heute": heute, "version": self.dashboard_version}
+        for teil in DASHBOARD_TEILE:
+            # tiefe Kopie: Listen und Dicts der Teile bleiben im Zwischenspeicher
+            daten.update(copy.deepcopy(teile[teil]))
+        return daten
 
-        return {
-            "email": self.student.email,
-            "name": self.student.name,
-            "matrikelnummer": self.student.matrikelnummer,
-            "studiengang": self.student.studiengang.name,
-            "hochschule": self.student.hochschule.name,
-            "startdatum": self.student.start_datum,
-            "zieldatum": self.student.ziel_datum,
-            "zielnote": self.student.ziel_note,
-            "modulanzahl": self.student.modul_anzahl,
-            "gesamt_ects": self.student.studiengang.gesamt_ects_punkte,
-            "semester": self.get_list_of_semester(),
-            "enrollments": self.get_list_of_enrollments(),
-            "heute": datetime.date.today(),
-            "time_progress": self.get_time_progress(),
-            "abgeschlossen": abgeschlossen,
-            "in_bearbeitung": in_bearbeitung,
-            "nicht_bestanden": nicht_bestanden,
-            "ausstehend": ausstehend,
-            "erarbeitete_ects": self.get_erarbeitete_ects(),
-            "notendurchschnitt": self.get_notendurchschnitt(),
-            "exmatrikulationsdatum": self.student.exmatrikulationsdatum,
-        }
+    @operation
+    def berechne_kennzahlen_neu(self) -> None:
+        """Berechnet die Kennzahlen des Studenten neu und committet.
+
+        Ab ``SQL_KENNZAHLEN_AB`` Enrollments wird die gruppierte SQL-Abfrage
+        ``lade_dashboard_kennzahlen`` genutzt, sonst werden die Enrollments geladen.
+
+        Raises: RuntimeError: Wenn kein Student eingeloggt ist.
+        """
+        if not self.student:
+            logger.warning("Nicht eingeloggt: berechne_kennzahlen_neu aufgerufen.")
+            raise RuntimeError("Nicht eingeloggt")
+        if self.db.zaehle_enrollments(self.student.id) >= SQL_KENNZAHLEN_AB:
+            self.student.uebernehme_kennzahlen(
+                self.db.lade_dashboard_kennzahlen(self.student.id)
+            )
+            logger.debug("Kennzahlen per SQL berechnet: s.id=%s", self.student.id)
+        else:
+            self.student.berechne_kennzahlen_neu()
+        self.db.commit_or_rollback(action="berechne_kennzahlen_neu")
 
+    @operation
     def get_time_progress(self) -> float:
         """Gibt den zeitlichen Fortschritt des Studiums zwischen Beginn und Wunschdatum als float zurück.
 
@@ -287,6 +647,7 @@ class Controller:
         logger.debug("get_time_progress ausgeführt")
         return progress
 
+    @operation
     def get_semester_amount(self) -> float:
         """Gibt das Verhältnis der Dauer aller Semester zu der gewünschten Studiendauer zurück.
 
@@ -329,6 +690,7 @@ class Controller:
         )
         return float(1)
 
+    @operation
     def get_number_of_enrollments_with_status(self, status: EnrollmentStatus) -> int:
         """Gibt die Anzahl der eingeschriebenen Module mit bestimmten Status zurück.
 
@@ -345,14 +707,11 @@ class Controller:
                 "Nicht eingeloggt: get_number_of_enrollments_with_status aufgerufen."
             )
             raise RuntimeError("Nicht eingeloggt")
-        liste = [
-            enrollment
-            for enrollment in self.student.enrollments
-            if enrollment.status == status
-        ]
+        anzahl = self.student.anzahl_enrollments_mit_status(status)
         logger.debug("get_number_of_enrollments_with_status %s ausgeführt", str(status))
-        return len(liste)
+        return anzahl
 
+    @operation
     def get_erarbeitete_ects(self) -> int:
         """Gibt die bisher vom Studenten erarbeiteten ECTS-Punkte zurück.
 
@@ -364,14 +723,10 @@ class Controller:
         if not self.student:
             logger.warning("Nicht eingeloggt: get_erarbeitete_ects aufgerufen.")
             raise RuntimeError("Nicht eingeloggt")
-        liste = [
-            enrollment.modul.ects_punkte
-            for enrollment in self.student.enrollments
-            if enrollment.status == EnrollmentStatus.ABGESCHLOSSEN
-        ]
         logger.debug("get_erarbeitete_ects ausgeführt")
-        return sum(liste)
+        return self.student.erarbeitete_ects
 
+    @operation
     def get_notendurchschnitt(self) -> float | None:
         """Errechnet den Notendurchschnitt aller abgeschlossenen Module.
 
@@ -384,18 +739,10 @@ class Controller:
         if not self.student:
             logger.warning("Nicht eingeloggt: get_notendurchschnitt aufgerufen.")
             raise RuntimeError("Nicht eingeloggt")
-        liste = [
-            enrollment.berechne_enrollment_note()
-            for enrollment in self.student.enrollments
-            if enrollment.status == EnrollmentStatus.ABGESCHLOSSEN
-        ]
-        if liste != []:
-            logger.debug("get_notendurchschnitt ausgeführt")
-            return float(round((sum(liste) / len(liste)), 2))  # type: ignore
-        else:
-            logger.debug("get_notendurchschnitt ausgeführt")
-            return None
+        logger.debug("get_notendurchschnitt ausgeführt")
+        return self.student.notendurchschnitt
 
+    @operation
     def get_list_of_semester(self) -> list[dict]:
         """Stellt alle Semester eines Studenten als dict dar und gibt eine Liste dieser Semester-Dictionaries zurück.
 
@@ -423,6 +770,7 @@ class Controller:
         logger.debug("get_list_of_semester ausgeführt")
         return semester_list
 
+    @operation
     def get_list_of_enrollments(self) -> list[dict]:
         """Gibt eine Liste mit allen Enrollments (als dict) eines Studenten zurück.
 
@@ -434,14 +782,13 @@ class Controller:
         if not self.student:
             logger.warning("Nicht eingeloggt: get_list_of_enrollments aufgerufen.")
             raise RuntimeError("Nicht eingeloggt")
-        enrollment_list = []
-        enrollment_dict = {}
-        for enrollment in self.student.enrollments:
-            enrollment_dict = self.get_enrollment_data(enrollment.id)
-            enrollment_list.append(enrollment_dict)
+        enrollment_list = [
+            self._enrollment_dict(enrollment) for enrollment in self.student.enrollments
+        ]
         logger.debug("get_list_of_enrollments ausgeführt")
         return enrollment_list
 
+    @operation
     def get_list_of_kurse(self, modul: Modul) -> list[dict]:
         """Stellt alle Kurse eines Moduls als dict dar und gibt eine Liste dieser Kurs-Dictionaries zurück.
 
@@ -468,6 +815,7 @@ class Controller:
         logger.debug("get_list_of_kurse ausgeführt")
         return kurse_list
 
+    @operation
     def get_list_of_pruefungsleistungen(self, enrollment: Enrollment) -> list[dict]:
         """Gibt eine Liste mit allen Prüfungsleistungen (als dict) eines Enrollments zurück.
 
@@ -512,6 +860,7 @@ class Controller:
             "ist_bestanden": pl.ist_bestanden(),
         }
 
+    @operation
     def get_pl_with_id(self, enrollment_id: int, pl_id: int) -> dict:
         """Gibt eine Prüfungsleistung als dict zurück, falls diese per Enrollment-ID und Prüfungsleistungs-ID gefunden wird.
 
@@ -527,14 +876,13 @@ class Controller:
         if not self.student:
             logger.warning("Nicht eingeloggt: get_pl_with_id aufgerufen.")
             raise RuntimeError("Nicht eingeloggt")
-        for enrollment in self.student.enrollments:
-            if enrollment.id == enrollment_id:
-                for pl in enrollment.pruefungsleistungen:
-                    if pl.id == pl_id:
-                        logger.debug("get_pl_with_id ausgeführt")
-                        return self.get_pl_dict(pl)
-        return {}
+        pl = self._finde_pl(enrollment_id, pl_id)
+        if pl is None:
+            return {}
+        logger.debug("get_pl_with_id ausgeführt")
+        return self.get_pl_dict(pl)
 
+    @operation
     def get_enrollment_data(self, enrollment_id: int) -> dict:
         """Gibt ein Enrollment in dict-Darstellung zurück, falls dieses per ID gefunden wurde.
 
@@ -551,39 +899,46 @@ class Controller:
         if not self.student:
             logger.warning("Nicht eingeloggt: get_enrollment_data aufgerufen.")
             raise RuntimeError("Nicht eingeloggt")
-        for enrollment in self.student.enrollments:
-            if enrollment.id == enrollment_id:
-                enrollment.aktualisiere_status()
-                enrollment_dict = {
-                    "id": enrollment.id,
-                    "einschreibe_datum": enrollment.einschreibe_datum,
-                    "end_datum": enrollment.end_datum,
-                    "status": str(enrollment.status).strip("EnrollmentStatus."),
-                    "modul_id": enrollment.modul_id,
-                    "modul_name": enrollment.modul.name,
-                    "modul_code": enrollment.modul.modulcode,
-                    "modul_ects": enrollment.modul.ects_punkte,
-                    "kurse": self.get_list_of_kurse(enrollment.modul),
-                    "anzahl_pruefungsleistungen": enrollment.anzahl_pruefungsleistungen,
-                    "pruefungsleistungen": self.get_list_of_pruefungsleistungen(
-                        enrollment,
-                    ),
-                    "enrollment_note": enrollment.berechne_enrollment_note(),
-                }
-            else:
-                continue
-            logger.debug("get_enrollment_data ausgeführt")
-            return enrollment_dict
-        return {}
+        enrollment = self._finde_enrollment(enrollment_id)
+        if enrollment is None:
+            return {}
+        logger.debug("get_enrollment_data ausgeführt")
+        return self._enrollment_dict(enrollment)
+
+    def _enrollment_dict(self, enrollment: Enrollment) -> dict:
+        """Aktualisiert den Status eines Enrollments und stellt es als dict dar.
+
+        Args:
+            enrollment (Enrollment): Enrollment des eingeloggten Studenten.
+
+        Returns:
+            dict: Darstellung des Enrollments (siehe ``get_enrollment_data``).
+        """
+        enrollment.aktualisiere_status()
+        return {
+            "id": enrollment.id,
+            "einschreibe_datum": enrollment.einschreibe_datum,
+            "end_datum": enrollment.end_datum,
+            "status": str(enrollment.status).strip("EnrollmentStatus."),
+            "modul_id": enrollment.modul_id,
+            "modul_name": enrollment.modul.name,
+            "modul_code": enrollment.modul.modulcode,
+            "modul_ects": enrollment.modul.ects_punkte,
+            "kurse": self.get_list_of_kurse(enrollment.modul),
+            "anzahl_pruefungsleistungen": enrollment.anzahl_pruefungsleistungen,
+            "pruefungsleistungen": self.get_list_of_pruefungsleistungen(enrollment),
+            "enrollment_note": enrollment.berechne_enrollment_note(),
+        }
 
+    @operation
     def erstelle_hochschulen_von_hs_dict(self) -> None:
-        """Erstellt Hochschulen, die in hs_dict (siehe import) gelistet sind."""
-        hochschul_namen = {h.name for h in self.db.lade_alle_hochschulen()}
-        for name in hs_dict.values():
-            if not name:
-                continue
-            if name not in hochschul_namen:
-                self.erstelle_hochschule(hochschul_name=name)
+        """Erstellt Hochschulen, die in hs_dict (siehe import) gelistet sind.
+
+        Fehlende Hochschulen werden in einer Transaktion angelegt. Hat sich ``hs_dict``
+        seit dem letzten Start nicht geändert, entfällt jeder Schreib- und Ladezugriff.
+        """
+        anzahl = self.db.seed_hochschulen(hs_dict.values())
+        logger.debug("erstelle_hochschulen_von_hs_dict ausgeführt: %s neu", anzahl)
 
     def get_hs_kurzname_if_notwendig(self, name: str, max_length: int = 50) -> str:
         """Gibt den Kurznamen einer Hochschule zurück, falls ihr Name zu lang ist.
@@ -616,6 +971,7 @@ class Controller:
             logger.debug("get_hs_kurzname_if_notwendig ausgeführt: Name kurz")
             return name
 
+    @operation
     def get_hochschulen_dict(self) -> dict[int, str]:
         """Gibt ein Dictionary mit allen Hochschulen in der Datenbank zurück.
 
@@ -634,11 +990,13 @@ class Controller:
         logger.debug("get_hochschulen_dict ausgeführt")
         return hochschulen_dict
 
+    @operation
     def get_studiengaenge_von_hs(self, hochschule_id: int) -> dict[int, str]:
-        """Gibt ein Dictionary mit allen Studiengängen (in Kleinbuchstaben) einer Hochschule in der Datenbank zurück.
+        """Gibt ein Dictionary mit allen Studiengängen (normalisierte Namen) einer Hochschule in der Datenbank zurück.
 
         Der Schlüssel ist die jeweilige Datenbank-ID des Studiengangs,
-        der Name des Studiengangs (.lower()) der zugehörige Wert.
+        der normalisierte Name des Studiengangs (``name_key``, siehe ``normalisiere_name``)
+        der zugehörige Wert.
         Falls die Hochschule nicht gefunden wird, wird ``{0: ""}`` zurückgegeben.
         Falls keine Studiengänge angelegt sind, wird ``{}`` zurückgegeben
 
@@ -653,13 +1011,14 @@ class Controller:
             studiengaenge = self.db.lade_alle_studiengaenge_von_hochschule(hochschule)
             studiengaenge_dict = {}
             for studiengang in studiengaenge:
-                studiengaenge_dict[studiengang.id] = studiengang.name.lower()
+                studiengaenge_dict[studiengang.id] = studiengang.name_key
             logger.debug("get_studiengaenge_von_hs ausgeführt")
             return studiengaenge_dict
         else:
             logger.debug("get_studiengaenge_von_hs ausgeführt - keine gefunden")
             return {0: ""}
 
+    @operation
     def get_studiengang_id(
         self, studiengang_name: str, hochschule_id: int
     ) -> dict[int, str]:
@@ -699,6 +1058,7 @@ class Controller:
             )
             return {0: ""}
 
+    @operation
     def erstelle_hochschule(self, hochschul_name: str) -> dict[int, str]:
         """Legt eine Hochschule in der Datenbank an (Commit) und gibt ein Dictionary mit ID (Schlüssel) und Name (Wert) zurück.
 
@@ -709,10 +1069,10 @@ class Controller:
             dict[int, str]: [Hochschul-ID, Hochschul-Name]
         """
         hochschule = self.db.add_hochschule(hochschul_name)
-        self.db.session.commit()
         logger.info("Hochschule erstellt: %s", hochschule.id)
         return {hochschule.id: hochschule.name}
 
+    @operation
     def erstelle_studiengang(
         self, studiengang_name: str, gesamt_ects_punkte: int
     ) -> dict[int, str]:
@@ -726,15 +1086,16 @@ class Controller:
             dict[int, str]: [Studiengang-ID, Studiengang-Name]
         """
         studiengang = self.db.add_studiengang(studiengang_name, gesamt_ects_punkte)
-        self.db.session.commit()
         logger.info("Studiengang erstellt: %s", studiengang.id)
         return {studiengang.id: studiengang.name}
 
+    @operation
     def erstelle_semester_fuer_student(self) -> None:
-        """Erstellt aus Startdatum und Semesteranzahl einzelne Semesterobjekte, zu je 6 Monaten,
-        legt sie in der Datenbank an und committet.
+        """Plant die Semester aus Startdatum und Semesteranzahl (``plane_semester``) und gleicht
+        die vorhandenen Semester des Studenten damit ab (ein Flush, ein Commit).
 
-        Das Enddatum berechnet sich: Enddatum = Beginn + 6 Monate - 1 Tag.
+        Bereits vorhandene Semester werden aktualisiert statt neu angelegt, fehlende werden
+        ergänzt und überzählige gelöscht.
 
         Raises: RuntimeError: Wenn kein Student eingeloggt ist.
         """
@@ -749,15 +1110,17 @@ class Controller:
             and self.student.semester_anzahl > 0
         )
 
-        for i in range(self.student.semester_anzahl):
-            beginn = self.student.start_datum + relativedelta(months=6 * i)
-            ende = (beginn + relativedelta(months=6)) - relativedelta(days=1)
-            nummer = i + 1
-            self.db.add_semester(
-                student=self.student, nummer=nummer, ende=ende, beginn=beginn
-            )
-        self.db.session.commit()
-        logger.info("Semester wurden erstellt: %s", self.student.email)
+        plan = plane_semester(self.student.start_datum, self.student.semester_anzahl)
+        aktualisiert, angelegt, geloescht = self.db.synchronisiere_semester(
+            self.student, plan
+        )
+        logger.info(
+            "Semester abgeglichen: %s (%s aktualisiert, %s angelegt, %s gelöscht)",
+            self.student.email,
+            aktualisiert,
+            angelegt,
+            geloescht,
+        )
 
     def validate_email_for_new_account(self, value: str) -> str | EmailNotValidError:
         """Validiert eine Email-Adresse bei Account-Registrierung.
@@ -801,6 +1164,7 @@ class Controller:
         except EmailNotValidError as e:
             return e
 
+    @operation
     def check_if_email_exists(self, email: str) -> bool:
         """Prüft, ob die Email-Adresse in der Datenbank existiert.
 
@@ -815,6 +1179,38 @@ class Controller:
         else:
             return False
 
+    @operation
+    def suche_module(self, eingabe: str, limit: int = 5) -> list[dict]:
+        """Sucht Module im Katalog für die Autovervollständigung beim Anlegen eines Enrollments.
+
+        Gesucht wird über Modulname, Modulcode, Kursnamen und Kursnummern (Wortanfänge).
+
+        Args:
+            eingabe (str): Eingabe aus dem Modulnamen- oder Modulcode-Feld.
+            limit (int): Maximale Anzahl an Vorschlägen, default: 5.
+
+        Returns:
+            list[dict]: Je Modul ``modul_name``, ``modul_code``, ``modul_ects`` und
+            ``kurse_dict`` (Kursnummer -> Kursname), bester Treffer zuerst.
+
+        Raises: RuntimeError: Wenn kein Student eingeloggt ist.
+        """
+        if not self.student:
+            logger.warning("Nicht eingeloggt: suche_module aufgerufen.")
+            raise RuntimeError("Nicht eingeloggt")
+        vorschlaege = [
+            {
+                "modul_name": modul.name,
+                "modul_code": modul.modulcode,
+                "modul_ects": modul.ects_punkte,
+                "kurse_dict": {kurs.nummer: kurs.name for kurs in modul.kurse},
+            }
+            for modul in self.db.suche_module(eingabe, limit)
+        ]
+        logger.debug("suche_module: %r -> %s Treffer", eingabe, len(vorschlaege))
+        return vorschlaege
+
+    @operation
     def check_if_already_enrolled(self, enrollment_cache: dict) -> bool:
         """Prüft, ob der Student schon in ein Modul eingeschrieben ist.
 
@@ -830,16 +1226,14 @@ class Controller:
         Raises: RuntimeError: Wenn kein Student eingeloggt ist.
         """
         if self.student:
-            for enrollment in self.student.enrollments:
-                if enrollment_cache["modul_code"] == enrollment.modul.modulcode:
-                    return True
-                else:
-                    continue
-            return False
+            if self._index_student is not self.student:
+                self._baue_indizes()
+            return enrollment_cache["modul_code"] in self._enrollments_nach_modulcode
         else:
             logger.warning("Nicht eingeloggt: check_if_already_enrolled aufgerufen.")
             raise RuntimeError("Nicht eingeloggt")
 
+    @operation
     def get_startdatum(self) -> datetime.date:
         """Gibt das Studien-Startdatum des Studenten zurück.
 
@@ -853,26 +1247,31 @@ class Controller:
             raise RuntimeError("Nicht eingeloggt")
         return self.student.start_datum
 
+    @operation
     def erstelle_enrollment(self, enrollment_cache: dict) -> dict:
         """Legt ein Enrollment inklusive Modul, Kurse und Prüfungsleistungen in
         der Datenbank an und gibt die Daten als Dictionary für die GUI zurück.
 
         Ablauf:
             - Einschreibedatum parsen
+            - Prüfen, ob der Student schon im Modul eingeschrieben ist (auch bei jeder
+              Wiederholung nach ``DBKonfliktError``: ein anderer Prozess kann das
+              Enrollment inzwischen angelegt haben)
             - Modul erstellen oder laden
-            - Kurse erstellen oder laden
+            - Kurse mit einer Abfrage laden, fehlende gebündelt erstellen
             - Enrollment erstellen
-            - Prüfungsleistungen (Versuche 1-3) erstellen
+            - Prüfungsleistungen (Versuche 1-3) gebündelt erstellen, Status einmal berechnen
             - Datenbank-Flush, damit IDs generiert werden
             - Rückgabe-Dictionary zusammenstellen
-            - Datenbank-Commit
+            - Datenbank-Commit (ein Commit für alle Schritte)
             - Rückgabe des Dictionary
 
         Args:
             enrollment_cache (dict): Liefert Eingabedaten des Users.
 
         Returns:
-            dict: Gibt die Enrollment-Daten für die GUI zurück.
+            dict: Gibt die Enrollment-Daten für die GUI zurück; existiert das Enrollment
+            schon, die Daten des bestehenden.
 
         Raises:
             RuntimeError: Wenn kein Student eingeloggt ist.
@@ -882,6 +1281,15 @@ class Controller:
             logger.warning("Nicht eingeloggt: erstelle_enrollment aufgerufen.")
             raise RuntimeError("Nicht eingeloggt")
 
+        if self.check_if_already_enrolled(enrollment_cache):
+            vorhanden = self._enrollments_nach_modulcode[enrollment_cache["modul_code"]]
+            logger.warning(
+                "erstelle_enrollment: Enrollment %s für Modul %s existiert bereits.",
+                vorhanden.id,
+                enrollment_cache["modul_code"],
+            )
+            return self._enrollment_dict(vorhanden)
+
         # Einschreibedatum setzen
         einschreibe_datum_str = enrollment_cache["startdatum"]
         try:
@@ -893,75 +1301,75 @@ class Controller:
             )
             raise ValueError(f"Ungültiges Startdatum: {einschreibe_datum_str}")
 
-        # Modul erstellen, falls nicht vorhanden
-        modul = self.db.lade_modul(enrollment_cache["modul_code"])
-        if modul is None:
-            modul = self.db.add_modul(
-                name=enrollment_cache["modul_name"],
-                modulcode=enrollment_cache["modul_code"],
-                ects_punkte=enrollment_cache["modul_ects"],
-                studiengang_id=self.student.studiengang_id,
-            )
-            logger.info("Modul erstellt: %s", modul.id)
-        # Kurse erstellen, falls nicht vorhanden
-        for key, value in enrollment_cache["kurse_dict"].items():
-            kursnummer = key
-            kurs = self.db.lade_kurs(kursnummer=kursnummer)
-            if kurs is None:
-                kurs = self.db.add_kurs(name=value, nummer=kursnummer)
-                logger.info("Kurs erstellt: %s", kurs.id)
-            if kurs not in modul.kurse:
-                modul.kurse.append(kurs)
-
-        # enrollment erstellen
-        enrollment = self.db.add_enrollment(
-            student=self.student,
-            modul=modul,
-            status=EnrollmentStatus.IN_BEARBEITUNG,
-            einschreibe_datum=einschreibe_datum,
-            anzahl_pruefungsleistungen=enrollment_cache["pl_anzahl"],
-        )
-        logger.info(
-            "Enrollment %s erstellt: Student: %s, Modul: %s",
-            enrollment.id,
-            self.student.email,
-            modul.id,
-        )
-        # Prüfungsleistungen erstellen:
-        for i in range(enrollment.anzahl_pruefungsleistungen):
-            for v in range(1, 4, 1):
-                enrollment.add_pruefungsleistung(
-                    teilpruefung=i,
-                    teilpruefung_gewicht=round(
-                        float(1 / enrollment.anzahl_pruefungsleistungen), ndigits=2
-                    ),
-                    versuch=v,
-                    note=None,
-                    datum=None,
+        with self.db.unit_of_work(action="erstelle_enrollment"):
+            # Modul erstellen, falls nicht vorhanden
+            modul = self.db.lade_modul(enrollment_cache["modul_code"])
+            if modul is None:
+                modul = self.db.add_modul(
+                    name=enrollment_cache["modul_name"],
+                    modulcode=enrollment_cache["modul_code"],
+                    ects_punkte=enrollment_cache["modul_ects"],
+                    studiengang_id=self.student.studiengang_id,
                 )
-        logger.info(
-            "Prüfungsleistungen für Enrollment %s erstellt",
-            enrollment.id,
-        )
-        # erzeugte Objekte bekommen IDs von DB.
-        self.db.session.flush()
-
-        enrollment_dict = {
-            "id": enrollment.id,
-            "einschreibe_datum": enrollment.einschreibe_datum,
-            "end_datum": enrollment.end_datum,
-            "status": str(enrollment.status).strip("EnrollmentStatus."),
-            "modul_id": enrollment.modul_id,
-            "modul_name": enrollment.modul.name,
-            "modul_code": enrollment.modul.modulcode,
-            "modul_ects": enrollment.modul.ects_punkte,
-            "kurse": self.get_list_of_kurse(enrollment.modul),
-            "anzahl_pruefungsleistungen": enrollment.anzahl_pruefungsleistungen,
-            "pruefungsleistungen": self.get_list_of_pruefungsleistungen(enrollment),
-        }
-        self.db.session.commit()
+                logger.info("Modul erstellt: %s", modul.id)
+            # Kurse mit einer Abfrage laden, fehlende gebündelt anlegen
+            kurse_dict = enrollment_cache["kurse_dict"]
+            kurse = self.db.lade_kurse(kurse_dict.keys())
+            fehlende = {
+                nummer: name
+                for nummer, name in kurse_dict.items()
+                if nummer not in kurse
+            }
+            for kurs in kurse.values():
+                if kurs.modul_id != modul.id:
+                    kurs.modul = modul
+            if fehlende:
+                self.db.add_kurse(fehlende, modul)
+                logger.info("Kurse erstellt: %s", ", ".join(fehlende))
+
+            # enrollment erstellen
+            enrollment = self.db.add_enrollment(
+                student=self.student,
+                modul=modul,
+                status=EnrollmentStatus.IN_BEARBEITUNG,
+                einschreibe_datum=einschreibe_datum,
+                anzahl_pruefungsleistungen=enrollment_cache["pl_anzahl"],
+            )
+            logger.info(
+                "Enrollment %s erstellt: Student: %s, Modul: %s",
+                enrollment.id,
+                self.student.email,
+                modul.id,
+            )
+            # Prüfungsleistungen (Versuche 1-3) gebündelt erstellen, Status einmal berechnen
+            self.db.add_pruefungsleistungen(enrollment)
+            enrollment.aktualisiere_status()
+            self.student.aendere_kennzahlen(enrollment, 1)
+            logger.info(
+                "Prüfungsleistungen für Enrollment %s erstellt",
+                enrollment.id,
+            )
+            # erzeugte Objekte bekommen IDs von DB.
+            self.db.session.flush()
+
+            enrollment_dict = {
+                "id": enrollment.id,
+                "einschreibe_datum": enrollment.einschreibe_datum,
+                "end_datum": enrollment.end_datum,
+                "status": str(enrollment.status).strip("EnrollmentStatus."),
+                "modul_id": enrollment.modul_id,
+                "modul_name": enrollment.modul.name,
+                "modul_code": enrollment.modul.modulcode,
+                "modul_ects": enrollment.modul.ects_punkte,
+                "kurse": self.get_list_of_kurse(enrollment.modul),
+                "anzahl_pruefungsleistungen": enrollment.anzahl_pruefungsleistungen,
+                "pruefungsleistungen": self.get_list_of_pruefungsleistungen(enrollment),
+            }
+        if self._index_student is self.student:
+            self._indiziere_enrollment(enrollment)
         return enrollment_dict
 
+    @operation
     def change_pl(self, enrollment_id: int, pl_dict: dict) -> None:
         """Setzt bei einer Prüfungsleistung Note und Datum, aktualisiert den Enrollment-Status und persistiert.
 
@@ -984,20 +1392,29 @@ class Controller:
             logger.warning("Ungültiges Startdatum in change_pl: %s", pl_datum_str)
             raise ValueError(f"Ungültiges Startdatum: {pl_datum_str}")
 
-        for enrollment in self.student.enrollments:
-            if enrollment.id == enrollment_id:
-                for pl in enrollment.pruefungsleistungen:
-                    if pl.id == pl_dict["id"]:
-                        pl.datum = pl_datum
-                        pl.note = pl_dict["note"]
-                        logger.info(
-                            "Prüfungsleistungen für Enrollment %s geändert: PL-ID=%s",
-                            enrollment.id,
-                            pl.id,
-                        )
-                        enrollment.aktualisiere_status()
-                        self.db.session.commit()
+        pl = self._finde_pl(enrollment_id, pl_dict["id"])
+        if pl is None:
+            logger.warning(
+                "change_pl: PL-ID=%s in Enrollment %s nicht gefunden.",
+                pl_dict["id"],
+                enrollment_id,
+            )
+            return
+        enrollment = self._enrollments[enrollment_id]
+        # alten Beitrag des Enrollments zu den Kennzahlen entfernen
+        self.student.aendere_kennzahlen(enrollment, -1)
+        pl.datum = pl_datum
+        pl.note = pl_dict["note"]
+        logger.info(
+            "Prüfungsleistungen für Enrollment %s geändert: PL-ID=%s",
+            enrollment.id,
+            pl.id,
+        )
+        enrollment.aktualisiere_status()
+        self.student.aendere_kennzahlen(enrollment, 1)
+        self.db.commit_or_rollback(action="change_pl")
 
+    @operation
     def change_email(self, value: str) -> None:
         """Weist dem Student eine neue Email-Adresse zu und committet.
 
@@ -1010,9 +1427,10 @@ class Controller:
             logger.warning("Nicht eingeloggt: change_email aufgerufen.")
             raise RuntimeError("Nicht eingeloggt")
         self.student.email = value
-        self.db.session.commit()
+        self.db.commit_or_rollback(action="change_email")
         logger.info("change_email: s.id=%s, email=%s", self.student.id, value)
 
+    @operation
     def change_password(self, value: str) -> None:
         """Weist dem Student ein neues Passwort zu und committet.
 
@@ -1025,9 +1443,10 @@ class Controller:
             logger.warning("Nicht eingeloggt: change_password aufgerufen.")
             raise RuntimeError("Nicht eingeloggt")
         self.student.password = value
-        self.db.session.commit()
+        self.db.commit_or_rollback(action="change_password")
         logger.info("change_password: s.id=%s", self.student.id)
 
+    @operation
     def change_name(self, value: str) -> None:
         """Weist dem Student einen neuen Namen zu und committet.
 
@@ -1040,9 +1459,10 @@ class Controller:
             logger.warning("Nicht eingeloggt: change_name aufgerufen.")
             raise RuntimeError("Nicht eingeloggt")
         self.student.name = value
-        self.db.session.commit()
+        self.db.commit_or_rollback(action="change_name")
         logger.info("change_name: s.id=%s, name=%s", self.student.id, value)
 
+    @operation
     def change_matrikelnummer(self, value: str) -> None:
         """Weist dem Student eine neue Matrikelnummer zu und committet.
 
@@ -1055,11 +1475,12 @@ class Controller:
             logger.warning("Nicht eingeloggt: change_matrikelnummer aufgerufen.")
             raise RuntimeError("Nicht eingeloggt")
         self.student.matrikelnummer = value
-        self.db.session.commit()
+        self.db.commit_or_rollback(action="change_matrikelnummer")
         logger.info("changed_matrikelnummer: s.id=%s, m.nr=%s", self.student.id, value)
 
+    @operation
     def change_semester_anzahl(self, value: int) -> None:
-        """Weist dem Student eine neue Semesteranzahl zu, löscht alte und erzeugt neue Semester. Ein Commit wird durchgeführt.
+        """Weist dem Student eine neue Semesteranzahl zu und gleicht die Semester ab. Ein Commit wird durchgeführt.
 
         Args:
             value (int): Neue Semesteranzahl.
@@ -1069,16 +1490,16 @@ class Controller:
         if not self.student:
             logger.warning("Nicht eingeloggt: change_semester_anzahl aufgerufen.")
             raise RuntimeError("Nicht eingeloggt")
-        self.student.semester_anzahl = value
-        self.student.semester.clear()
-        self.erstelle_semester_fuer_student()
-        self.db.session.commit()
+        with self.db.unit_of_work(action="change_semester_anzahl"):
+            self.student.semester_anzahl = value
+            self.erstelle_semester_fuer_student()
         logger.info(
             "change_semester_anzahl: s.id=%s to %s semester", self.student.id, value
         )
 
+    @operation
     def change_startdatum(self, value: datetime.date) -> None:
-        """Weist dem Student ein neues Studienstartdatum zu, löscht alte und erzeugt neue Semester. Ein Commit wird durchgeführt.
+        """Weist dem Student ein neues Studienstartdatum zu und gleicht die Semester ab. Ein Commit wird durchgeführt.
 
         Args:
             value (datetime.date): Neues Studienstartdatum.
@@ -1088,12 +1509,12 @@ class Controller:
         if not self.student:
             logger.warning("Nicht eingeloggt: change_startdatum aufgerufen.")
             raise RuntimeError("Nicht eingeloggt")
-        self.student.start_datum = value
-        self.student.semester.clear()
-        self.erstelle_semester_fuer_student()
-        self.db.session.commit()
+        with self.db.unit_of_work(action="change_startdatum"):
+            self.student.start_datum = value
+            self.erstelle_semester_fuer_student()
         logger.info("change_startdatum: s.id=%s to %s", self.student.id, value)
 
+    @operation
     def change_gesamt_ects(self, value: int) -> None:
         """Weist dem Studiengang des Studenten eine neue Gesamtanzahl an ECTS Punkten zu und committet.
 
@@ -1106,9 +1527,10 @@ class Controller:
             logger.warning("Nicht eingeloggt: change_gesamt_ects aufgerufen.")
             raise RuntimeError("Nicht eingeloggt")
         self.student.studiengang.gesamt_ects_punkte = value
-        self.db.session.commit()
+        self.db.commit_or_rollback(action="change_gesamt_ects")
         logger.info("change_gesamt_ects: s.id=%s to %s", self.student.id, value)
 
+    @operation
     def change_modul_anzahl(self, value: int) -> None:
         """Weist dem Student eine neue Anzahl an Modulen zu und committet.
 
@@ -1121,9 +1543,10 @@ class Controller:
             logger.warning("Nicht eingeloggt: change_modul_anzahl aufgerufen.")
             raise RuntimeError("Nicht eingeloggt")
         self.student.modul_anzahl = value
-        self.db.session.commit()
+        self.db.commit_or_rollback(action="change_modul_anzahl")
         logger.info("change_modul_anzahl: s.id=%s to %s", self.student.id, value)
 
+    @operation
     def change_hochschule(self, hochschul_id: int, hochschul_name: str) -> None:
         """Weist dem Student eine neue Hochschule zu und committet.
 
@@ -1143,13 +1566,14 @@ class Controller:
             "hochschulname": hochschul_name,
             "studiengang_id": self.student.studiengang_id,
         }
-        self.add_hochschule_zu_student(cache=cache)
-        self.change_studiengang(value=self.student.studiengang.name)
-        self.db.session.commit()
+        with self.db.unit_of_work(action="change_hochschule"):
+            self.add_hochschule_zu_student(cache=cache)
+            self.change_studiengang(value=self.student.studiengang.name)
         logger.info(
             "change_hochschule: s.id=%s to hs.id=%s", self.student.id, hochschul_id
         )
 
+    @operation
     def change_studiengang(self, value: str) -> None:
         """Weist dem Student einen neuen Studiengang zu und committet.
 
@@ -1166,31 +1590,32 @@ class Controller:
         if not self.student:
             logger.warning("Nicht eingeloggt: change_studiengang aufgerufen.")
             raise RuntimeError("Nicht eingeloggt")
-        studiengang = [
-            studiengang
-            for studiengang in self.student.hochschule.studiengaenge
-            if studiengang.name.lower() == value.lower()
-        ]
-        self.student.enrollments.clear()
-        if studiengang:
-            self.student.studiengang = studiengang[0]
-        else:
-            studiengang = self.erstelle_studiengang(
-                value,
-                self.student.studiengang.gesamt_ects_punkte,
-            )
-            for k, v in studiengang.items():
-                neu_cache = {
-                    "hochschulid": self.student.hochschule_id,
-                    "hochschulname": self.student.hochschule.name,
-                    "studiengang_id": k,
-                }
-                self.add_studiengang_zu_hochschule(cache=neu_cache)
-
-                self.add_studiengang_zu_student(cache=neu_cache)
-        self.db.session.commit()
+        studiengang = self.db.lade_studiengang_mit_name(
+            self.student.hochschule_id, value
+        )
+        with self.db.unit_of_work(action="change_studiengang"):
+            self.db.loesche_enrollments(self.student)
+            self._baue_indizes()
+            self.student.setze_kennzahlen_zurueck()
+            if studiengang:
+                self.student.studiengang = studiengang
+            else:
+                neu = self.erstelle_studiengang(
+                    value,
+                    self.student.studiengang.gesamt_ects_punkte,
+                )
+                for k, v in neu.items():
+                    neu_cache = {
+                        "hochschulid": self.student.hochschule_id,
+                        "hochschulname": self.student.hochschule.name,
+                        "studiengang_id": k,
+                    }
+                    self.add_studiengang_zu_hochschule(cache=neu_cache)
+
+                    self.add_studiengang_zu_student(cache=neu_cache)
         logger.info("change_studiengang: s.id=%s to sg=%s", self.student.id, value)
 
+    @operation
     def change_zieldatum(self, value: datetime.date) -> None:
         """Weist dem Student ein neues Studienzieldatum zu und committet.
 
@@ -1203,9 +1628,10 @@ class Controller:
             logger.warning("Nicht eingeloggt: change_zieldatum aufgerufen.")
             raise RuntimeError("Nicht eingeloggt")
         self.student.ziel_datum = value
-        self.db.session.commit()
+        self.db.commit_or_rollback(action="change_zieldatum")
         logger.info("change_zieldatum: s.id=%s to %s", self.student.id, value)
 
+    @operation
     def change_zielnote(self, value: float) -> None:
         """Weist dem Student eine neue Studienzielnote zu und committet.
 
@@ -1218,9 +1644,10 @@ class Controller:
             logger.warning("Nicht eingeloggt: change_zielnote aufgerufen.")
             raise RuntimeError("Nicht eingeloggt")
         self.student.ziel_note = value
-        self.db.session.commit()
+        self.db.commit_or_rollback(action="change_zielnote")
         logger.info("change_zielnote: s.id=%s to %s", self.student.id, value)
 
+    @operation
     def change_exmatrikulationsdatum(self, value: datetime.date | None) -> None:
         """Weist dem Student ein (neues) Exmatrikulationsdatum zu oder setzt es auf ``None``. Ein Commit wird durchgeführt.
 
@@ -1233,11 +1660,12 @@ class Controller:
             logger.warning("Nicht eingeloggt: change_exmatrikulationsdatum aufgerufen.")
             raise RuntimeError("Nicht eingeloggt")
         self.student.exmatrikulationsdatum = value
-        self.db.session.commit()
+        self.db.commit_or_rollback(action="change_exmatrikulationsdatum")
         logger.info(
             "change_exmatrikulationsdatum: s.id=%s to %s", self.student.id, value
         )
 
+    @operation
     def logout(self) -> None:
         """Loggt den aktuellen Student aus, setzt die Datenbank-Session zurück und erzeugt eine neue Session.
 
@@ -1258,6 +1686,7 @@ class Controller:
         except Exception:
             logger.exception("Session close fehlgeschlagen.")
         self.student = None
+        self._verwerfe_indizes()
         try:
             self.db.recreate_session()
         except Exception:
@@ -1266,6 +1695,7 @@ class Controller:
                 "Es konnte keine neue Datenbank-Session eröffnet werden."
             )
 
+    @operation
     def delete_student(self) -> None:
         """Löscht den Account des Studenten und committet. Ruft Logout auf.
 
@@ -1276,8 +1706,7 @@ class Controller:
             raise RuntimeError("Nicht eingeloggt")
         logger.info("delete_student: %s - %s", self.student.id, self.student.email)
         try:
-            self.db.session.delete(self.student)
-            self.db.session.commit()
+            self.db.loesche_student(self.student)
         except Exception:
             logger.exception("Student löschen fehlgeschlagen.")
             raise RuntimeError("Student löschen fehlgeschlagen.")
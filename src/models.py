@@ -1,11 +1,11 @@
 """SQLAlchemy ORM-Modelle für das Dashboard.
 
 Enthält Entity-Klassen (Student, Hochschule, Studiengang, Modul, Kurs, Enrollment,
-Pruefungsleistung, Semester) sowie Enums für Statuswerte.
+Pruefungsleistung, Semester), die technische Tabelle Metadaten sowie Enums für Statuswerte.
 """
 
 from __future__ import annotations
-from sqlalchemy import Integer, String, Float, Date, ForeignKey
+from sqlalchemy import Integer, String, Float, Date, ForeignKey, Index, text
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from sqlalchemy.ext.hybrid import hybrid_property
@@ -13,10 +13,30 @@ from typing import List, Optional, NoReturn
 from enum import Enum, auto
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError
+from src.statistik import berechne_statistik, packe_versuche
 import datetime
+import unicodedata
 
 ph = PasswordHasher()
 
+_UMLAUTE = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss"})
+
+
+def normalisiere_name(name: str) -> str:
+    """Normalisiert einen Namen zum Vergleichsschlüssel.
+
+    Unicode-Normalform NFKC, ``casefold``, Umlaute und ß ausgeschrieben, Leerraum
+    zusammengefasst: ``" Wirtschafts-Ökonomie  B.A."`` -> ``"wirtschafts-oekonomie b.a."``.
+
+    Args:
+        name: Name, z. B. eines Studiengangs.
+
+    Returns:
+        str: Normalisierter Schlüssel.
+    """
+    name = unicodedata.normalize("NFKC", name).casefold().translate(_UMLAUTE)
+    return " ".join(name.split())
+
 
 class Base(DeclarativeBase):
     """SQLAlchemy Declarative Base für alle ORM-Modelle."""
@@ -56,10 +76,18 @@ class Student(Base):
         ziel_datum (datetime.date): Wunsch-Abschlussdatum.
         ziel_note (float): gewünschte Durchschnittsnote.
         exmatrikulationsdatum (Optional[datetime.date] = None): Exmatrikulationsdatum, falls vorhanden.
+        erarbeitete_ects (int): ECTS-Punkte abgeschlossener Module (denormalisierte Kennzahl, nur lesbar).
+        notendurchschnitt (float | None): Durchschnitt der Modulnoten (denormalisierte Kennzahl, nur lesbar).
     """
 
     __tablename__ = "student"
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    # Optimistische Sperre: UPDATE und DELETE prüfen die beim Laden gelesene Version,
+    # eine zwischenzeitliche Änderung durch einen anderen Prozess führt zu ``StaleDataError``.
+    _version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default=text("1")
+    )
+    __mapper_args__ = {"version_id_col": _version}
     _name: Mapped[str] = mapped_column(String)
     _matrikelnummer: Mapped[str] = mapped_column(String)
     _email: Mapped[str] = mapped_column(String, unique=True)
@@ -79,9 +107,12 @@ class Student(Base):
     studiengang: Mapped[Studiengang] = relationship(back_populates="studenten")
 
     _semester_anzahl: Mapped[int] = mapped_column(Integer)
+    # passive_deletes: beim Löschen des Students löscht SQLite die abhängigen Zeilen
+    # (ON DELETE CASCADE), die ORM lädt dafür keine Collections nach.
     semester: Mapped[List["Semester"]] = relationship(
         back_populates="student",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     _modul_anzahl: Mapped[int] = mapped_column(Integer)
@@ -89,6 +120,32 @@ class Student(Base):
     enrollments: Mapped[List["Enrollment"]] = relationship(
         back_populates="student",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+    # Denormalisierte Kennzahlen über alle Enrollments, werden bei jeder Änderung
+    # inkrementell gepflegt. NULL: unbekannt (z. B. nach Migration), wird neu berechnet.
+    KENNZAHL_SPALTEN = (
+        "_erarbeitete_ects",
+        "_notensumme_hundertstel",
+        "_anzahl_benotet",
+        "_anzahl_abgeschlossen",
+        "_anzahl_in_bearbeitung",
+        "_anzahl_nicht_bestanden",
+    )
+    _erarbeitete_ects: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    # Summe der Modulnoten abgeschlossener Enrollments in Hundertsteln (exakt, ohne Rundungsfehler)
+    _notensumme_hundertstel: Mapped[Optional[int]] = mapped_column(
+        Integer, nullable=True
+    )
+    # Anzahl abgeschlossener Enrollments mit Modulnote (Nenner des Notendurchschnitts)
+    _anzahl_benotet: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    _anzahl_abgeschlossen: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    _anzahl_in_bearbeitung: Mapped[Optional[int]] = mapped_column(
+        Integer, nullable=True
+    )
+    _anzahl_nicht_bestanden: Mapped[Optional[int]] = mapped_column(
+        Integer, nullable=True
     )
 
     def __init__(
@@ -138,6 +195,7 @@ class Student(Base):
             self.studiengang = studiengang
         if exmatrikulationsdatum:
             self.exmatrikulationsdatum = exmatrikulationsdatum
+        self.setze_kennzahlen_zurueck()
 
     def __repr__(self) -> str:
         return f"Student: {self.name}"
@@ -241,6 +299,113 @@ class Student(Base):
     def exmatrikulationsdatum(self, value: datetime.date | None) -> None:
         self._exmatrikulationsdatum = value
 
+    # --- Kennzahlen ---
+    @property
+    def kennzahlen_gueltig(self) -> bool:
+        """``True``, wenn alle denormalisierten Kennzahlen gesetzt sind."""
+        return None not in self.kennzahlen().values()
+
+    def kennzahlen(self) -> dict[str, int | None]:
+        """Gibt die gespeicherten Kennzahlen zurück (Spaltenname -> Wert)."""
+        return {spalte: getattr(self, spalte) for spalte in self.KENNZAHL_SPALTEN}
+
+    def setze_kennzahlen_zurueck(self, wert: int | None = 0) -> None:
+        """Setzt alle Kennzahlen auf 0 (Student ohne Enrollments).
+
+        Args:
+            wert (int | None): ``None`` markiert die Kennzahlen als unbekannt.
+        """
+        for spalte in self.KENNZAHL_SPALTEN:
+            setattr(self, spalte, wert)
+
+    def uebernehme_kennzahlen(self, kennzahlen: dict) -> None:
+        """Übernimmt extern (per SQL) berechnete Kennzahlen.
+
+        Args:
+            kennzahlen (dict): Ergebnis von ``DatabaseManager.lade_dashboard_kennzahlen``.
+        """
+        self._erarbeitete_ects = kennzahlen["erarbeitete_ects"]
+        self._notensumme_hundertstel = kennzahlen["notensumme_hundertstel"]
+        self._anzahl_benotet = kennzahlen["anzahl_benotet"]
+        self._anzahl_abgeschlossen = kennzahlen["abgeschlossen"]
+        self._anzahl_in_bearbeitung = kennzahlen["in_bearbeitung"]
+        self._anzahl_nicht_bestanden = kennzahlen["nicht_bestanden"]
+
+    def berechne_kennzahlen_neu(self) -> None:
+        """Berechnet alle Kennzahlen aus den Enrollments neu (``src.statistik``)."""
+        statistik = berechne_statistik(packe_versuche(self.enrollments))
+        anzahl = statistik.anzahl_je_status
+        self._erarbeitete_ects = statistik.erarbeitete_ects
+        self._notensumme_hundertstel = statistik.notensumme_hundertstel
+        self._anzahl_benotet = statistik.anzahl_benotet
+        self._anzahl_abgeschlossen = anzahl[EnrollmentStatus.ABGESCHLOSSEN.name]
+        self._anzahl_in_bearbeitung = anzahl[EnrollmentStatus.IN_BEARBEITUNG.name]
+        self._anzahl_nicht_bestanden = anzahl[EnrollmentStatus.NICHT_BESTANDEN.name]
+
+    def aendere_kennzahlen(self, enrollment: Enrollment, faktor: int) -> None:
+        """Addiert (``faktor=1``) oder entfernt (``faktor=-1``) den Beitrag eines Enrollments.
+
+        Vor einer Änderung am Enrollment wird der alte Beitrag entfernt, danach der neue addiert.
+        Sind die Kennzahlen ungültig, passiert nichts, sie werden später neu berechnet.
+
+        Args:
+            enrollment (Enrollment): Enrollment mit aktuellem Status.
+            faktor (int): 1 oder -1.
+        """
+        if not self.kennzahlen_gueltig:
+            return
+        if enrollment.status == EnrollmentStatus.IN_BEARBEITUNG:
+            self._anzahl_in_bearbeitung += faktor
+        elif enrollment.status == EnrollmentStatus.NICHT_BESTANDEN:
+            self._anzahl_nicht_bestanden += faktor
+        elif enrollment.status == EnrollmentStatus.ABGESCHLOSSEN:
+            self._anzahl_abgeschlossen += faktor
+            self._erarbeitete_ects += faktor * enrollment.modul.ects_punkte
+            note = enrollment.berechne_enrollment_note()
+            if note is not None:
+                self._anzahl_benotet += faktor
+                self._notensumme_hundertstel += faktor * round(note * 100)
+
+    def _stelle_kennzahlen_sicher(self) -> None:
+        """Berechnet die Kennzahlen neu, falls sie ungültig sind."""
+        if not self.kennzahlen_gueltig:
+            self.berechne_kennzahlen_neu()
+
+    def anzahl_enrollments_mit_status(self, status: EnrollmentStatus) -> int:
+        """Anzahl der Enrollments mit dem angegebenen Status (aus den Kennzahlen).
+
+        Args:
+            status (EnrollmentStatus): Status der Enrollments.
+
+        Returns:
+            int: Anzahl der Enrollments.
+        """
+        self._stelle_kennzahlen_sicher()
+        if status == EnrollmentStatus.ABGESCHLOSSEN:
+            return self._anzahl_abgeschlossen  # type: ignore[return-value]
+        if status == EnrollmentStatus.NICHT_BESTANDEN:
+            return self._anzahl_nicht_bestanden  # type: ignore[return-value]
+        return self._anzahl_in_bearbeitung  # type: ignore[return-value]
+
+    @property
+    def erarbeitete_ects(self) -> int:
+        """ECTS-Punkte aller abgeschlossenen Enrollments (aus den Kennzahlen)."""
+        self._stelle_kennzahlen_sicher()
+        return self._erarbeitete_ects  # type: ignore[return-value]
+
+    @property
+    def notendurchschnitt(self) -> float | None:
+        """Durchschnitt der Modulnoten abgeschlossener Enrollments, gerundet auf 2 Nachkommastellen.
+
+        ``None``, falls noch kein Modul mit Note abgeschlossen wurde.
+        """
+        self._stelle_kennzahlen_sicher()
+        if not self._anzahl_benotet:
+            return None
+        return float(
+            round(self._notensumme_hundertstel / 100 / self._anzahl_benotet, 2)  # type: ignore[operator]
+        )
+
 
 class Hochschule(Base):
     """Repräsentiert eine Hochschule.
@@ -274,15 +439,26 @@ class Studiengang(Base):
 
     Properties:
         name (str): Studiengangsname.
+        name_key (str): Normalisierter Name (``normalisiere_name``), eindeutig je Hochschule.
         gesamt_ects_punkte (int): Anzahl der ECTS-Punkte.
     """
 
     __tablename__ = "studiengang"
+    # Suche nach Namen über den Index statt lower()-Scan, Duplikate je Hochschule ausgeschlossen
+    __table_args__ = (
+        Index(
+            "ux_studiengang_hochschule_id_name_key",
+            "hochschule_id",
+            "_name_key",
+            unique=True,
+        ),
+    )
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     _name: Mapped[str] = mapped_column(String)
+    _name_key: Mapped[Optional[str]] = mapped_column(String)
     _gesamt_ects_punkte: Mapped[int] = mapped_column(Integer)
 
-    hochschule_id = mapped_column(ForeignKey("hochschule.id"))
+    hochschule_id = mapped_column(ForeignKey("hochschule.id"), index=True)
     hochschule: Mapped[Hochschule] = relationship(back_populates="studiengaenge")
 
     module: Mapped[List[Modul]] = relationship(back_populates="studiengang")
@@ -296,6 +472,11 @@ class Studiengang(Base):
     @name.setter
     def name(self, value: str) -> None:
         self._name = value
+        self._name_key = normalisiere_name(value)
+
+    @hybrid_property
+    def name_key(self) -> str | None:
+        return self._name_key
 
     @hybrid_property
     def gesamt_ects_punkte(self) -> int:  # type: ignore[reportRedeclaration]
@@ -321,7 +502,7 @@ class Modul(Base):
     _modulcode: Mapped[str] = mapped_column(String, unique=True)
     _ects_punkte: Mapped[int] = mapped_column(Integer)
 
-    studiengang_id = mapped_column(ForeignKey("studiengang.id"))
+    studiengang_id = mapped_column(ForeignKey("studiengang.id"), index=True)
     studiengang: Mapped[Studiengang] = relationship(back_populates="module")
 
     enrollments: Mapped[List["Enrollment"]] = relationship(back_populates="modul")
@@ -364,7 +545,7 @@ class Kurs(Base):
     _name: Mapped[str] = mapped_column(String)
     _nummer: Mapped[str] = mapped_column(String, unique=True)
 
-    modul_id = mapped_column(ForeignKey("modul.id"))
+    modul_id = mapped_column(ForeignKey("modul.id"), index=True)
     modul: Mapped[Modul] = relationship(back_populates="kurse")
 
     @hybrid_property
@@ -396,21 +577,26 @@ class Enrollment(Base):
 
     __tablename__ = "enrollment"
     id: Mapped[int] = mapped_column(Integer, primary_key=True, unique=True)
+    # Optimistische Sperre (siehe ``Student._version``)
+    _version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default=text("1")
+    )
+    __mapper_args__ = {"version_id_col": _version}
     _einschreibe_datum: Mapped[datetime.date] = mapped_column(Date)
     _end_datum: Mapped[Optional[datetime.date]] = mapped_column(
         Date, nullable=True, default=None
     )
     _status: Mapped[EnrollmentStatus] = mapped_column(SQLEnum(EnrollmentStatus))
 
-    student_id = mapped_column(ForeignKey("student.id"))
+    student_id = mapped_column(ForeignKey("student.id", ondelete="CASCADE"), index=True)
     student: Mapped["Student"] = relationship(back_populates="enrollments")
 
-    modul_id = mapped_column(ForeignKey("modul.id"))
+    modul_id = mapped_column(ForeignKey("modul.id"), index=True)
     modul: Mapped["Modul"] = relationship(back_populates="enrollments")
 
     _anzahl_pruefungsleistungen: Mapped[int] = mapped_column(Integer)
     pruefungsleistungen: Mapped[List[Pruefungsleistung]] = relationship(
-        back_populates="enrollment", cascade="all, delete-orphan"
+        back_populates="enrollment", cascade="all, delete-orphan", passive_deletes=True
     )
 
     @hybrid_property
@@ -551,6 +737,11 @@ class Pruefungsleistung(Base):
 
     __tablename__ = "pruefungsleistung"
     id: Mapped[int] = mapped_column(Integer, primary_key=True, nullable=False)
+    # Optimistische Sperre (siehe ``Student._version``)
+    _version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default=text("1")
+    )
+    __mapper_args__ = {"version_id_col": _version}
     # Teilpruefung nr. von insgesamt enrollment.anzahl_pruefungsleistungen
     _teilpruefung: Mapped[int] = mapped_column(Integer)
     # bei mehreren Teilprüfungen -> Gewicht pro note
@@ -561,7 +752,7 @@ class Pruefungsleistung(Base):
     _datum: Mapped[Optional[datetime.date]] = mapped_column(Date, nullable=True)
 
     enrollment_id: Mapped[int] = mapped_column(
-        ForeignKey("enrollment.id"), nullable=False
+        ForeignKey("enrollment.id", ondelete="CASCADE"), nullable=False, index=True
     )
     enrollment: Mapped[Enrollment] = relationship(back_populates="pruefungsleistungen")
 
@@ -640,7 +831,7 @@ class Semester(Base):
     _beginn: Mapped[datetime.date] = mapped_column(Date)
     _ende: Mapped[datetime.date] = mapped_column(Date)
 
-    student_id = mapped_column(ForeignKey("student.id"))
+    student_id = mapped_column(ForeignKey("student.id", ondelete="CASCADE"), index=True)
     student: Mapped["Student"] = relationship(back_populates="semester")
 
     @hybrid_property
@@ -691,3 +882,25 @@ class Semester(Base):
             return SemesterStatus.AKTUELL
         else:
             return SemesterStatus.ZURUECKLIEGEND
+
+
+class Metadaten(Base):
+    """Schlüssel-Wert-Speicher für technische Metadaten der Datenbank.
+
+    Wird z. B. für die Seed-Checksumme der Hochschulen genutzt.
+
+    Properties:
+        wert (str): Gespeicherter Wert zum Schlüssel.
+    """
+
+    __tablename__ = "metadaten"
+    schluessel: Mapped[str] = mapped_column(String, primary_key=True)
+    _wert: Mapped[str] = mapped_column(String)
+
+    @hybrid_property
+    def wert(self) -> str:  # type: ignore[reportRedeclaration]
+        return self._wert
+
+    @wert.setter
+    def wert(self, value: str) -> None:
+        self._wert = value
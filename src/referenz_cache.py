@@ -0,0 +1,118 @@
+"""LRU-Cache für Stammdaten (Hochschule, Studiengang, Modul, Kurs).
+
+Der Cache hängt an ``Session.info`` und lebt damit so lange wie die Session: bei der
+langlebigen Session über alle Operationen bis zum Logout, bei ``pro_operation`` für eine
+Operation. Die gecachten Objekte gehören so immer zur aktuellen Session. Nach einem
+Rollback wird der Cache verworfen, da zurückgerollte Objekte sonst weiter ausgeliefert würden.
+"""
+
+from __future__ import annotations
+from sqlalchemy.orm import Session
+
+from collections import OrderedDict
+import threading
+from typing import Any, Hashable
+
+# Schlüssel des Caches in ``Session.info``
+REFERENZ_CACHE_SCHLUESSEL = "referenz_cache"
+
+
+class ReferenzCache:
+    """Begrenzter LRU-Cache für Stammdaten-Objekte einer Session.
+
+    Ein Objekt wird unter mehreren Schlüsseln abgelegt, z. B. ``(Kurs, "id", 3)`` und
+    ``(Kurs, "nummer", "K1")``. Nicht gefundene Objekte (``None``) werden nicht gecacht.
+
+    Attribute:
+        max_eintraege (int): Maximale Anzahl an Schlüsseln, danach wird der älteste verdrängt.
+        treffer (int): Anzahl der Zugriffe, die aus dem Cache bedient wurden.
+        fehlzugriffe (int): Anzahl der Zugriffe, die eine Abfrage erforderten.
+    """
+
+    def __init__(self, max_eintraege: int = 256) -> None:
+        """Initialisiert einen leeren Cache.
+
+        Args:
+            max_eintraege (int): Maximale Anzahl an Schlüsseln, default: 256.
+        """
+        self.max_eintraege = max_eintraege
+        self.treffer = 0
+        self.fehlzugriffe = 0
+        self._eintraege: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def hole(self, schluessel: Hashable) -> Any | None:
+        """Gibt das Objekt zu ``schluessel`` zurück und zählt Treffer/Fehlzugriff.
+
+        Args:
+            schluessel: Cache-Schlüssel, z. B. ``(Modul, "modulcode", "M1")``.
+
+        Returns:
+            Gecachtes Objekt oder ``None``.
+        """
+        with self._lock:
+            objekt = self._eintraege.get(schluessel)
+            if objekt is None:
+                self.fehlzugriffe += 1
+                return None
+            self._eintraege.move_to_end(schluessel)
+            self.treffer += 1
+            return objekt
+
+    def merke(self, objekt: Any, *schluessel: Hashable) -> None:
+        """Legt ``objekt`` unter allen ``schluessel`` ab und verdrängt ggf. die ältesten Einträge.
+
+        Args:
+            objekt: Persistiertes ORM-Objekt.
+            *schluessel: Schlüssel, unter denen das Objekt gefunden werden soll.
+        """
+        with self._lock:
+            for s in schluessel:
+                self._eintraege[s] = objekt
+                self._eintraege.move_to_end(s)
+            while len(self._eintraege) > self.max_eintraege:
+                self._eintraege.popitem(last=False)
+
+    def leeren(self) -> None:
+        """Verwirft alle Einträge, die Zähler bleiben erhalten."""
+        with self._lock:
+            self._eintraege.clear()
+
+    def __len__(self) -> int:
+        return len(self._eintraege)
+
+    def statistik(self) -> dict:
+        """Gibt Treffer, Fehlzugriffe, Trefferquote und Anzahl der Einträge zurück."""
+        with self._lock:
+            zugriffe = self.treffer + self.fehlzugriffe
+            return {
+                "treffer": self.treffer,
+                "fehlzugriffe": self.fehlzugriffe,
+                "trefferquote": round(self.treffer / zugriffe, 3) if zugriffe else 0.0,
+                "eintraege": len(self._eintraege),
+            }
+
+
+def referenz_cache(session: Session, max_eintraege: int = 256) -> ReferenzCache:
+    """Gibt den Cache einer Session zurück und legt ihn bei Bedarf an.
+
+    Args:
+        session: Session, an deren ``info`` der Cache hängt.
+        max_eintraege: Größe eines neu angelegten Caches.
+
+    Returns:
+        ReferenzCache der Session.
+    """
+    cache = session.info.get(REFERENZ_CACHE_SCHLUESSEL)
+    if cache is None:
+        cache = session.info.setdefault(
+            REFERENZ_CACHE_SCHLUESSEL, ReferenzCache(max_eintraege)
+        )
+    return cache
+
+
+def leere_referenz_cache(session: Session, previous_transaction=None) -> None:
+    """Event-Handler für ``after_soft_rollback``: verwirft den Cache der Session."""
+    cache = session.info.get(REFERENZ_CACHE_SCHLUESSEL)
+    if cache is not None:
+        cache.leeren()
@@ -0,0 +1,225 @@
+"""Write-Behind-Warteschlange: Schreiboperationen in einem einzelnen Hintergrund-Thread.
+
+Die Oberfläche reiht Änderungen (``Controller.change_*``, ``erstelle_enrollment``, ...) über
+``einreihen`` ein und kehrt sofort zurück; der Schreib-Thread ``db-schreiber`` führt sie in
+der Reihenfolge des Einreihens aus. Das ``fsync`` von ``session.commit()`` blockiert damit
+nie die Tk-Hauptschleife.
+
+Aufträge mit demselben ``schluessel``, deren Ausführung noch nicht begonnen hat, werden
+zusammengefasst: Nur der zuletzt eingereihte Auftrag wird ausgeführt (z. B. mehrfaches
+Speichern desselben Feldes).
+
+Erfolg und Fehler werden nicht im Schreib-Thread gemeldet (Tk ist nicht thread-sicher),
+sondern in einer Rückmeldungs-Queue gesammelt und von ``melde_rueckmeldungen`` im
+aufrufenden Thread ausgeführt, in der Oberfläche getaktet über ``after()``
+(``starte_mit_after``).
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future
+import logging
+import queue
+import threading
+from typing import Any, Callable, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+class _Auftrag:
+    """Eingereihte Schreiboperation mit Rückmeldungen und ``Future``."""
+
+    def __init__(
+        self,
+        funktion: Callable[..., Any],
+        args: tuple,
+        kwargs: dict,
+        schluessel: Hashable | None,
+        bei_erfolg: Callable[[Any], None] | None,
+        bei_fehler: Callable[[BaseException], None] | None,
+    ) -> None:
+        self.funktion = funktion
+        self.args = args
+        self.kwargs = kwargs
+        self.schluessel = schluessel
+        self.bei_erfolg = bei_erfolg
+        self.bei_fehler = bei_fehler
+        self.futures: list[Future] = [Future()]
+
+    @property
+    def name(self) -> str:
+        return getattr(self.funktion, "__name__", repr(self.funktion))
+
+
+class SchreibWarteschlange:
+    """Führt Schreiboperationen nacheinander in einem Daemon-Thread aus.
+
+    Attribute:
+        ausgefuehrt (int): Anzahl ausgeführter Aufträge.
+        zusammengefasst (int): Anzahl durch einen neueren Auftrag ersetzter Aufträge.
+    """
+
+    def __init__(self) -> None:
+        self._auftraege: deque[_Auftrag] = deque()
+        self._bedingung = threading.Condition()
+        self._laufend: _Auftrag | None = None
+        self._stopp = False
+        self._rueckmeldungen: queue.SimpleQueue[Callable[[], None]] = (
+            queue.SimpleQueue()
+        )
+        self._tk_stopp = threading.Event()
+        self.ausgefuehrt = 0
+        self.zusammengefasst = 0
+        self._thread = threading.Thread(
+            target=self._schleife, name="db-schreiber", daemon=True
+        )
+        self._thread.start()
+
+    def einreihen(
+        self,
+        funktion: Callable[..., Any],
+        *args: Any,
+        schluessel: Hashable | None = None,
+        bei_erfolg: Callable[[Any], None] | None = None,
+        bei_fehler: Callable[[BaseException], None] | None = None,
+        **kwargs: Any,
+    ) -> Future:
+        """Reiht ``funktion(*args, **kwargs)`` zur Ausführung im Schreib-Thread ein.
+
+        Ein noch nicht begonnener Auftrag mit demselben ``schluessel`` wird ersetzt, der
+        neue Auftrag rückt ans Ende der Warteschlange. Das ``Future`` des ersetzten Auftrags
+        erhält das Ergebnis des neuen, seine Rückmeldungen entfallen.
+
+        Args:
+            funktion: Auszuführende Schreiboperation (z. B. ``controller.change_name``).
+            schluessel: Schlüssel zum Zusammenfassen, ``None``: nie zusammenfassen.
+            bei_erfolg: Wird mit dem Rückgabewert in ``melde_rueckmeldungen`` aufgerufen.
+            bei_fehler: Wird mit der Exception in ``melde_rueckmeldungen`` aufgerufen.
+
+        Returns:
+            Future mit dem Rückgabewert von ``funktion``.
+
+        Raises:
+            RuntimeError: Wenn die Warteschlange gestoppt wurde.
+        """
+        auftrag = _Auftrag(funktion, args, kwargs, schluessel, bei_erfolg, bei_fehler)
+        with self._bedingung:
+            if self._stopp:
+                raise RuntimeError("Schreib-Warteschlange ist gestoppt.")
+            if schluessel is not None:
+                for alt in list(self._auftraege):
+                    if alt.schluessel == schluessel:
+                        self._auftraege.remove(alt)
+                        auftrag.futures[:0] = alt.futures
+                        self.zusammengefasst += 1
+                        logger.debug("Auftrag %s zusammengefasst.", alt.name)
+            self._auftraege.append(auftrag)
+            self._bedingung.notify_all()
+        return auftrag.futures[-1]
+
+    def _schleife(self) -> None:
+        while True:
+            with self._bedingung:
+                while not self._auftraege and not self._stopp:
+                    self._bedingung.wait()
+                if not self._auftraege:
+                    return
+                auftrag = self._laufend = self._auftraege.popleft()
+            self._fuehre_aus(auftrag)
+            with self._bedingung:
+                self._laufend = None
+                self.ausgefuehrt += 1
+                self._bedingung.notify_all()
+
+    def _fuehre_aus(self, auftrag: _Auftrag) -> None:
+        bei_erfolg, bei_fehler = auftrag.bei_erfolg, auftrag.bei_fehler
+        # abgebrochene Futures (``Future.cancel``) erhalten kein Ergebnis
+        auftrag.futures = [
+            future
+            for future in auftrag.futures
+            if future.set_running_or_notify_cancel()
+        ]
+        if not auftrag.futures:
+            return
+        try:
+            ergebnis = auftrag.funktion(*auftrag.args, **auftrag.kwargs)
+        except Exception as e:
+            logger.warning("Schreiboperation %s fehlgeschlagen: %s", auftrag.name, e)
+            for future in auftrag.futures:
+                future.set_exception(e)
+            if bei_fehler is not None:
+                self._rueckmeldungen.put(lambda fehler=e: bei_fehler(fehler))
+            return
+        for future in auftrag.futures:
+            future.set_result(ergebnis)
+        if bei_erfolg is not None:
+            self._rueckmeldungen.put(lambda: bei_erfolg(ergebnis))
+
+    @property
+    def ausstehend(self) -> int:
+        """Anzahl eingereihter und laufender Aufträge."""
+        with self._bedingung:
+            return len(self._auftraege) + (self._laufend is not None)
+
+    def warte(self, timeout: float | None = None) -> bool:
+        """Blockiert, bis alle eingereihten Aufträge ausgeführt sind.
+
+        Wird vor Logout, Accountlöschung und Programmende aufgerufen.
+
+        Args:
+            timeout: Maximale Wartezeit in Sekunden, ``None``: unbegrenzt.
+
+        Returns:
+            bool: ``True``, wenn die Warteschlange leer ist.
+        """
+        with self._bedingung:
+            return self._bedingung.wait_for(
+                lambda: not self._auftraege and self._laufend is None, timeout
+            )
+
+    def melde_rueckmeldungen(self) -> int:
+        """Führt die angefallenen Rückmeldungen im aufrufenden Thread aus.
+
+        Returns:
+            int: Anzahl ausgeführter Rückmeldungen.
+        """
+        anzahl = 0
+        while True:
+            try:
+                rueckmeldung = self._rueckmeldungen.get_nowait()
+            except queue.Empty:
+                return anzahl
+            try:
+                rueckmeldung()
+            except Exception:
+                logger.exception("Rückmeldung der Schreiboperation fehlgeschlagen.")
+            anzahl += 1
+
+    def starte_mit_after(self, widget, takt_ms: int = 50) -> None:
+        """Meldet Erfolg und Fehler über ``widget.after`` in der Tk-Hauptschleife.
+
+        Args:
+            widget: Tk-Widget (z. B. ``App``).
+            takt_ms: Abstand der Abfragen in Millisekunden.
+        """
+
+        def _takt() -> None:
+            if self._tk_stopp.is_set():
+                return
+            self.melde_rueckmeldungen()
+            widget.after(takt_ms, _takt)
+
+        widget.after(takt_ms, _takt)
+
+    def stoppe(self, timeout: float | None = None) -> None:
+        """Führt die eingereihten Aufträge noch aus und beendet dann den Schreib-Thread.
+
+        Args:
+            timeout: Maximale Wartezeit in Sekunden, ``None``: unbegrenzt.
+        """
+        with self._bedingung:
+            self._stopp = True
+            self._bedingung.notify_all()
+        self._thread.join(timeout)
+        self._tk_stopp.set()
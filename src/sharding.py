@@ -0,0 +1,599 @@
+"""Sharding der Studentendaten auf mehrere SQLite-Dateien.
+
+Stammdaten (Hochschulen, Studiengänge) und technische Metadaten liegen in einer gemeinsamen
+Katalog-Datenbank, alle Daten eines Studenten (Student, Semester, Enrollments,
+Prüfungsleistungen, Module, Kurse) in genau einer Shard-Datei. Ein Router bestimmt beim
+Anlegen eines Accounts den Shard (über einen Hash der E-Mail oder über die Hochschule),
+die Zuordnung E-Mail -> Shard wird im Katalog gespeichert.
+
+Der ``ShardedDatabaseManager`` bietet dieselbe API wie der ``DatabaseManager``: ``login``
+und ``erstelle_account`` des Controllers wählen den Shard über ``lade_student*`` bzw.
+``add_student`` automatisch aus. Auswertungen über alle Shards laufen über eine
+Katalog-Verbindung, an die alle Shard-Dateien mit ``ATTACH`` angehängt werden.
+"""
+
+from __future__ import annotations
+from sqlalchemy import (
+    Column,
+    Connection,
+    Engine,
+    MetaData,
+    String,
+    Table,
+    delete,
+    insert,
+    inspect,
+    select,
+)
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.horizontal_shard import ShardedSession
+from sqlalchemy.orm import ORMExecuteState, Mapper, object_session, sessionmaker
+from src.database import (
+    DatabaseManager,
+    DBTransactionError,
+    SESSION_STRATEGIEN,
+    erstelle_engine,
+    initialisiere_ohne_fremdschluessel,
+)
+from src.backup import BACKUP_PFAD, BackupErgebnis, im_hintergrund, rotiere_snapshots
+from src.wartung import WartungsErgebnis, fuehre_wartung_aus, stelle_auto_vacuum_um
+from src.models import (
+    Base,
+    Enrollment,
+    Hochschule,
+    Metadaten,
+    Student,
+    Studiengang,
+)
+
+from concurrent.futures import Future
+from contextlib import contextmanager
+import datetime
+import hashlib
+import logging
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Iterator
+
+logger = logging.getLogger(__name__)
+
+SHARD_PFAD = Path(__file__).resolve().parent.parent / "data" / "shards"
+
+# Shard-ID der Katalog-Datenbank
+KATALOG = "katalog"
+AKTIVER_SHARD = "aktiver_shard"  # Schlüssel in ``Session.info``
+
+# Modelle, deren Tabellen im Katalog liegen, alle übrigen liegen in den Shards
+KATALOG_MODELLE = (Hochschule, Studiengang, Metadaten)
+
+# Tabellen, die nur im Katalog liegen (Metadaten gibt es je Datei: Schema-Version)
+KATALOG_TABELLEN = {Hochschule.__tablename__, Studiengang.__tablename__}
+
+# Zuordnung E-Mail -> Shard, nur im Katalog vorhanden
+katalog_metadata = MetaData()
+shard_zuordnung = Table(
+    "shard_zuordnung",
+    katalog_metadata,
+    Column("email", String, primary_key=True),
+    Column("shard", String, nullable=False),
+)
+
+
+def _shard_metadata() -> MetaData:
+    """Tabellen einer Shard-Datei: alle Modelle ohne Katalog-Tabellen.
+
+    Fremdschlüssel auf Katalog-Tabellen entfallen, da deren Zeilen in einer anderen Datei
+    liegen und ``PRAGMA foreign_keys=ON`` sie sonst bei jedem INSERT prüfen würde.
+    """
+    metadata = MetaData()
+    for tabelle in Base.metadata.sorted_tables:
+        if tabelle.name in KATALOG_TABELLEN:
+            continue
+        kopie = tabelle.to_metadata(metadata)
+        for fk in list(kopie.foreign_key_constraints):
+            if fk.elements[0].target_fullname.split(".")[0] in KATALOG_TABELLEN:
+                kopie.constraints.discard(fk)
+                for element in fk.elements:
+                    element.parent.foreign_keys.discard(element)
+                    kopie.foreign_keys.discard(element)
+    return metadata
+
+
+shard_metadata = _shard_metadata()
+
+
+class EmailHashRouter:
+    """Verteilt Studenten über einen stabilen Hash der E-Mail-Adresse gleichmäßig auf die Shards."""
+
+    def __init__(self, anzahl_shards: int) -> None:
+        self.anzahl_shards = anzahl_shards
+
+    def shard_fuer(self, email: str, hochschule_id: int | None = None) -> int:
+        """Gibt die Nummer des Shards für ``email`` zurück.
+
+        Args:
+            email: Normalisierte E-Mail-Adresse.
+            hochschule_id: Wird ignoriert.
+
+        Returns:
+            int: Shard-Nummer (0 bis ``anzahl_shards - 1``).
+        """
+        digest = hashlib.sha256(email.lower().encode("utf-8")).digest()
+        return int.from_bytes(digest[:8], "big") % self.anzahl_shards
+
+
+class HochschulRouter:
+    """Legt alle Studenten einer Hochschule in denselben Shard."""
+
+    def __init__(self, anzahl_shards: int) -> None:
+        self.anzahl_shards = anzahl_shards
+
+    def shard_fuer(self, email: str, hochschule_id: int | None = None) -> int:
+        """Gibt die Nummer des Shards für die Hochschule ``hochschule_id`` zurück.
+
+        Args:
+            email: Wird ignoriert.
+            hochschule_id: ID der Hochschule des Studenten.
+
+        Returns:
+            int: Shard-Nummer (0 bis ``anzahl_shards - 1``).
+
+        Raises:
+            ValueError: Wenn keine Hochschul-ID angegeben ist.
+        """
+        if hochschule_id is None:
+            raise ValueError("Hochschul-Routing benötigt eine Hochschul-ID.")
+        return hochschule_id % self.anzahl_shards
+
+
+ROUTER = {"email": EmailHashRouter, "hochschule": HochschulRouter}
+
+
+def shard_id(nummer: int) -> str:
+    """Gibt die Shard-ID (Identity-Token, Dateiname ohne Endung) zu einer Shard-Nummer zurück."""
+    return f"shard_{nummer}"
+
+
+class ShardedDatabaseManager(DatabaseManager):
+    """DatabaseManager, der Studentendaten auf mehrere SQLite-Dateien verteilt.
+
+    Nutzt SQLAlchemys ``ShardedSession``: Objekte tragen ihren Shard als Identity-Token,
+    Lazy Loading und Flush laufen automatisch gegen die Datei, aus der ein Objekt stammt.
+    Abfragen auf Shard-Tabellen laufen gegen den aktiven Shard, also den des zuletzt
+    geladenen oder angelegten Studenten. Der aktive Shard steht in ``Session.info`` der
+    Session und gilt damit nur für diese (bei ``pro_operation`` für die Session eines
+    Threads und einer Operation).
+
+    Hinweis:
+        Ein Commit, der Katalog und Shard betrifft (``add_student``), wird nacheinander in
+        beiden Dateien committet und ist nicht atomar.
+
+    Attribute:
+        verzeichnis (Path): Verzeichnis mit ``katalog.db`` und ``shard_<n>.db``.
+        router: ``EmailHashRouter`` oder ``HochschulRouter``.
+        shards (dict[str, Engine]): Engines aller Shards inkl. Katalog.
+        aktiver_shard (str | None): Shard-ID des aktuellen Studenten in der aktuellen Session.
+    """
+
+    def __init__(
+        self,
+        verzeichnis: Path | str = SHARD_PFAD,
+        anzahl_shards: int = 4,
+        router: str = "email",
+        profil: str = "durable",
+        session_strategie: str = "langlebig",
+        log_sql_statistik: bool = False,
+    ) -> None:
+        """Erstellt Katalog und Shards und initialisiert deren Schema.
+
+        Args:
+            verzeichnis: Verzeichnis der Datenbankdateien, default: ``data/shards``.
+            anzahl_shards: Anzahl der Shard-Dateien, darf nach dem ersten Start nicht geändert werden.
+            router: ``"email"`` (Hash der E-Mail) oder ``"hochschule"``.
+            profil: Engine-Profil aus ``ENGINE_PROFILE``.
+            session_strategie: ``"langlebig"`` (default) oder ``"pro_operation"``.
+            log_sql_statistik: Wenn ``True``, werden die SQL-Messwerte jeder Operation geloggt.
+
+        Raises:
+            ValueError: Bei unbekanntem Router, Session-Strategie oder ``anzahl_shards < 1``.
+            RuntimeError: Wenn die Datenbanken nicht initialisiert werden können.
+        """
+        if router not in ROUTER:
+            raise ValueError(f"Unbekannter Shard-Router: {router}")
+        if anzahl_shards < 1:
+            raise ValueError("Mindestens ein Shard erforderlich.")
+        if session_strategie not in SESSION_STRATEGIEN:
+            raise ValueError(f"Unbekannte Session-Strategie: {session_strategie}")
+        try:
+            self.profil = profil
+            self.session_strategie = session_strategie
+            self._lokal = threading.local()
+            self.verzeichnis = Path(verzeichnis)
+            self.verzeichnis.mkdir(parents=True, exist_ok=True)
+            self.router = ROUTER[router](anzahl_shards)
+            self.shards: dict[str, Engine] = {}
+            for name in [KATALOG] + [shard_id(n) for n in range(anzahl_shards)]:
+                engine = erstelle_engine(self._url(name), profil)
+                if profil != "readonly":
+                    with engine.connect() as connection:
+                        initialisiere_ohne_fremdschluessel(
+                            connection,
+                            Base.metadata if name == KATALOG else shard_metadata,
+                        )
+                    if name == KATALOG:
+                        with engine.begin() as connection:
+                            katalog_metadata.create_all(connection)
+                self.shards[name] = engine
+            self.engine = self.shards[KATALOG]
+            logger.info(
+                "Sharding aktiv: %s Shards in %s (Router: %s)",
+                anzahl_shards,
+                self.verzeichnis,
+                router,
+            )
+            self.SessionLocal = sessionmaker(
+                class_=ShardedSession,
+                shards=self.shards,
+                shard_chooser=self._shard_chooser,
+                identity_chooser=self._identity_chooser,
+                execute_chooser=self._execute_chooser,
+                expire_on_commit=False,
+            )
+            self._richte_sessions_ein(log_sql_statistik)
+            for name, engine in self.shards.items():
+                if name != KATALOG:
+                    self.instrumentierung.registriere(engine)
+        except Exception:
+            logger.critical("Shard-Initialisierung fehlgeschlagen.", exc_info=True)
+            raise RuntimeError("Shard-Initialisierung fehlgeschlagen.")
+
+    def _url(self, name: str) -> str:
+        return f"sqlite+pysqlite:///{self.verzeichnis / name}.db"
+
+    @property
+    def shard_ids(self) -> list[str]:
+        """IDs aller Shards ohne Katalog."""
+        return [name for name in self.shards if name != KATALOG]
+
+    @property
+    def aktiver_shard(self) -> str | None:
+        """Shard-ID des aktuellen Studenten, gespeichert in ``info`` der aktuellen Session."""
+        return self.session.info.get(AKTIVER_SHARD)
+
+    @aktiver_shard.setter
+    def aktiver_shard(self, shard: str | None) -> None:
+        self.session.info[AKTIVER_SHARD] = shard
+
+    def _shard_chooser(self, mapper: Mapper, instance=None, clause=None) -> str:
+        """Shard für neue Objekte und Statements ohne Identity-Token."""
+        session = object_session(instance) if instance is not None else None
+        return self._waehle_shard(
+            mapper, (session or self.session).info.get(AKTIVER_SHARD)
+        )
+
+    @staticmethod
+    def _waehle_shard(mapper: Mapper | None, aktiver_shard: str | None) -> str:
+        if mapper is None or mapper.class_ in KATALOG_MODELLE:
+            return KATALOG
+        if aktiver_shard is None:
+            raise RuntimeError("Kein Shard aktiv: zuerst Student laden oder anlegen.")
+        return aktiver_shard
+
+    def _identity_chooser(
+        self,
+        mapper: Mapper,
+        primary_key,
+        *,
+        lazy_loaded_from=None,
+        execution_options=None,
+        bind_arguments=None,
+        **kw,
+    ) -> list[str]:
+        """Shards, in denen ein Objekt per Primärschlüssel gesucht wird."""
+        return self._shards_fuer(mapper, lazy_loaded_from)
+
+    def _execute_chooser(self, context: ORMExecuteState) -> list[str]:
+        """Shards, gegen die eine Abfrage ausgeführt wird."""
+        lazy_loaded_from = context.lazy_loaded_from if context.is_select else None
+        return self._shards_fuer(
+            context.bind_mapper, lazy_loaded_from, context.session.info
+        )
+
+    def _shards_fuer(
+        self, mapper: Mapper | None, lazy_loaded_from, info: dict | None = None
+    ) -> list[str]:
+        if mapper is None or mapper.class_ in KATALOG_MODELLE:
+            return [KATALOG]
+        if lazy_loaded_from is not None:
+            token = lazy_loaded_from.identity_token
+            if token is not None and token != KATALOG:
+                # Beziehung eines Shard-Objekts liegt im selben Shard
+                return [token]
+        aktiver_shard = (self.session.info if info is None else info).get(AKTIVER_SHARD)
+        if aktiver_shard is not None:
+            return [aktiver_shard]
+        return self.shard_ids
+
+    def _aktiviere_shard_von(self, email: str) -> bool:
+        """Setzt den aktiven Shard anhand der Zuordnung im Katalog.
+
+        Returns:
+            bool: ``False``, wenn für ``email`` kein Student existiert.
+        """
+        stmt = select(shard_zuordnung.c.shard).where(shard_zuordnung.c.email == email)
+        shard = self.session.execute(stmt).scalar()
+        if shard is None:
+            return False
+        self.aktiver_shard = shard
+        return True
+
+    def add_student(
+        self,
+        name: str,
+        matrikelnummer: str,
+        email: str,
+        password: str,
+        semester_anzahl: int,
+        modul_anzahl: int,
+        start_datum: datetime.date,
+        ziel_datum: datetime.date,
+        ziel_note: float,
+        hochschule_id: int | None = None,
+    ) -> Student:
+        """Wählt den Shard über den Router, legt den Student dort an und trägt ihn im Katalog ein.
+
+        Siehe ``DatabaseManager.add_student``.
+
+        Raises:
+            ValueError: Wenn der Router keinen Shard bestimmen kann.
+            DBTransactionError: Wenn Commit/Rollback fehlschlägt (z. B. E-Mail bereits vergeben).
+        """
+        shard = shard_id(self.router.shard_fuer(email, hochschule_id))
+        self.aktiver_shard = shard
+        logger.debug("Student %s wird in %s angelegt.", email, shard)
+        try:
+            self.session.execute(
+                insert(shard_zuordnung).values(email=email, shard=shard)
+            )
+        except IntegrityError as e:
+            logger.warning("E-Mail bereits einem Shard zugeordnet: %s", email)
+            if self._uow_tiefe == 0:
+                self.session.rollback()
+            raise DBTransactionError(
+                "Transaktion wurde zurückgerollt. Datenbank-Integrität verletzt."
+            ) from e
+        return super().add_student(
+            name,
+            matrikelnummer,
+            email,
+            password,
+            semester_anzahl,
+            modul_anzahl,
+            start_datum,
+            ziel_datum,
+            ziel_note,
+            hochschule_id=hochschule_id,
+        )
+
+    def loesche_student(self, student: Student) -> None:
+        """Siehe ``DatabaseManager.loesche_student``, entfernt zusätzlich die Zuordnung im Katalog."""
+        self.session.execute(
+            delete(shard_zuordnung).where(shard_zuordnung.c.email == student.email)
+        )
+        super().loesche_student(student)
+
+    def _fuege_ein(self, modell: type, zeilen: list[dict]) -> None:
+        """Gebündelter INSERT in den aktiven Shard.
+
+        ``ShardedSession`` unterstützt keine ORM-Bulk-Inserts, der INSERT läuft daher als
+        Core-Statement auf der Shard-Verbindung der Session (Spalten- = Attributnamen).
+        """
+        session = self.session
+        shard = self._waehle_shard(inspect(modell), session.info.get(AKTIVER_SHARD))
+        connection = session.connection(bind_arguments={"shard_id": shard})
+        connection.execute(insert(modell.__table__), zeilen)
+
+    def lade_student(self, email: str) -> Student | None:
+        """Siehe ``DatabaseManager.lade_student``, der Shard wird über den Katalog bestimmt."""
+        if not self._aktiviere_shard_von(email):
+            return None
+        return super().lade_student(email)
+
+    def lade_student_neu(
+        self, student: Student, profil: str | None = None
+    ) -> Student | None:
+        """Siehe ``DatabaseManager.lade_student_neu``, der Shard ist der Identity-Token von ``student``.
+
+        Eine neue Session (``pro_operation``) kennt noch keinen aktiven Shard; ohne ihn
+        würde die ID in allen Shards gesucht, die IDs sind aber nur je Shard eindeutig.
+        """
+        token = inspect(student).identity_token
+        if token is not None:
+            self.aktiver_shard = token
+        return super().lade_student_neu(student, profil)
+
+    def lade_student_mit_beziehungen(
+        self, email: str, profil: str = "dashboard"
+    ) -> Student | None:
+        """Siehe ``DatabaseManager.lade_student_mit_beziehungen``, der Shard wird über den Katalog bestimmt."""
+        if not self._aktiviere_shard_von(email):
+            return None
+        return super().lade_student_mit_beziehungen(email, profil)
+
+    @contextmanager
+    def verbinde_shards(self) -> Iterator[Connection]:
+        """Katalog-Verbindung, an die alle Shards angehängt sind (``ATTACH ... AS shard_<n>``).
+
+        Tabellen eines Shards sind als ``shard_<n>.<tabelle>`` erreichbar. SQLite erlaubt
+        standardmäßig höchstens 10 angehängte Datenbanken.
+
+        Yields:
+            Connection: Verbindung zur Katalog-Datenbank.
+        """
+        with self.engine.connect() as connection:
+            angehaengt = []
+            try:
+                for name in self.shard_ids:
+                    connection.exec_driver_sql(
+                        f"ATTACH DATABASE ? AS {name}",
+                        (str(self.verzeichnis / f"{name}.db"),),
+                    )
+                    angehaengt.append(name)
+                yield connection
+            finally:
+                connection.rollback()
+                for name in angehaengt:
+                    connection.exec_driver_sql(f"DETACH DATABASE {name}")
+
+    def lade_shard_bericht(self) -> list[dict]:
+        """Wertet Studenten, Enrollments und ECTS-Punkte pro Hochschule über alle Shards aus.
+
+        Returns:
+            list[dict]: Je Hochschule ``hochschule``, ``studenten``, ``enrollments``
+            und ``erarbeitete_ects``, absteigend nach Anzahl der Studenten.
+        """
+        student = Student.__tablename__
+        enrollment = Enrollment.__tablename__
+        teile = [
+            f"SELECT s.hochschule_id AS hochschule_id, s._erarbeitete_ects AS ects, "
+            f"(SELECT COUNT(*) FROM {name}.{enrollment} e WHERE e.student_id = s.id) "
+            f"AS enrollments FROM {name}.{student} s"
+            for name in self.shard_ids
+        ]
+        sql = (
+            "SELECT h._name, COUNT(*), SUM(alle.enrollments), "
+            "COALESCE(SUM(alle.ects), 0) "
+            f"FROM ({' UNION ALL '.join(teile)}) AS alle "
+            f"JOIN main.{Hochschule.__tablename__} h ON h.id = alle.hochschule_id "
+            "GROUP BY h.id ORDER BY COUNT(*) DESC, h._name"
+        )
+        with self.verbinde_shards() as connection:
+            zeilen = connection.exec_driver_sql(sql).all()
+        return [
+            {
+                "hochschule": name,
+                "studenten": studenten,
+                "enrollments": enrollments,
+                "erarbeitete_ects": ects,
+            }
+            for name, studenten, enrollments, ects in zeilen
+        ]
+
+    def backup(
+        self,
+        ziel: Path | str,
+        seiten_pro_schritt: int = 256,
+        pause: float = 0.0,
+        fortschritt: Callable[[int, int], None] | None = None,
+    ) -> Future[BackupErgebnis]:
+        """Siehe ``DatabaseManager.backup``, sichert Katalog und alle Shards.
+
+        ``ziel`` ist ein Verzeichnis, es erhält je Datei ``<name>.db`` und kann direkt als
+        ``verzeichnis`` eines ``ShardedDatabaseManager`` geöffnet werden. Die Dateien
+        werden nacheinander gesichert, das Backup ist über die Dateien nicht atomar.
+        """
+        return super().backup(ziel, seiten_pro_schritt, pause, fortschritt)
+
+    def _backup(
+        self,
+        ziel: Path,
+        seiten_pro_schritt: int,
+        pause: float,
+        fortschritt: Callable[[int, int], None] | None,
+    ) -> BackupErgebnis:
+        start = time.perf_counter()
+        seiten = schritte = 0
+        for name, engine in self.shards.items():
+            datei_seiten, datei_schritte = self._kopiere_datei(
+                engine, ziel / f"{name}.db", seiten_pro_schritt, pause, fortschritt
+            )
+            seiten += datei_seiten
+            schritte += datei_schritte
+        ergebnis = BackupErgebnis(
+            ziel, time.perf_counter() - start, seiten=seiten, schritte=schritte
+        )
+        logger.info(
+            "Backup von %s Dateien erstellt: %s (%s Seiten, %.1f ms)",
+            len(self.shards),
+            ziel,
+            ergebnis.seiten,
+            ergebnis.dauer * 1000,
+        )
+        return ergebnis
+
+    def snapshot(
+        self, verzeichnis: Path | str = BACKUP_PFAD, behalte: int = 5
+    ) -> Future[BackupErgebnis]:
+        """Siehe ``DatabaseManager.snapshot``, erfasst Katalog und alle Shards.
+
+        Ein Snapshot ist ein Verzeichnis ``<name>-<zeitstempel>`` (``name``: Name von
+        ``self.verzeichnis``) mit je Datei ``<name>.db``, es kann direkt als
+        ``verzeichnis`` eines ``ShardedDatabaseManager`` geöffnet werden. Die Dateien
+        werden nacheinander kopiert, der Snapshot ist über die Dateien nicht atomar.
+        """
+        if behalte < 1:
+            raise ValueError("Mindestens ein Snapshot muss erhalten bleiben.")
+        self._datenbank_datei()
+        return im_hintergrund(
+            self._snapshot, Path(verzeichnis), self.verzeichnis.name, behalte
+        )
+
+    def _snapshot(self, verzeichnis: Path, name: str, behalte: int) -> BackupErgebnis:
+        zeitstempel = datetime.datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        ziel = verzeichnis / f"{name}-{zeitstempel}"
+        ziel.mkdir(parents=True)
+        start = time.perf_counter()
+        try:
+            for datei, engine in self.shards.items():
+                self._vacuum_into(engine, ziel / f"{datei}.db")
+        except Exception:
+            shutil.rmtree(ziel, ignore_errors=True)
+            raise
+        ergebnis = BackupErgebnis(ziel, time.perf_counter() - start)
+        ergebnis.entfernt = rotiere_snapshots(verzeichnis, f"{name}-*", behalte)
+        logger.info(
+            "Snapshot von %s Dateien erstellt: %s (%s Bytes, %.1f ms, %s rotiert)",
+            len(self.shards),
+            ziel,
+            ergebnis.groesse,
+            ergebnis.dauer * 1000,
+            len(ergebnis.entfernt),
+        )
+        return ergebnis
+
+    def wartung(self, budget: float = 0.2) -> WartungsErgebnis:
+        """Wartet Katalog und alle Shards, das Zeitbudget wird gleichmäßig aufgeteilt.
+
+        Args:
+            budget: Zeitbudget in Sekunden für alle Dateien zusammen.
+
+        Returns:
+            WartungsErgebnis: Summe über alle Dateien (Schritte je ``<shard>:<schritt>``).
+        """
+        gesamt = WartungsErgebnis()
+        if self.profil == "readonly":
+            return gesamt
+        for name, engine in self.shards.items():
+            ergebnis = fuehre_wartung_aus(engine, budget / len(self.shards))
+            for schritt, dauer in ergebnis.schritte.items():
+                gesamt.schritte[f"{name}:{schritt}"] = dauer
+            gesamt.freie_seiten_vorher += ergebnis.freie_seiten_vorher
+            gesamt.freie_seiten_nachher += ergebnis.freie_seiten_nachher
+            gesamt.dauer += ergebnis.dauer
+            gesamt.abgebrochen = gesamt.abgebrochen or ergebnis.abgebrochen
+        return gesamt
+
+    def _stelle_auto_vacuum_um(self) -> bool:
+        """Siehe ``DatabaseManager.stelle_auto_vacuum_um``, stellt Katalog und alle Shards um."""
+        umgestellt = False
+        for name, engine in self.shards.items():
+            try:
+                umgestellt = stelle_auto_vacuum_um(engine) or umgestellt
+            except Exception:
+                logger.exception(
+                    "Umstellung auf auto_vacuum=INCREMENTAL fehlgeschlagen: %s", name
+                )
+                raise
+        return umgestellt
@@ -0,0 +1,309 @@
+"""Statistik-Kern: Noten, ECTS, Bestehen und Enddaten aller Versuche eines Studenten.
+
+``packe_versuche`` legt die Prüfungsleistungen aller Enrollments spaltenweise ab
+(Enrollment-Index, Teilprüfung, Versuch, Note, Gewicht, Datum als Ordinalzahl) und je
+Enrollment Anzahl der Teilprüfungen, gespeicherten Status und ECTS. ``berechne_statistik``
+wertet diese Spalten in einem Durchlauf aus: Bestehen je Versuch, gewichtete Modulnoten,
+Enddaten und Status je Enrollment sowie Notendurchschnitt, ECTS-gewichteter Durchschnitt,
+erarbeitete ECTS und Anzahl je Status.
+
+Ist NumPy (optional) installiert, wird ab ``NUMPY_AB_VERSUCHE`` Versuchen vektorisiert
+gerechnet (``bincount`` und ``maximum.at`` je Enrollment), darunter und ohne NumPy in
+reinem Python.
+Beide Wege liefern identische Ergebnisse wie ``Enrollment.berechne_enrollment_note``,
+``Enrollment.set_end_date`` und ``Student.aendere_kennzahlen``: Summen werden in der
+Reihenfolge der Prüfungsleistungen gebildet, Modulnoten mit Pythons ``round`` auf zwei
+Nachkommastellen gerundet, Durchschnitte über ganzzahlige Hundertstel gebildet.
+"""
+
+from __future__ import annotations
+
+import datetime
+import importlib.util
+import math
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from src.models import Enrollment
+
+# NumPy ist optional (``requirements-numpy.txt``) und wird erst in ``_berechne_numpy``
+# importiert: Ein Student erreicht ``NUMPY_AB_VERSUCHE`` praktisch nie, der Programmstart
+# soll den Import nicht bezahlen.
+NUMPY_VERFUEGBAR = importlib.util.find_spec("numpy") is not None
+# Ab dieser Anzahl Versuche lohnt sich der Aufbau der Arrays (``bench_statistik``)
+NUMPY_AB_VERSUCHE = 500
+# Schlechteste Note, mit der ein Versuch bestanden ist (vgl. ``Pruefungsleistung.ist_bestanden``)
+BESTANDEN_BIS = 4.0
+# Namen von ``EnrollmentStatus``; der Index ist der Statuscode in ``Versuchsdaten``
+STATUS = ("IN_BEARBEITUNG", "ABGESCHLOSSEN", "NICHT_BESTANDEN")
+IN_BEARBEITUNG, ABGESCHLOSSEN, NICHT_BESTANDEN = range(len(STATUS))
+# Platzhalter für ein fehlendes Datum (Ordinalzahlen beginnen bei 1)
+KEIN_DATUM = 0
+
+
+class Versuchsdaten:
+    """Prüfungsleistungen und Enrollments eines Studenten als parallele Spalten.
+
+    Attribute:
+        enrollment (list[int]): Index des Enrollments je Versuch.
+        teilpruefung (list[int]): Nummer der Teilprüfung je Versuch.
+        versuch (list[int]): Versuch (1, 2, 3).
+        note (list[float]): Note, ``nan`` wenn nicht bewertet.
+        gewicht (list[float]): Gewicht der Teilprüfung.
+        datum (list[int]): Datum als Ordinalzahl, ``KEIN_DATUM`` wenn nicht gesetzt.
+        enrollment_ids (list[int | None]): ID je Enrollment.
+        anzahl_pruefungsleistungen (list[int]): Anzahl der Teilprüfungen je Enrollment.
+        status (list[int]): Gespeicherter Status je Enrollment (Index in ``STATUS``).
+        ects (list[int]): ECTS je Enrollment, nur für gespeichert abgeschlossene, sonst 0.
+    """
+
+    def __init__(self) -> None:
+        self.enrollment: list[int] = []
+        self.teilpruefung: list[int] = []
+        self.versuch: list[int] = []
+        self.note: list[float] = []
+        self.gewicht: list[float] = []
+        self.datum: list[int] = []
+        self.enrollment_ids: list[int | None] = []
+        self.anzahl_pruefungsleistungen: list[int] = []
+        self.status: list[int] = []
+        self.ects: list[int] = []
+
+    @property
+    def anzahl_enrollments(self) -> int:
+        return len(self.enrollment_ids)
+
+    @property
+    def anzahl_versuche(self) -> int:
+        return len(self.enrollment)
+
+
+class Statistik:
+    """Ergebnis von ``berechne_statistik``.
+
+    Attribute:
+        bestanden (list[bool]): Bestehen je Versuch.
+        enrollment_noten (list[float | None]): Gewichtete Modulnote je Enrollment.
+        end_daten (list[datetime.date | None]): Datum des letzten bestandenen Versuchs.
+        status (list[str]): Aus den Versuchen berechneter Status je Enrollment.
+        anzahl_je_status (dict[str, int]): Anzahl Enrollments je gespeichertem Status.
+        erarbeitete_ects (int): ECTS der gespeichert abgeschlossenen Enrollments.
+        notensumme_hundertstel (int): Summe ihrer Modulnoten in Hundertstel.
+        anzahl_benotet (int): Anzahl abgeschlossener Enrollments mit Note.
+        ects_benotet (int): ECTS der abgeschlossenen Enrollments mit Note.
+        ects_notensumme_hundertstel (int): Summe Modulnote (Hundertstel) mal ECTS.
+    """
+
+    def __init__(self) -> None:
+        self.bestanden: list[bool] = []
+        self.enrollment_noten: list[float | None] = []
+        self.end_daten: list[datetime.date | None] = []
+        self.status: list[str] = []
+        self.anzahl_je_status: dict[str, int] = dict.fromkeys(STATUS, 0)
+        self.erarbeitete_ects = 0
+        self.notensumme_hundertstel = 0
+        self.anzahl_benotet = 0
+        self.ects_benotet = 0
+        self.ects_notensumme_hundertstel = 0
+
+    @property
+    def notendurchschnitt(self) -> float | None:
+        """Durchschnitt der Modulnoten (wie ``Student.notendurchschnitt``)."""
+        if not self.anzahl_benotet:
+            return None
+        return float(round(self.notensumme_hundertstel / 100 / self.anzahl_benotet, 2))
+
+    @property
+    def ects_gewichteter_durchschnitt(self) -> float | None:
+        """Mit den ECTS der Module gewichteter Durchschnitt der Modulnoten."""
+        if not self.ects_benotet:
+            return None
+        return float(
+            round(self.ects_notensumme_hundertstel / 100 / self.ects_benotet, 2)
+        )
+
+
+def packe_versuche(enrollments: Iterable[Enrollment]) -> Versuchsdaten:
+    """Legt die Prüfungsleistungen der Enrollments spaltenweise ab.
+
+    ``enrollment.modul`` wird nur für gespeichert abgeschlossene Enrollments gelesen, wie in
+    ``Student.aendere_kennzahlen``; für die übrigen entsteht kein Lazy Load.
+
+    Args:
+        enrollments: Enrollments mit geladenen Prüfungsleistungen.
+
+    Returns:
+        Versuchsdaten: Spalten für ``berechne_statistik``.
+    """
+    daten = Versuchsdaten()
+    for index, enrollment in enumerate(enrollments):
+        status = STATUS.index(enrollment.status.name)
+        daten.enrollment_ids.append(enrollment.id)
+        daten.anzahl_pruefungsleistungen.append(enrollment.anzahl_pruefungsleistungen)
+        daten.status.append(status)
+        daten.ects.append(
+            enrollment.modul.ects_punkte if status == ABGESCHLOSSEN else 0
+        )
+        for pl in enrollment.pruefungsleistungen:
+            daten.enrollment.append(index)
+            daten.teilpruefung.append(pl.teilpruefung)
+            daten.versuch.append(pl.versuch)
+            daten.note.append(math.nan if pl.note is None else pl.note)
+            daten.gewicht.append(pl.teilpruefung_gewicht)
+            daten.datum.append(KEIN_DATUM if pl.datum is None else pl.datum.toordinal())
+    return daten
+
+
+def berechne_statistik(
+    daten: Versuchsdaten, vektorisiert: bool | None = None
+) -> Statistik:
+    """Wertet die Versuchsdaten aus.
+
+    Args:
+        daten: Ergebnis von ``packe_versuche``.
+        vektorisiert: ``True``: NumPy, ``False``: reines Python, ``None``: NumPy ab
+            ``NUMPY_AB_VERSUCHE`` Versuchen, falls installiert.
+
+    Returns:
+        Statistik: Werte je Versuch, je Enrollment und gesamt.
+
+    Raises:
+        RuntimeError: Wenn ``vektorisiert=True`` und NumPy nicht installiert ist.
+    """
+    if vektorisiert is None:
+        vektorisiert = NUMPY_VERFUEGBAR and daten.anzahl_versuche >= NUMPY_AB_VERSUCHE
+    if vektorisiert:
+        if not NUMPY_VERFUEGBAR:
+            raise RuntimeError("NumPy ist nicht installiert.")
+        return _berechne_numpy(daten)
+    return _berechne_python(daten)
+
+
+def _modulnote(noten_summe: float, gewicht_summe: float) -> float:
+    """Rundet wie ``Enrollment.berechne_enrollment_note``."""
+    return float(round(noten_summe / gewicht_summe, 2))
+
+
+def _datum(ordinal: int) -> datetime.date | None:
+    return None if ordinal == KEIN_DATUM else datetime.date.fromordinal(ordinal)
+
+
+def _berechne_python(daten: Versuchsdaten) -> Statistik:
+    anzahl = daten.anzahl_enrollments
+    noten_summe = [0.0] * anzahl
+    gewicht_summe = [0.0] * anzahl
+    anzahl_bestanden = [0] * anzahl
+    ende = [KEIN_DATUM] * anzahl
+    dritter_versuch_nicht_bestanden = [False] * anzahl
+    statistik = Statistik()
+    for index, versuch, note, gewicht, datum in zip(
+        daten.enrollment, daten.versuch, daten.note, daten.gewicht, daten.datum
+    ):
+        # ``nan <= 4.0`` ist False: nicht bewertete Versuche gelten als nicht bestanden
+        bestanden = note <= BESTANDEN_BIS
+        statistik.bestanden.append(bestanden)
+        if bestanden:
+            noten_summe[index] += note * gewicht
+            gewicht_summe[index] += gewicht
+            anzahl_bestanden[index] += 1
+            ende[index] = max(ende[index], datum)
+        elif versuch == 3 and not math.isnan(note):
+            dritter_versuch_nicht_bestanden[index] = True
+
+    for index in range(anzahl):
+        note = (
+            _modulnote(noten_summe[index], gewicht_summe[index])
+            if anzahl_bestanden[index]
+            else None
+        )
+        statistik.enrollment_noten.append(note)
+        statistik.end_daten.append(_datum(ende[index]))
+        if anzahl_bestanden[index] == daten.anzahl_pruefungsleistungen[index]:
+            statistik.status.append(STATUS[ABGESCHLOSSEN])
+        elif dritter_versuch_nicht_bestanden[index]:
+            statistik.status.append(STATUS[NICHT_BESTANDEN])
+        else:
+            statistik.status.append(STATUS[IN_BEARBEITUNG])
+
+        statistik.anzahl_je_status[STATUS[daten.status[index]]] += 1
+        if daten.status[index] != ABGESCHLOSSEN:
+            continue
+        ects = daten.ects[index]
+        statistik.erarbeitete_ects += ects
+        if note is not None:
+            hundertstel = round(note * 100)
+            statistik.anzahl_benotet += 1
+            statistik.notensumme_hundertstel += hundertstel
+            statistik.ects_benotet += ects
+            statistik.ects_notensumme_hundertstel += hundertstel * ects
+    return statistik
+
+
+def _berechne_numpy(daten: Versuchsdaten) -> Statistik:
+    import numpy as np
+
+    anzahl = daten.anzahl_enrollments
+    enrollment = np.asarray(daten.enrollment, dtype=np.intp)
+    versuch = np.asarray(daten.versuch, dtype=np.int64)
+    note = np.asarray(daten.note, dtype=np.float64)
+    gewicht = np.asarray(daten.gewicht, dtype=np.float64)
+    datum = np.asarray(daten.datum, dtype=np.int64)
+    anzahl_pl = np.asarray(daten.anzahl_pruefungsleistungen, dtype=np.int64)
+    status = np.asarray(daten.status, dtype=np.intp)
+    ects = np.asarray(daten.ects, dtype=np.int64)
+
+    bestanden = note <= BESTANDEN_BIS
+    # ``bincount`` summiert je Enrollment in Eingabereihenfolge, wie die Schleife in
+    # ``berechne_enrollment_note``; Summanden 0.0 ändern die Summe nicht.
+    noten_summe = np.bincount(
+        enrollment, weights=np.where(bestanden, note * gewicht, 0.0), minlength=anzahl
+    )
+    gewicht_summe = np.bincount(
+        enrollment, weights=np.where(bestanden, gewicht, 0.0), minlength=anzahl
+    )
+    anzahl_bestanden = np.bincount(enrollment[bestanden], minlength=anzahl)
+    dritter_versuch_nicht_bestanden = (
+        np.bincount(
+            enrollment[~bestanden & ~np.isnan(note) & (versuch == 3)], minlength=anzahl
+        )
+        > 0
+    )
+    ende = np.full(anzahl, KEIN_DATUM, dtype=np.int64)
+    np.maximum.at(ende, enrollment[bestanden], datum[bestanden])
+
+    hat_note = anzahl_bestanden > 0
+    # ``np.round`` rundet nicht wie Pythons ``round``: Die Modulnoten werden je Enrollment
+    # mit ``round`` gerundet, alles übrige bleibt vektorisiert.
+    mittel = np.divide(
+        noten_summe, gewicht_summe, out=np.zeros(anzahl), where=hat_note
+    ).tolist()
+    enrollment_noten = [
+        float(round(wert, 2)) if benotet else None
+        for wert, benotet in zip(mittel, hat_note.tolist())
+    ]
+    hundertstel = np.rint(
+        np.asarray([n or 0.0 for n in enrollment_noten], dtype=np.float64) * 100
+    ).astype(np.int64)
+
+    berechneter_status = np.where(
+        anzahl_bestanden == anzahl_pl,
+        ABGESCHLOSSEN,
+        np.where(dritter_versuch_nicht_bestanden, NICHT_BESTANDEN, IN_BEARBEITUNG),
+    )
+    abgeschlossen = status == ABGESCHLOSSEN
+    benotet = abgeschlossen & hat_note
+
+    statistik = Statistik()
+    statistik.bestanden = bestanden.tolist()
+    statistik.enrollment_noten = enrollment_noten
+    statistik.end_daten = [_datum(ordinal) for ordinal in ende.tolist()]
+    statistik.status = [STATUS[code] for code in berechneter_status.tolist()]
+    statistik.anzahl_je_status = dict(
+        zip(STATUS, np.bincount(status, minlength=len(STATUS)).tolist())
+    )
+    statistik.erarbeitete_ects = int(ects[abgeschlossen].sum())
+    statistik.notensumme_hundertstel = int(hundertstel[benotet].sum())
+    statistik.anzahl_benotet = int(benotet.sum())
+    statistik.ects_benotet = int(ects[benotet].sum())
+    statistik.ects_notensumme_hundertstel = int((hundertstel * ects)[benotet].sum())
+    return statistik
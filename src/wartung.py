@@ -0,0 +1,288 @@
+"""Datenbankwartung im Leerlauf: ``incremental_vacuum``, ``ANALYZE`` und ``PRAGMA optimize``.
+
+``fuehre_wartung_aus`` arbeitet die Schritte auf einer eigenen Verbindung mit festem
+Zeitbudget ab: Ein Progress-Handler bricht ein Statement ab, sobald das Budget
+verbraucht ist, der Busy-Timeout wird für die Dauer der Wartung auf das Budget begrenzt.
+Abgebrochene Schritte werden beim nächsten Lauf fortgesetzt. Die einmalige Umstellung
+älterer Datenbanken auf ``auto_vacuum=INCREMENTAL`` (``stelle_auto_vacuum_um``) schreibt die
+ganze Datei neu und läuft deshalb ohne Zeitbudget außerhalb der Wartung.
+
+``WartungsPlaner`` entscheidet, wann gewartet wird (Intervall seit der letzten Wartung und
+Leerlauf seit der letzten Controller-Operation), und wird über ``after()`` der Tk-Hauptschleife
+oder einen Worker-Thread getaktet.
+"""
+
+from __future__ import annotations
+from sqlalchemy import Engine
+
+from contextlib import closing
+import logging
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.database import DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+# Seiten, die pro ``PRAGMA incremental_vacuum(n)`` freigegeben werden
+VACUUM_SEITEN_PRO_SCHRITT = 64
+# Zeilen pro Index, die ANALYZE stichprobenartig liest (0: alle)
+ANALYSE_LIMIT = 400
+# Anzahl SQLite-VM-Instruktionen zwischen zwei Prüfungen des Zeitbudgets
+PROGRESS_INSTRUKTIONEN = 1000
+# Wert von ``PRAGMA auto_vacuum`` für INCREMENTAL
+AUTO_VACUUM_INCREMENTAL = 2
+
+
+class WartungsErgebnis:
+    """Ergebnis eines Wartungslaufs.
+
+    Attribute:
+        schritte (dict[str, float]): Dauer je ausgeführtem Schritt in Sekunden.
+        freie_seiten_vorher (int): ``freelist_count`` vor der Wartung.
+        freie_seiten_nachher (int): ``freelist_count`` nach der Wartung.
+        dauer (float): Gesamtdauer in Sekunden.
+        abgebrochen (bool): ``True``, wenn das Zeitbudget nicht gereicht hat.
+    """
+
+    def __init__(self) -> None:
+        self.schritte: dict[str, float] = {}
+        self.freie_seiten_vorher = 0
+        self.freie_seiten_nachher = 0
+        self.dauer = 0.0
+        self.abgebrochen = False
+
+    def __repr__(self) -> str:
+        schritte = {
+            name: round(dauer * 1000, 2) for name, dauer in self.schritte.items()
+        }
+        return (
+            f"WartungsErgebnis(schritte_ms={schritte}, freie_seiten="
+            f"{self.freie_seiten_vorher}->{self.freie_seiten_nachher}, "
+            f"dauer_ms={self.dauer * 1000:.1f}, abgebrochen={self.abgebrochen})"
+        )
+
+
+def _wert(verbindung: sqlite3.Connection, sql: str) -> Any:
+    return verbindung.execute(sql).fetchone()[0]
+
+
+def fuehre_wartung_aus(engine: Engine, budget: float = 0.2) -> WartungsErgebnis:
+    """Führt die Wartungsschritte innerhalb des Zeitbudgets aus.
+
+    Schritte:
+        - Freie Seiten mit ``PRAGMA incremental_vacuum`` in Blöcken freigeben (nur bei
+          ``auto_vacuum=INCREMENTAL``, siehe ``stelle_auto_vacuum_um``).
+        - ``ANALYZE`` (mit ``analysis_limit``), solange noch keine Statistiken existieren.
+        - ``PRAGMA optimize``.
+
+    Args:
+        engine: Engine einer SQLite-Datei.
+        budget: Zeitbudget in Sekunden.
+
+    Returns:
+        WartungsErgebnis: Dauer je Schritt, freie Seiten vorher/nachher.
+    """
+    ergebnis = WartungsErgebnis()
+    start = time.perf_counter()
+    frist = start + budget
+
+    with closing(engine.raw_connection()) as raw:
+        verbindung: sqlite3.Connection = raw.driver_connection
+        busy_timeout = _wert(verbindung, "PRAGMA busy_timeout")
+        verbindung.execute(f"PRAGMA busy_timeout={max(int(budget * 1000), 1)}")
+        verbindung.set_progress_handler(
+            lambda: int(time.perf_counter() > frist), PROGRESS_INSTRUKTIONEN
+        )
+
+        def schritt(name: str, sql: str) -> bool:
+            if time.perf_counter() > frist:
+                ergebnis.abgebrochen = True
+                return False
+            schritt_start = time.perf_counter()
+            try:
+                verbindung.execute(sql).fetchall()
+            except sqlite3.OperationalError as e:
+                # "interrupted" (Budget) oder "database is locked" (Busy-Timeout)
+                logger.debug("Wartungsschritt %s abgebrochen: %s", name, e)
+                ergebnis.abgebrochen = True
+                return False
+            finally:
+                ergebnis.schritte[name] = ergebnis.schritte.get(name, 0.0) + (
+                    time.perf_counter() - schritt_start
+                )
+            return True
+
+        try:
+            ergebnis.freie_seiten_vorher = _wert(verbindung, "PRAGMA freelist_count")
+            if _wert(verbindung, "PRAGMA auto_vacuum") != AUTO_VACUUM_INCREMENTAL:
+                logger.debug(
+                    "auto_vacuum nicht INCREMENTAL: incremental_vacuum übersprungen."
+                )
+            else:
+                while _wert(verbindung, "PRAGMA freelist_count") > 0:
+                    if not schritt(
+                        "incremental_vacuum",
+                        f"PRAGMA incremental_vacuum({VACUUM_SEITEN_PRO_SCHRITT})",
+                    ):
+                        break
+            statistik_vorhanden = _wert(
+                verbindung,
+                "SELECT COUNT(*) FROM sqlite_master WHERE name = 'sqlite_stat1'",
+            )
+            if not statistik_vorhanden:
+                verbindung.execute(f"PRAGMA analysis_limit={ANALYSE_LIMIT}")
+                schritt("analyze", "ANALYZE")
+            schritt("optimize", "PRAGMA optimize")
+            ergebnis.freie_seiten_nachher = _wert(verbindung, "PRAGMA freelist_count")
+        finally:
+            verbindung.set_progress_handler(None, 0)
+            verbindung.execute(f"PRAGMA busy_timeout={busy_timeout}")
+
+    ergebnis.dauer = time.perf_counter() - start
+    logger.info(
+        "Wartung %s: %s, freie Seiten %s -> %s, %.1f ms (Budget %.0f ms)",
+        "abgebrochen" if ergebnis.abgebrochen else "abgeschlossen",
+        ", ".join(
+            f"{name} {dauer * 1000:.1f} ms" for name, dauer in ergebnis.schritte.items()
+        )
+        or "keine Schritte",
+        ergebnis.freie_seiten_vorher,
+        ergebnis.freie_seiten_nachher,
+        ergebnis.dauer * 1000,
+        budget * 1000,
+    )
+    return ergebnis
+
+
+def stelle_auto_vacuum_um(engine: Engine) -> bool:
+    """Stellt eine Datenbank ohne ``auto_vacuum=INCREMENTAL`` einmalig per ``VACUUM`` um.
+
+    Das Engine-Profil setzt ``auto_vacuum=INCREMENTAL``, bei bestehenden Dateien wirkt das
+    erst nach einem ``VACUUM``. Es läuft ohne Zeitbudget und nicht in der Tk-Hauptschleife
+    (``DatabaseManager.stelle_auto_vacuum_um`` nutzt den Backup-Thread).
+
+    Args:
+        engine: Engine einer SQLite-Datei.
+
+    Returns:
+        bool: ``True``, wenn umgestellt wurde, ``False``, wenn das nicht nötig war.
+    """
+    with closing(engine.raw_connection()) as raw:
+        verbindung: sqlite3.Connection = raw.driver_connection
+        if _wert(verbindung, "PRAGMA auto_vacuum") == AUTO_VACUUM_INCREMENTAL:
+            return False
+        start = time.perf_counter()
+        verbindung.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        verbindung.execute("VACUUM")
+    logger.info(
+        "auto_vacuum auf INCREMENTAL umgestellt: %s (%.1f ms)",
+        engine.url.database,
+        (time.perf_counter() - start) * 1000,
+    )
+    return True
+
+
+class WartungsPlaner:
+    """Startet die Wartung, wenn sie fällig ist und die Anwendung im Leerlauf ist.
+
+    Fällig ist die Wartung ``intervall`` Sekunden nach der letzten Wartung (die erste
+    sofort), im Leerlauf ist die Anwendung ``leerlauf`` Sekunden nach der letzten
+    Controller-Operation (``DatabaseManager.letzte_aktivitaet``).
+
+    Attribute:
+        db: DatabaseManager, dessen Datenbank gewartet wird.
+        intervall (float): Mindestabstand zwischen zwei Wartungen in Sekunden.
+        leerlauf (float): Erforderliche Leerlaufzeit in Sekunden.
+        budget (float): Zeitbudget je Wartung in Sekunden.
+        letztes_ergebnis (WartungsErgebnis | None): Ergebnis der letzten Wartung.
+    """
+
+    def __init__(
+        self,
+        db: DatabaseManager,
+        intervall: float = 3600.0,
+        leerlauf: float = 30.0,
+        budget: float = 0.2,
+    ) -> None:
+        self.db = db
+        self.intervall = intervall
+        self.leerlauf = leerlauf
+        self.budget = budget
+        self.letztes_ergebnis: WartungsErgebnis | None = None
+        self._letzte_wartung: float | None = None
+        self._stopp = threading.Event()
+
+    def faellig(self, jetzt: float | None = None) -> bool:
+        """``True``, wenn das Intervall abgelaufen und die Anwendung im Leerlauf ist."""
+        jetzt = time.monotonic() if jetzt is None else jetzt
+        if (
+            self._letzte_wartung is not None
+            and jetzt - self._letzte_wartung < self.intervall
+        ):
+            return False
+        return jetzt - self.db.letzte_aktivitaet >= self.leerlauf
+
+    def takt(self) -> WartungsErgebnis | None:
+        """Führt die Wartung aus, wenn sie fällig ist.
+
+        Ein abgebrochener Lauf zählt nicht als Wartung, der Rest folgt beim nächsten Takt.
+
+        Returns:
+            WartungsErgebnis oder ``None``, wenn nicht gewartet wurde.
+        """
+        if not self.faellig():
+            return None
+        try:
+            ergebnis = self.db.wartung(budget=self.budget)
+        except Exception:
+            logger.exception("Wartung fehlgeschlagen.")
+            self._letzte_wartung = time.monotonic()
+            return None
+        self.letztes_ergebnis = ergebnis
+        if not ergebnis.abgebrochen:
+            self._letzte_wartung = time.monotonic()
+        return ergebnis
+
+    def starte_mit_after(self, widget, takt_ms: int = 10_000) -> None:
+        """Taktet den Planer über ``widget.after`` in der Tk-Hauptschleife.
+
+        Das Zeitbudget begrenzt, wie lange die Oberfläche pro Takt blockiert.
+
+        Args:
+            widget: Tk-Widget (z. B. ``App``).
+            takt_ms: Abstand der Prüfungen in Millisekunden.
+        """
+
+        def _takt() -> None:
+            if self._stopp.is_set():
+                return
+            self.takt()
+            widget.after(takt_ms, _takt)
+
+        widget.after(takt_ms, _takt)
+
+    def starte_thread(self, takt: float = 10.0) -> threading.Thread:
+        """Taktet den Planer in einem Daemon-Thread.
+
+        Args:
+            takt: Abstand der Prüfungen in Sekunden.
+
+        Returns:
+            threading.Thread: Der gestartete Thread.
+        """
+
+        def _schleife() -> None:
+            while not self._stopp.wait(takt):
+                self.takt()
+
+        thread = threading.Thread(target=_schleife, name="db-wartung", daemon=True)
+        thread.start()
+        return thread
+
+    def stoppe(self) -> None:
+        """Beendet den Takt (``after`` oder Thread)."""
+        self._stopp.set()
@@ -10,11 +10,10 @@ Hinweis:
 """
 
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from src.models import Base
+from sqlalchemy import event
 from src.database import DatabaseManager
 from src.main import Controller
 
@@ -27,30 +26,21 @@ if str(ROOT) not in sys.path:
 class TestDatabaseManager(DatabaseManager):
     """Testvariante des DatabaseManager mit SQLite In-Memory-Datenbank.
 
-    Diese Klasse überschreibt die Initialisierung des produktiven
-    ``DatabaseManager``, um eine flüchtige Datenbank (`` :memory: ``) zu verwenden.
+    Diese Klasse ruft die Initialisierung des produktiven ``DatabaseManager``
+    mit einer flüchtigen Datenbank (`` :memory: ``) auf, sodass Engine-Profil
+    und Schema-Erstellung identisch zum Produktivbetrieb sind.
 
     Die Session wird pro Instanz erstellt und über ``recreate_session`` bei Bedarf
     neu erzeugt.
     """
 
-    def __init__(self):
+    def __init__(self, profil: str = "durable"):
         """Initialisiert eine SQLite In-Memory-Engine und erstellt das Schema.
 
-        Erstellt anschließend eine SQLAlchemy-Session (``self.session``) für Tests.
+        Args:
+            profil: Engine-Profil aus ``ENGINE_PROFILE``.
         """
-        self.engine = create_engine("sqlite+pysqlite:///:memory:", echo=False)
-        Base.metadata.create_all(self.engine)
-        self.SessionLocal = sessionmaker(bind=self.engine, expire_on_commit=False)
-        self.session = self.SessionLocal()
-
-    def recreate_session(self):
-        """Schließt die aktuelle Session und erstellt eine neue."""
-        try:
-            self.session.close()
-        except Exception:
-            pass
-        self.session = self.SessionLocal()
+        super().__init__(profil=profil, url="sqlite+pysqlite:///:memory:")
 
 
 @pytest.fixture(scope="function")
@@ -83,3 +73,89 @@ def controller(db):
     """
     c = Controller(db=db, seed=False)
     return c
+
+
+@pytest.fixture
+def student_mit_enrollment():
+    """Legt Hochschule, Studiengang, Account und ein Enrollment mit einer Prüfungsleistung an.
+
+    Als Funktion, damit auch Tests mit eigener Datenbank (Datei, ``pro_operation``,
+    zwei Controller) sie nutzen können::
+
+        enrollment, pl = student_mit_enrollment(controller, db)
+
+    Returns:
+        Callable: ``(controller, db)``, liefert Enrollment-Daten und Daten der
+        Prüfungsleistung als ``tuple[dict, dict]``.
+    """
+
+    def anlegen(controller, db):
+        hs = db.add_hochschule("HS")
+        sg = db.add_studiengang("SG", 180)
+        sg.hochschule = hs
+        db.commit_or_rollback()
+        controller.erstelle_account(
+            {
+                "name": "User",
+                "matrikelnummer": "111",
+                "email": "u@gmail.com",
+                "password": "pw",
+                "semesteranzahl": 6,
+                "modulanzahl": 36,
+                "startdatum": "2024-01-01",
+                "zieldatum": "2028-01-01",
+                "zielnote": 2.0,
+                "hochschulid": hs.id,
+                "studiengang_id": sg.id,
+            }
+        )
+        enrollment = controller.erstelle_enrollment(
+            {
+                "modul_name": "M1",
+                "modul_code": "M1",
+                "modul_ects": 5,
+                "kurse_dict": {},
+                "pl_anzahl": 1,
+                "startdatum": "2024-01-02",
+            }
+        )
+        return enrollment, enrollment["pruefungsleistungen"][0]
+
+    return anlegen
+
+
+@pytest.fixture
+def assert_statements(db):
+    """Prüft die exakte Anzahl an SQL-Statements innerhalb eines ``with``-Blocks.
+
+    Beispiel::
+
+        with assert_statements(0):
+            controller.load_dashboard_data()
+
+    Args:
+        db: ``db``-Fixture, deren Engine standardmäßig überwacht wird.
+
+    Returns:
+        Callable: Context-Manager ``(anzahl, engine=None)``; schlägt fehl, wenn die Anzahl abweicht.
+    """
+
+    @contextmanager
+    def pruefe(anzahl, engine=None):
+        engine = engine or db.engine
+        statements = []
+
+        def zaehle(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", zaehle)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", zaehle)
+        assert len(statements) == anzahl, (
+            f"{len(statements)} statt {anzahl} SQL-Statements:\n"
+            + "\n".join(statements)
+        )
+
+    return pruefe
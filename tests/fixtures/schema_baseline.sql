@@ -0,0 +1,95 @@
+-- Schema der ersten Version (Commit "baseline"), erzeugt mit Base.metadata.create_all
+-- auf SQLite. Grundlage für tests/test_database.py::test_migration_von_baseline.
+
+CREATE TABLE hochschule (
+    id INTEGER NOT NULL,
+    _name VARCHAR NOT NULL,
+    PRIMARY KEY (id),
+    UNIQUE (_name)
+);
+
+CREATE TABLE studiengang (
+    id INTEGER NOT NULL,
+    _name VARCHAR NOT NULL,
+    _gesamt_ects_punkte INTEGER NOT NULL,
+    hochschule_id INTEGER,
+    PRIMARY KEY (id),
+    FOREIGN KEY(hochschule_id) REFERENCES hochschule (id)
+);
+
+CREATE TABLE student (
+    id INTEGER NOT NULL,
+    _name VARCHAR NOT NULL,
+    _matrikelnummer VARCHAR NOT NULL,
+    _email VARCHAR NOT NULL,
+    password VARCHAR NOT NULL,
+    _ziel_note FLOAT NOT NULL,
+    _start_datum DATE NOT NULL,
+    _ziel_datum DATE NOT NULL,
+    _exmatrikulationsdatum DATE,
+    hochschule_id INTEGER,
+    studiengang_id INTEGER,
+    _semester_anzahl INTEGER NOT NULL,
+    _modul_anzahl INTEGER NOT NULL,
+    PRIMARY KEY (id),
+    UNIQUE (_email),
+    FOREIGN KEY(hochschule_id) REFERENCES hochschule (id),
+    FOREIGN KEY(studiengang_id) REFERENCES studiengang (id)
+);
+
+CREATE TABLE modul (
+    id INTEGER NOT NULL,
+    _name VARCHAR NOT NULL,
+    _modulcode VARCHAR NOT NULL,
+    _ects_punkte INTEGER NOT NULL,
+    studiengang_id INTEGER,
+    PRIMARY KEY (id),
+    UNIQUE (_modulcode),
+    FOREIGN KEY(studiengang_id) REFERENCES studiengang (id)
+);
+
+CREATE TABLE kurs (
+    id INTEGER NOT NULL,
+    _name VARCHAR NOT NULL,
+    _nummer VARCHAR NOT NULL,
+    modul_id INTEGER,
+    PRIMARY KEY (id),
+    UNIQUE (_nummer),
+    FOREIGN KEY(modul_id) REFERENCES modul (id)
+);
+
+CREATE TABLE enrollment (
+    id INTEGER NOT NULL,
+    _einschreibe_datum DATE NOT NULL,
+    _end_datum DATE,
+    _status VARCHAR(15) NOT NULL,
+    student_id INTEGER,
+    modul_id INTEGER,
+    _anzahl_pruefungsleistungen INTEGER NOT NULL,
+    PRIMARY KEY (id),
+    UNIQUE (id),
+    FOREIGN KEY(student_id) REFERENCES student (id),
+    FOREIGN KEY(modul_id) REFERENCES modul (id)
+);
+
+CREATE TABLE semester (
+    id INTEGER NOT NULL,
+    _nummer INTEGER NOT NULL,
+    _beginn DATE NOT NULL,
+    _ende DATE NOT NULL,
+    student_id INTEGER,
+    PRIMARY KEY (id),
+    FOREIGN KEY(student_id) REFERENCES student (id)
+);
+
+CREATE TABLE pruefungsleistung (
+    id INTEGER NOT NULL,
+    _teilpruefung INTEGER NOT NULL,
+    _teilpruefung_gewicht FLOAT NOT NULL,
+    _versuch INTEGER NOT NULL,
+    _note FLOAT,
+    _datum DATE,
+    enrollment_id INTEGER NOT NULL,
+    PRIMARY KEY (id),
+    FOREIGN KEY(enrollment_id) REFERENCES enrollment (id)
+);
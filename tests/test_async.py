@@ -0,0 +1,116 @@
+import asyncio
+import datetime
+import pytest
+from src.async_controller import AsyncController
+from src.async_database import AsyncDatabaseManager
+from src.database import DBTransactionError
+from src.models import EnrollmentStatus
+
+
+async def _lege_daten_an(db: AsyncDatabaseManager) -> int:
+    """Legt einen Student mit Hochschule, Studiengang, Semester und einem Enrollment an.
+
+    Returns:
+        int: ID des Enrollments.
+    """
+    hs = await db.add_hochschule("HS")
+    sg = await db.add_studiengang("SG", 180)
+    sg.hochschule_id = hs.id
+    async with db.session_scope() as session:
+        await session.merge(sg)
+        await db.commit_or_rollback(session)
+    student = await db.add_student(
+        "User",
+        "111",
+        "u@gmail.com",
+        "pw",
+        6,
+        36,
+        datetime.date(2024, 1, 1),
+        datetime.date(2027, 1, 1),
+        2.0,
+    )
+    student.hochschule_id = hs.id
+    student.studiengang_id = sg.id
+    async with db.session_scope() as session:
+        await session.merge(student)
+        await db.commit_or_rollback(session)
+    await db.add_semester(
+        student, 1, datetime.date(2024, 1, 1), datetime.date(2024, 6, 30)
+    )
+    modul = await db.add_modul("Modul", "M1", 5, sg.id)
+    enrollment = await db.add_enrollment(
+        student, modul, EnrollmentStatus.IN_BEARBEITUNG, datetime.date(2024, 1, 2), 1
+    )
+    return enrollment.id
+
+
+def test_async_database_manager(tmp_path):
+    """Testet die ``add_*``/``lade_*``-API des AsyncDatabaseManager.
+
+    Verifiziert:
+        - dass angelegte Objekte über die ``lade_*``-Methoden gefunden werden,
+        - dass eine Unique-Verletzung einen ``DBTransactionError`` auslöst.
+    """
+
+    async def ablauf():
+        db = await AsyncDatabaseManager.erstelle(
+            url=f"sqlite+aiosqlite:///{tmp_path / 'async.db'}"
+        )
+        try:
+            await _lege_daten_an(db)
+            student = await db.lade_student_mit_beziehungen("u@gmail.com")
+            assert student.studiengang.name == "SG"
+            assert len(student.enrollments) == 1
+            assert (await db.lade_modul("M1")).name == "Modul"
+            hs = (await db.lade_alle_hochschulen())[0]
+            assert [
+                sg.name for sg in await db.lade_alle_studiengaenge_von_hochschule(hs)
+            ] == ["SG"]
+            assert (await db.lade_studiengang_mit_name(hs.id, "sg")).name == "SG"
+            with pytest.raises(DBTransactionError):
+                await db.add_kurs("Kurs", "K1")
+                await db.add_kurs("Kurs", "K1")
+        finally:
+            await db.dispose()
+
+    asyncio.run(ablauf())
+
+
+def test_async_controller(tmp_path):
+    """Testet die asynchrone Fassade über die Lesepfade des Controllers.
+
+    Verifiziert:
+        - Login mit gültigen und ungültigen Zugangsdaten,
+        - Dashboard- und Enrollment-Daten entsprechen dem synchronen Controller,
+        - dass parallele Aufrufe im selben Event-Loop möglich sind.
+    """
+
+    async def ablauf():
+        db = await AsyncDatabaseManager.erstelle(
+            url=f"sqlite+aiosqlite:///{tmp_path / 'async.db'}"
+        )
+        try:
+            enrollment_id = await _lege_daten_an(db)
+            controller = AsyncController(db, offline=True)
+            with pytest.raises(RuntimeError):
+                await controller.load_dashboard_data()
+            assert not await controller.login("u@gmail.com", "falsch")
+            assert not await controller.login("keine_email", "pw")
+            assert await controller.login("u@gmail.com", "pw")
+
+            dashboard, enrollment = await asyncio.gather(
+                controller.load_dashboard_data(),
+                controller.get_enrollment_data(enrollment_id),
+            )
+            assert dashboard["hochschule"] == "HS"
+            assert dashboard["in_bearbeitung"] == 1
+            assert dashboard["ausstehend"] == 35
+            assert len(dashboard["semester"]) == 1
+            assert enrollment["modul_code"] == "M1"
+            assert len(enrollment["pruefungsleistungen"]) == 0
+            assert await controller.get_enrollment_data(-1) == {}
+        finally:
+            await db.dispose()
+
+    asyncio.run(ablauf())
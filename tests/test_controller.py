@@ -1,5 +1,12 @@
 import datetime
+import gc
+import threading
 import pytest
+from sqlalchemy import event, text
+from src.database import DatabaseManager, DBKonfliktError, DBTransactionError
+from src.main import Controller
+from src.models import EnrollmentStatus
+from src.schreib_warteschlange import SchreibWarteschlange
 
 
 def test_create_account_and_semesters(controller):
@@ -139,7 +146,8 @@ def test_changes(controller):
         - Aktualisierung von Email, Passwort, Name und Matrikelnummer,
         - Neuberechnung von Semestern bei geänderter Semesteranzahl,
         - Neuberechnung von Semestern bei geändertem Startdatum,
-        - Änderungen an Studiengangs- und Modul-Attributen.
+        - Änderungen an Studiengangs- und Modul-Attributen,
+        - Wechsel auf einen vorhandenen Studiengang über den normalisierten Namen.
     """
     hs = controller.db.add_hochschule("HS2")
     sg = controller.db.add_studiengang("SG2", 180)
@@ -177,6 +185,58 @@ def test_changes(controller):
     # assert s.studiengang.gesamt_ects_punkte == 200
     controller.change_modul_anzahl(35)
     assert s.modul_anzahl == 35
+    # Studiengang wird über den normalisierten Namen gefunden, nicht neu angelegt
+    assert controller.get_studiengaenge_von_hs(hs.id) == {sg.id: "sg2"}
+    controller.change_studiengang(" sg2 ")
+    assert s.studiengang is sg
+    assert controller.get_studiengaenge_von_hs(hs.id) == {sg.id: "sg2"}
+
+
+def test_semester_abgleich(controller, db, assert_statements):
+    """Testet den Abgleich der Semester bei Änderung von Semesteranzahl und Startdatum.
+
+    Verifiziert:
+        - dass vorhandene Semester aktualisiert statt neu angelegt werden (IDs bleiben),
+        - dass fehlende Semester ergänzt und überzählige gelöscht werden,
+        - dass jede Änderung mit einem Flush (feste Anzahl an Statements) geschrieben wird.
+    """
+    s = db.add_student(
+        "U",
+        "1",
+        "t@gmail.com",
+        "pw",
+        6,
+        36,
+        datetime.date(2024, 1, 1),
+        datetime.date(2027, 1, 1),
+        2.0,
+    )
+    controller.student = s
+    # Laden der (leeren) Semester und ein INSERT für alle Semester
+    with assert_statements(2):
+        controller.erstelle_semester_fuer_student()
+    ids = [semester.id for semester in s.semester]
+    assert len(ids) == 6
+
+    # Student-UPDATE und ein INSERT für beide neuen Semester
+    with assert_statements(2):
+        controller.change_semester_anzahl(8)
+    assert [semester.id for semester in s.semester][:6] == ids
+    assert [semester.nummer for semester in s.semester] == list(range(1, 9))
+
+    # Student-UPDATE und ein DELETE für die überzähligen Semester
+    with assert_statements(2):
+        controller.change_semester_anzahl(4)
+    assert [semester.id for semester in s.semester] == ids[:4]
+    assert db.session.execute(text("SELECT COUNT(*) FROM semester")).scalar() == 4
+
+    # Student-UPDATE und ein gebündeltes UPDATE (executemany) für alle Semester
+    with assert_statements(2) as statements:
+        controller.change_startdatum(datetime.date(2024, 4, 1))
+    assert all(statement.startswith("UPDATE") for statement in statements)
+    assert [semester.id for semester in s.semester] == ids[:4]
+    assert s.semester[1].beginn == datetime.date(2024, 10, 1)
+    assert s.semester[1].ende == datetime.date(2025, 3, 31)
 
 
 def test_time_progress(controller, db):
@@ -270,7 +330,8 @@ def test_counts_and_avg(controller, db):
 def test_logout(controller, db):
     """Testet den Logout-Vorgang des Controllers.
 
-    Verifiziert, dass der vom Controller gehaltene Student auf ``None`` gesetzt wird.
+    Verifiziert, dass der vom Controller gehaltene Student auf ``None`` gesetzt wird
+    und die Modulsuche danach ``RuntimeError`` auslöst.
     """
     s = db.add_student(
         "U",
@@ -286,6 +347,8 @@ def test_logout(controller, db):
     controller.student = s
     controller.logout()
     assert controller.student is None
+    with pytest.raises(RuntimeError):
+        controller.suche_module("Data")
 
 
 def test_delete_student(controller, db):
@@ -308,3 +371,713 @@ def test_delete_student(controller, db):
     controller.student = t
     controller.delete_student()
     assert db.lade_student("x@gmail.com") is None
+
+
+def test_unit_of_work_ein_commit_pro_aktion(controller, db):
+    """Testet, dass mehrstufige Controller-Aktionen genau einen Commit auslösen und atomar sind.
+
+    Verifiziert:
+        - genau ein Commit für ``erstelle_account``, ``erstelle_enrollment`` und ``change_hochschule``,
+        - dass ein fehlgeschlagener verschachtelter Scope nur seine eigenen Änderungen zurückrollt,
+        - dass ein fehlgeschlagener äußerer Scope nichts persistiert.
+    """
+    hs = db.add_hochschule("HS")
+    hs2 = db.add_hochschule("HS2")
+    sg = db.add_studiengang("SG", 180)
+    sg.hochschule = hs
+    db.commit_or_rollback()
+    commits = []
+    event.listen(db.engine, "commit", lambda conn: commits.append(conn))
+
+    controller.erstelle_account(
+        {
+            "name": "User",
+            "matrikelnummer": "111",
+            "email": "u@gmail.com",
+            "password": "pw",
+            "semesteranzahl": 6,
+            "modulanzahl": 36,
+            "startdatum": "2024-01-01",
+            "zieldatum": "2028-01-01",
+            "zielnote": 2.0,
+            "hochschulid": hs.id,
+            "studiengang_id": sg.id,
+        }
+    )
+    assert len(commits) == 1
+    controller.erstelle_enrollment(
+        {
+            "modul_name": "M1",
+            "modul_code": "M1",
+            "modul_ects": 5,
+            "kurse_dict": {"K1": "Kurs 1", "K2": "Kurs 2"},
+            "pl_anzahl": 2,
+            "startdatum": "2024-01-02",
+        }
+    )
+    assert len(commits) == 2
+    controller.change_hochschule(hochschul_id=hs2.id, hochschul_name=hs2.name)
+    assert len(commits) == 3
+    assert controller.student.hochschule_id == hs2.id
+
+    with db.unit_of_work():
+        db.add_hochschule("Bleibt")
+        with pytest.raises(ValueError):
+            with db.unit_of_work():
+                db.add_hochschule("Savepoint")
+                raise ValueError
+    with pytest.raises(ValueError):
+        with db.unit_of_work():
+            db.add_hochschule("Rollback")
+            raise ValueError
+    namen = {h.name for h in db.lade_alle_hochschulen()}
+    assert "Bleibt" in namen
+    assert not {"Savepoint", "Rollback"} & namen
+
+
+def test_enrollment_indizes(controller, db, assert_statements, student_mit_enrollment):
+    """Testet die Indizes für Enrollments und Prüfungsleistungen im Controller.
+
+    Verifiziert:
+        - Aufbau beim Anlegen des Accounts, Fortschreiben beim Anlegen von Enrollments,
+        - dass Lookups über den Index keine Statements ausführen,
+        - dass Prüfungsleistungen nur im eigenen Enrollment gefunden werden,
+        - Neuaufbau beim Login, Leeren beim Logout und beim Studiengangwechsel,
+        - dass am Controller vorbei angelegte Enrollments trotzdem gefunden werden.
+    """
+    enrollment, pl = student_mit_enrollment(controller, db)
+    zweites = controller.erstelle_enrollment(
+        {
+            "modul_name": "M2",
+            "modul_code": "M2",
+            "modul_ects": 5,
+            "kurse_dict": {},
+            "pl_anzahl": 1,
+            "startdatum": "2024-01-03",
+        }
+    )
+    assert set(controller._enrollments) == {enrollment["id"], zweites["id"]}
+    assert set(controller._enrollments_nach_modulcode) == {"M1", "M2"}
+    assert len(controller._pruefungsleistungen) == 6
+
+    with assert_statements(0):
+        assert controller.check_if_already_enrolled({"modul_code": "M2"})
+        assert not controller.check_if_already_enrolled({"modul_code": "M3"})
+        assert controller.get_pl_with_id(enrollment["id"], pl["id"])["id"] == pl["id"]
+        assert controller.get_pl_with_id(zweites["id"], pl["id"]) == {}
+    controller.change_pl(
+        enrollment["id"], {"id": pl["id"], "datum": "2024-06-01", "note": 1.3}
+    )
+    assert controller.get_enrollment_data(enrollment["id"])["enrollment_note"] == 1.3
+    liste = controller.get_list_of_enrollments()
+    assert [e["id"] for e in liste] == [enrollment["id"], zweites["id"]]
+    assert liste[0] == controller.get_enrollment_data(enrollment["id"])
+
+    controller.logout()
+    assert controller._enrollments == {} and controller._index_student is None
+    assert controller.login("u@gmail.com", "pw")
+    assert set(controller._enrollments) == {enrollment["id"], zweites["id"]}
+    assert controller._index_student is controller.student
+
+    # am Controller vorbei angelegt: Fehltreffer baut den Index neu auf
+    modul = db.add_modul("M3", "M3", 5, controller.student.studiengang_id)
+    drittes = db.add_enrollment(
+        student=controller.student,
+        modul=modul,
+        status=EnrollmentStatus.IN_BEARBEITUNG,
+        einschreibe_datum=datetime.date(2024, 1, 4),
+        anzahl_pruefungsleistungen=1,
+    )
+    db.commit_or_rollback()
+    assert controller.get_enrollment_data(drittes.id)["modul_code"] == "M3"
+    assert controller.check_if_already_enrolled({"modul_code": "M3"})
+
+    controller.change_studiengang("Anderer Studiengang")
+    assert controller._enrollments == {}
+    assert controller.get_enrollment_data(enrollment["id"]) == {}
+    assert not controller.check_if_already_enrolled({"modul_code": "M1"})
+
+
+def test_dashboard_view_model(
+    controller, db, assert_statements, student_mit_enrollment
+):
+    """Testet das zwischengespeicherte Dashboard-View-Model.
+
+    Verifiziert:
+        - dass ein erneuter Aufruf ohne Änderungen kein Statement ausführt,
+        - dass Operationen nur die betroffenen Teile verwerfen und die Version erhöhen,
+        - dass Lesezugriffe und ``change_password`` das View-Model nicht verwerfen,
+        - dass Änderungen der UI am Ergebnis das View-Model nicht verändern,
+        - dass ein Datumswechsel und ein Fehler das ganze View-Model verwerfen.
+    """
+    enrollment, pl = student_mit_enrollment(controller, db)
+    daten = controller.load_dashboard_data()
+    version = daten["version"]
+    with assert_statements(0):
+        assert controller.load_dashboard_data() == daten
+    assert not controller.dashboard_veraltet(version)
+
+    daten["name"] = "UI"
+    daten["enrollments"][0]["modul_name"] = "UI"
+    daten["semester"].clear()
+    controller.get_enrollment_data(enrollment["id"])
+    controller.change_password("neu")
+    assert not controller.dashboard_veraltet(version)
+    unveraendert = controller.load_dashboard_data()
+    assert unveraendert["name"] == "User"
+    assert unveraendert["enrollments"][0]["modul_name"] == "M1"
+    assert len(unveraendert["semester"]) == 6
+
+    controller.change_name("Neu")
+    assert controller.dashboard_veraltet(version)
+    assert set(controller._dashboard_teile) == {"semester", "enrollments", "kennzahlen"}
+    daten = controller.load_dashboard_data()
+    assert daten["name"] == "Neu" and daten["version"] > version
+
+    controller.change_pl(
+        enrollment["id"], {"id": pl["id"], "datum": "2024-06-01", "note": 1.7}
+    )
+    assert set(controller._dashboard_teile) == {"kopf", "semester"}
+    daten = controller.load_dashboard_data()
+    assert daten["notendurchschnitt"] == 1.7
+    assert daten["enrollments"][0]["enrollment_note"] == 1.7
+
+    controller.change_zieldatum(datetime.date(2029, 1, 1))
+    assert set(controller._dashboard_teile) == {"enrollments", "kennzahlen"}
+    assert controller.load_dashboard_data()["zieldatum"] == datetime.date(2029, 1, 1)
+    controller.change_semester_anzahl(8)
+    assert controller.load_dashboard_data()["semesteranzahl"] == 8
+
+    # Datumswechsel: Zeitfortschritt und Status hängen vom heutigen Datum ab
+    controller._dashboard_tag = datetime.date(2000, 1, 1)
+    assert controller.dashboard_veraltet(controller.dashboard_version)
+    version = controller.load_dashboard_data()["version"]
+    assert not controller.dashboard_veraltet(version)
+
+    with pytest.raises(DBTransactionError):
+        controller.change_zielnote("keine Note")
+    assert controller._dashboard_teile == {}
+    assert controller.dashboard_veraltet(version)
+
+
+def test_session_pro_operation_speicher_konstant(student_mit_enrollment):
+    """Testet, dass die Identity Map bei ``pro_operation`` nicht über Operationen hinweg wächst.
+
+    Verifiziert:
+        - dass nach jeder Operation keine Objekte mehr in der Session des Threads liegen,
+        - dass die Anzahl lebender Objekte über 10.000 ``change_pl``-Aufrufe konstant bleibt.
+    """
+    db = DatabaseManager(
+        url="sqlite+pysqlite:///:memory:", session_strategie="pro_operation"
+    )
+    controller = Controller(db=db, seed=False)
+    enrollment, pl = student_mit_enrollment(controller, db)
+
+    def aendere(anzahl):
+        for i in range(anzahl):
+            controller.change_pl(
+                enrollment["id"],
+                {"id": pl["id"], "datum": "2024-06-01", "note": 1.0 + (i % 30) / 10},
+            )
+        assert len(db.session.identity_map) == 0
+
+    aendere(500)
+    gc.collect()
+    vorher = len(gc.get_objects())
+    aendere(10_000)
+    gc.collect()
+    nachher = len(gc.get_objects())
+    assert nachher - vorher < 500
+    assert controller.get_enrollment_data(enrollment["id"])["enrollment_note"] == 1.9
+
+
+def test_controller_aus_worker_threads(tmp_path, student_mit_enrollment):
+    """Testet die Nutzung eines Controllers aus mehreren Worker-Threads (``pro_operation``).
+
+    Verifiziert:
+        - dass parallele Schreib- und Lesezugriffe ohne Fehler durchlaufen,
+        - dass alle Änderungen persistiert werden.
+    """
+    db = DatabaseManager(
+        url=f"sqlite+pysqlite:///{tmp_path / 'threads.db'}",
+        session_strategie="pro_operation",
+    )
+    controller = Controller(db=db, seed=False)
+    enrollment, pl = student_mit_enrollment(controller, db)
+    fehler = []
+
+    def worker(nummer):
+        try:
+            for _ in range(20):
+                controller.change_pl(
+                    enrollment["id"],
+                    {"id": pl["id"], "datum": "2024-06-01", "note": 1.0 + nummer / 10},
+                )
+                controller.get_enrollment_data(enrollment["id"])
+                controller.load_dashboard_data()
+        except Exception as e:  # pragma: no cover - nur im Fehlerfall
+            fehler.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert not fehler
+    note = controller.get_enrollment_data(enrollment["id"])["enrollment_note"]
+    assert note in {1.0, 1.1, 1.2, 1.3}
+    db.engine.dispose()
+
+
+class _FakeWidget:
+    """Tk-freier Ersatz für ``widget.after``: sammelt die geplanten Callbacks."""
+
+    def __init__(self) -> None:
+        self.geplant = []
+
+    def after(self, ms, funktion) -> None:
+        self.geplant.append(funktion)
+
+    def takt(self) -> None:
+        geplant, self.geplant = self.geplant, []
+        for funktion in geplant:
+            funktion()
+
+
+def test_schreib_warteschlange(tmp_path, student_mit_enrollment):
+    """Testet die Write-Behind-Warteschlange mit Controller-Operationen.
+
+    Verifiziert:
+        - dass alle Commits im Schreib-Thread laufen, nicht im aufrufenden Thread,
+        - dass Aufträge in der Reihenfolge des Einreihens ausgeführt werden,
+        - dass wartende Aufträge mit gleichem Schlüssel zusammengefasst werden,
+        - dass Erfolg und Fehler erst über ``after()`` im aufrufenden Thread gemeldet werden,
+        - dass ``stoppe`` ausstehende Aufträge noch ausführt.
+    """
+    db = DatabaseManager(url=f"sqlite+pysqlite:///{tmp_path / 'schreiber.db'}")
+    controller = Controller(db=db, seed=False)
+    enrollment, pl = student_mit_enrollment(controller, db)
+    commit_threads = []
+    event.listen(
+        db.engine,
+        "commit",
+        lambda conn: commit_threads.append(threading.current_thread().name),
+    )
+    schreiber = SchreibWarteschlange()
+    widget = _FakeWidget()
+    schreiber.starte_mit_after(widget)
+
+    # Schreib-Thread blockieren, damit sich Aufträge stauen
+    freigabe = threading.Event()
+    schreiber.einreihen(freigabe.wait)
+    meldungen = []
+    ersetzt = schreiber.einreihen(
+        controller.change_name,
+        "Erster",
+        schluessel="change_name",
+        bei_erfolg=lambda _: meldungen.append("erster"),
+    )
+    schreiber.einreihen(
+        controller.change_pl,
+        enrollment["id"],
+        {"id": pl["id"], "datum": "2024-06-01", "note": 1.7},
+        schluessel=("change_pl", pl["id"]),
+        bei_erfolg=lambda _: meldungen.append(("pl", threading.current_thread().name)),
+    )
+    schreiber.einreihen(
+        controller.change_name,
+        "Zweiter",
+        schluessel="change_name",
+        bei_erfolg=lambda _: meldungen.append("zweiter"),
+    )
+    fehlgeschlagen = schreiber.einreihen(
+        controller.change_zielnote,
+        "keine Note",
+        bei_fehler=lambda e: meldungen.append(type(e).__name__),
+    )
+    assert schreiber.ausstehend == 4
+    assert schreiber.zusammengefasst == 1
+
+    freigabe.set()
+    assert schreiber.warte(timeout=10)
+    assert commit_threads and set(commit_threads) == {"db-schreiber"}
+    assert ersetzt.result() is None
+    assert isinstance(fehlgeschlagen.exception(), Exception)
+    assert controller.student.name == "Zweiter"
+    assert controller.get_enrollment_data(enrollment["id"])["enrollment_note"] == 1.7
+
+    # Rückmeldungen erst im Takt der Hauptschleife, in Einreihungsreihenfolge
+    assert meldungen == []
+    widget.takt()
+    assert meldungen[:2] == [("pl", threading.current_thread().name), "zweiter"]
+    assert len(meldungen) == 3
+    assert len(widget.geplant) == 1
+
+    schreiber.einreihen(controller.change_name, "Dritter")
+    schreiber.stoppe()
+    assert controller.student.name == "Dritter"
+    with pytest.raises(RuntimeError):
+        schreiber.einreihen(controller.change_name, "Vierter")
+    widget.takt()
+    assert widget.geplant == []
+    db.engine.dispose()
+
+
+def test_erstelle_enrollment_gebuendelt(controller, db):
+    """Testet, dass ``erstelle_enrollment`` Kurse und Prüfungsleistungen gebündelt anlegt.
+
+    Verifiziert:
+        - eine einzige Abfrage für alle Kursnummern und ein INSERT für fehlende Kurse,
+        - ein einziges INSERT-Statement für alle Prüfungsleistungen,
+        - dass bereits vorhandene Kurse wiederverwendet werden.
+    """
+    hs = db.add_hochschule("HS")
+    sg = db.add_studiengang("SG", 180)
+    sg.hochschule = hs
+    db.commit_or_rollback()
+    controller.erstelle_account(
+        {
+            "name": "User",
+            "matrikelnummer": "111",
+            "email": "u@gmail.com",
+            "password": "pw",
+            "semesteranzahl": 6,
+            "modulanzahl": 36,
+            "startdatum": "2024-01-01",
+            "zieldatum": "2028-01-01",
+            "zielnote": 2.0,
+            "hochschulid": hs.id,
+            "studiengang_id": sg.id,
+        }
+    )
+    vorhanden = db.add_kurs("Kurs 1", "K1")
+    statements = []
+    event.listen(
+        db.engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    enrollment = controller.erstelle_enrollment(
+        {
+            "modul_name": "M1",
+            "modul_code": "M1",
+            "modul_ects": 5,
+            "kurse_dict": {"K1": "Kurs 1", "K2": "Kurs 2", "K3": "Kurs 3"},
+            "pl_anzahl": 4,
+            "startdatum": "2024-01-02",
+        }
+    )
+
+    def anzahl(prefix):
+        return sum(statement.startswith(prefix) for statement in statements)
+
+    # eine IN-Abfrage über alle Kursnummern und das Laden von ``modul.kurse``
+    assert anzahl("SELECT kurs.") == 2
+    assert anzahl("INSERT INTO kurs") == 1
+    assert anzahl("INSERT INTO pruefungsleistung") == 1
+    assert len(enrollment["pruefungsleistungen"]) == 12
+    assert enrollment["status"] == "IN_BEARBEITUNG"
+    assert {k["nummer"] for k in enrollment["kurse"]} == {"K1", "K2", "K3"}
+    assert db.lade_kurs("K1") is vorhanden
+
+
+def test_kennzahlen_inkrementell(controller, db, student_mit_enrollment):
+    """Testet die inkrementell gepflegten Kennzahlen am Student und die Konsistenzprüfung.
+
+    Verifiziert:
+        - dass die Kennzahlen nach Enrollment-, PL- und Studiengang-Änderungen konsistent sind,
+        - dass die Dashboard-Werte aus den Kennzahlen stammen,
+        - dass die Konsistenzprüfung manipulierte und fehlende (NULL) Kennzahlen neu berechnet.
+    """
+    enrollment, pl = student_mit_enrollment(controller, db)
+    zweites = controller.erstelle_enrollment(
+        {
+            "modul_name": "M2",
+            "modul_code": "M2",
+            "modul_ects": 10,
+            "kurse_dict": {},
+            "pl_anzahl": 1,
+            "startdatum": "2024-01-03",
+        }
+    )
+    student = controller.student
+    assert student.kennzahlen()["_anzahl_in_bearbeitung"] == 2
+
+    controller.change_pl(
+        enrollment["id"], {"id": pl["id"], "datum": "2024-06-01", "note": 1.7}
+    )
+    for versuch in zweites["pruefungsleistungen"]:
+        controller.change_pl(
+            zweites["id"], {"id": versuch["id"], "datum": "2024-06-01", "note": 5.0}
+        )
+    daten = controller.load_dashboard_data()
+    assert daten["abgeschlossen"] == 1
+    assert daten["nicht_bestanden"] == 1
+    assert daten["in_bearbeitung"] == 0
+    assert daten["erarbeitete_ects"] == 5
+    assert daten["notendurchschnitt"] == 1.7
+    assert db.pruefe_kennzahlen(student)
+
+    # Note ändern: alter Beitrag wird entfernt, neuer addiert
+    controller.change_pl(
+        enrollment["id"], {"id": pl["id"], "datum": "2024-06-02", "note": 2.3}
+    )
+    assert controller.get_notendurchschnitt() == 2.3
+    assert db.pruefe_kennzahlen(student)
+
+    student._erarbeitete_ects = 99
+    assert not db.pruefe_kennzahlen(student)
+    assert controller.get_erarbeitete_ects() == 5
+
+    student.setze_kennzahlen_zurueck(None)
+    db.commit_or_rollback()
+    assert controller.login("u@gmail.com", "pw")
+    assert student.kennzahlen_gueltig
+    assert db.pruefe_kennzahlen(student)
+
+    controller.change_studiengang("Anderer Studiengang")
+    assert student.kennzahlen()["_anzahl_abgeschlossen"] == 0
+    assert controller.get_notendurchschnitt() is None
+    assert db.pruefe_kennzahlen(student)
+
+
+def test_dashboard_kennzahlen_sql(controller, db, monkeypatch, student_mit_enrollment):
+    """Testet die gruppierte SQL-Abfrage für die Kennzahlen des Dashboard-Kopfs.
+
+    Verifiziert:
+        - gleiche Ergebnisse wie die Berechnung über ORM-Objekte (inkl. gewichteter Noten),
+        - dass der Controller ab ``SQL_KENNZAHLEN_AB`` Enrollments die SQL-Abfrage nutzt.
+    """
+    enrollment, pl = student_mit_enrollment(controller, db)
+    controller.change_pl(
+        enrollment["id"], {"id": pl["id"], "datum": "2024-06-01", "note": 1.3}
+    )
+    zwei_teile = controller.erstelle_enrollment(
+        {
+            "modul_name": "M2",
+            "modul_code": "M2",
+            "modul_ects": 10,
+            "kurse_dict": {},
+            "pl_anzahl": 2,
+            "startdatum": "2024-01-03",
+        }
+    )
+    versuche = zwei_teile["pruefungsleistungen"]
+    for versuch, note in ((versuche[0], 5.0), (versuche[1], 2.7), (versuche[3], 1.0)):
+        controller.change_pl(
+            zwei_teile["id"], {"id": versuch["id"], "datum": "2024-07-01", "note": note}
+        )
+    offen = controller.erstelle_enrollment(
+        {
+            "modul_name": "M3",
+            "modul_code": "M3",
+            "modul_ects": 5,
+            "kurse_dict": {},
+            "pl_anzahl": 1,
+            "startdatum": "2024-01-04",
+        }
+    )
+
+    kennzahlen = db.lade_dashboard_kennzahlen(controller.student.id)
+    assert kennzahlen["abgeschlossen"] == 2
+    assert kennzahlen["in_bearbeitung"] == 1
+    assert kennzahlen["nicht_bestanden"] == 0
+    assert kennzahlen["erarbeitete_ects"] == controller.get_erarbeitete_ects() == 15
+    assert kennzahlen["notendurchschnitt"] == controller.get_notendurchschnitt()
+    assert kennzahlen["enrollment_noten"] == {
+        e.id: e.berechne_enrollment_note() for e in controller.student.enrollments
+    }
+    assert kennzahlen["enrollment_noten"][offen["id"]] is None
+
+    monkeypatch.setattr("src.main.SQL_KENNZAHLEN_AB", 1)
+    controller.student.setze_kennzahlen_zurueck(None)
+    db.session.expire(controller.student, ["enrollments"])
+    statements = []
+    event.listen(
+        db.engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    controller.berechne_kennzahlen_neu()
+    assert not any("FROM pruefungsleistung" in s for s in statements)
+    assert db.pruefe_kennzahlen(controller.student)
+
+
+@pytest.mark.parametrize("anzahl_enrollments", [1, 4])
+def test_lade_profile_feste_statement_anzahl(
+    controller, db, assert_statements, anzahl_enrollments, student_mit_enrollment
+):
+    """Testet, dass die Lade-Profile den Student-Graphen mit fester Statement-Anzahl laden.
+
+    Verifiziert (unabhängig von der Anzahl der Enrollments):
+        - Login lädt Student, Beziehungen, Enrollments, Module, Kurse und Prüfungsleistungen,
+        - Dashboard- und Enrollment-Daten benötigen danach kein weiteres Statement.
+    """
+    enrollment, _ = student_mit_enrollment(controller, db)
+    for i in range(1, anzahl_enrollments):
+        controller.erstelle_enrollment(
+            {
+                "modul_name": f"M{i + 1}",
+                "modul_code": f"M{i + 1}",
+                "modul_ects": 5,
+                "kurse_dict": {f"K{i}": f"Kurs {i}"},
+                "pl_anzahl": 2,
+                "startdatum": "2024-01-03",
+            }
+        )
+    controller.logout()
+
+    with assert_statements(8):
+        assert controller.login("u@gmail.com", "pw")
+    with assert_statements(0):
+        daten = controller.load_dashboard_data()
+    assert len(daten["enrollments"]) == anzahl_enrollments
+    with assert_statements(0):
+        controller.get_enrollment_data(enrollment["id"])
+
+
+@pytest.mark.parametrize("anzahl_enrollments", [1, 4])
+def test_lade_profile_pro_operation(
+    assert_statements, anzahl_enrollments, student_mit_enrollment
+):
+    """Testet die Lade-Profile der Operationen bei der Session-Strategie ``pro_operation``.
+
+    Verifiziert, dass ``load_dashboard_data`` und ``get_enrollment_data`` eine feste Anzahl
+    an Statements benötigen, unabhängig von der Anzahl der Enrollments.
+    """
+    db = DatabaseManager(
+        url="sqlite+pysqlite:///:memory:", session_strategie="pro_operation"
+    )
+    controller = Controller(db=db, seed=False)
+    enrollment, _ = student_mit_enrollment(controller, db)
+    for i in range(1, anzahl_enrollments):
+        controller.erstelle_enrollment(
+            {
+                "modul_name": f"M{i + 1}",
+                "modul_code": f"M{i + 1}",
+                "modul_ects": 5,
+                "kurse_dict": {},
+                "pl_anzahl": 1,
+                "startdatum": "2024-01-03",
+            }
+        )
+    with assert_statements(8, engine=db.engine):
+        controller.load_dashboard_data()
+    with assert_statements(5, engine=db.engine):
+        controller.get_enrollment_data(enrollment["id"])
+
+
+@pytest.mark.parametrize("anzahl_enrollments", [1, 4])
+def test_loeschen_per_on_delete_cascade(
+    controller, db, assert_statements, anzahl_enrollments, student_mit_enrollment
+):
+    """Testet das Löschen von Enrollments und Accounts über ``ON DELETE CASCADE``.
+
+    Verifiziert (unabhängig von der Anzahl der Enrollments):
+        - dass ``change_studiengang`` und ``delete_student`` eine feste Anzahl an Statements benötigen,
+        - dass die abhängigen Zeilen von SQLite gelöscht werden.
+    """
+    student_mit_enrollment(controller, db)
+    for i in range(1, anzahl_enrollments):
+        controller.erstelle_enrollment(
+            {
+                "modul_name": f"M{i + 1}",
+                "modul_code": f"M{i + 1}",
+                "modul_ects": 5,
+                "kurse_dict": {},
+                "pl_anzahl": 2,
+                "startdatum": "2024-01-03",
+            }
+        )
+    controller.logout()
+    assert controller.login("u@gmail.com", "pw")
+
+    def zaehle(tabelle: str) -> int:
+        return db.session.execute(text(f"SELECT COUNT(*) FROM {tabelle}")).scalar()
+
+    assert zaehle("enrollment") == anzahl_enrollments
+    with assert_statements(3):
+        controller.change_studiengang(controller.student.studiengang.name)
+    assert controller.student.enrollments == []
+    assert zaehle("enrollment") == 0
+    assert zaehle("pruefungsleistung") == 0
+    assert db.pruefe_kennzahlen(controller.student)
+
+    with assert_statements(1):
+        controller.delete_student()
+    assert zaehle("student") == 0
+    assert zaehle("semester") == 0
+
+
+def test_optimistische_sperre_zwei_prozesse(tmp_path, caplog, student_mit_enrollment):
+    """Testet konkurrierende Änderungen zweier Controller auf derselben Datenbankdatei.
+
+    Jeder Controller hat einen eigenen DatabaseManager (wie zwei Programmfenster).
+
+    Verifiziert:
+        - dass die langlebige Session nach einer Operation keine Transaktion offen hält,
+        - dass ein Schreibzugriff auf veralteten Daten als ``DBKonfliktError`` gemeldet wird,
+        - dass wiederholbare Operationen nach dem Konflikt auf frischen Daten wiederholt werden,
+        - dass die Kennzahlen dabei nicht durch einen veralteten Stand überschrieben werden.
+    """
+    url = f"sqlite+pysqlite:///{tmp_path / 'geteilt.db'}"
+    db_a = DatabaseManager(url=url)
+    controller_a = Controller(db=db_a, seed=False)
+    enrollment, pl = student_mit_enrollment(controller_a, db_a)
+    db_b = DatabaseManager(url=url)
+    controller_b = Controller(db=db_b, seed=False)
+    assert controller_b.login("u@gmail.com", "pw")
+    controller_b.load_dashboard_data()
+    assert not db_b.session.in_transaction()
+
+    controller_a.change_name("Neu A")
+    # B arbeitet auf dem veralteten Stand, ohne Wiederholung: Konflikt
+    controller_b.student.name = "Neu B"
+    with pytest.raises(DBKonfliktError):
+        db_b.commit_or_rollback(action="test")
+    assert controller_b.student.name == "Neu A"
+
+    controller_a.change_name("Neu A2")
+    with caplog.at_level("WARNING", logger="src.main"):
+        controller_b.change_pl(
+            enrollment["id"], {"id": pl["id"], "datum": "2024-06-01", "note": 2.0}
+        )
+    assert "Konflikt in change_pl, Versuch 2 von 3." in caplog.text
+    assert controller_b.student.name == "Neu A2"
+    assert controller_b.get_notendurchschnitt() == 2.0
+
+    # A sieht die Änderung von B nach dem eigenen Konflikt
+    controller_a.change_pl(
+        enrollment["id"], {"id": pl["id"], "datum": "2024-06-02", "note": 1.0}
+    )
+    assert controller_a.get_notendurchschnitt() == 1.0
+    assert db_a.pruefe_kennzahlen(controller_a.student)
+    db_b.session.expire_all()
+    assert controller_b.get_notendurchschnitt() == 1.0
+
+    # B legt ein Enrollment an, A (veraltet) dasselbe: die Wiederholung nach dem
+    # Konflikt erkennt das Enrollment von B und legt kein zweites an
+    eingabe = {
+        "modul_name": "M3",
+        "modul_code": "M3",
+        "modul_ects": 5,
+        "kurse_dict": {},
+        "pl_anzahl": 1,
+        "startdatum": "2024-01-04",
+    }
+    assert not controller_a.check_if_already_enrolled(eingabe)
+    von_b = controller_b.erstelle_enrollment(eingabe)
+    caplog.clear()
+    with caplog.at_level("WARNING", logger="src.main"):
+        von_a = controller_a.erstelle_enrollment(eingabe)
+    assert "Konflikt in erstelle_enrollment, Versuch 2 von 3." in caplog.text
+    assert von_a["id"] == von_b["id"]
+    assert [e["modul_code"] for e in controller_a.get_list_of_enrollments()].count(
+        "M3"
+    ) == 1
+    assert db_a.pruefe_kennzahlen(controller_a.student)
+    for db in (db_a, db_b):
+        db.session.close()
+        db.engine.dispose()
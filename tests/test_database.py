@@ -0,0 +1,709 @@
+import datetime
+import logging
+from pathlib import Path
+import pytest
+import sqlite3
+import time
+from src.database import (
+    ENGINE_PROFILE,
+    HS_SEED_SCHLUESSEL,
+    POOL_KONFIGURATION,
+    SCHEMA_VERSION,
+    SCHEMA_VERSION_SCHLUESSEL,
+    SERVER_PROFILE,
+    DatabaseManager,
+    DBTransactionError,
+    _baue_tabelle_neu,
+    engine_optionen,
+    lade_schema_version,
+)
+from src.main import Controller
+from src.models import (
+    Hochschule,
+    Kurs,
+    Student,
+    Studiengang,
+    normalisiere_name,
+    ph,
+)
+from src.wartung import WartungsPlaner
+from sqlalchemy import MetaData, delete, event, func, inspect, select
+from sqlalchemy.pool import QueuePool
+
+SCHEMA_BASELINE = Path(__file__).parent / "fixtures" / "schema_baseline.sql"
+
+
+def test_seed_hochschulen(db):
+    """Testet das Seeden von Hochschulen in einer Transaktion mit gespeicherter Checksumme.
+
+    Verifiziert:
+        - dass nur fehlende und nicht-leere Namen angelegt werden,
+        - dass die Checksumme in der Metadaten-Tabelle gespeichert wird,
+        - dass ein zweiter Lauf ohne Änderung keine Hochschulen lädt oder anlegt,
+        - dass neue Namen bei geänderter Liste ergänzt werden.
+    """
+    db.add_hochschule("HS A")
+    assert db.seed_hochschulen(["", "HS A", "HS B", "HS C", "HS B"]) == 2
+    assert db.session.scalar(select(func.count(Hochschule.id))) == 3
+    checksumme = db.lade_metadaten(HS_SEED_SCHLUESSEL)
+    assert checksumme is not None
+
+    statements = []
+    event.listen(
+        db.engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    assert db.seed_hochschulen(["", "HS A", "HS B", "HS C"]) == 0
+    assert not any("FROM hochschule" in statement for statement in statements)
+
+    assert db.seed_hochschulen(["HS A", "HS B", "HS C", "HS D"]) == 1
+    assert db.lade_metadaten(HS_SEED_SCHLUESSEL) != checksumme
+    assert db.session.scalar(select(func.count(Hochschule.id))) == 4
+
+
+def test_engine_profile(tmp_path):
+    """Testet, dass die PRAGMAs der Engine-Profile pro Verbindung gesetzt werden.
+
+    Verifiziert:
+        - WAL-Modus und ``synchronous=NORMAL`` im Profil ``fast``,
+        - ``synchronous=FULL`` im Profil ``durable``,
+        - dass im Profil ``readonly`` nicht geschrieben werden kann.
+    """
+    url = f"sqlite+pysqlite:///{tmp_path / 'profil.db'}"
+    fast = DatabaseManager(profil="fast", url=url)
+    fast.add_hochschule("HS")
+    assert (
+        fast.session.connection().exec_driver_sql("PRAGMA journal_mode").scalar()
+        == "wal"
+    )
+    assert fast.session.connection().exec_driver_sql("PRAGMA synchronous").scalar() == 1
+    fast.session.close()
+
+    durable = DatabaseManager(profil="durable", url=url)
+    assert (
+        durable.session.connection().exec_driver_sql("PRAGMA synchronous").scalar() == 2
+    )
+    durable.session.close()
+
+    readonly = DatabaseManager(profil="readonly", url=url)
+    assert len(readonly.lade_alle_hochschulen()) == 1
+    with pytest.raises(DBTransactionError):
+        readonly.add_hochschule("HS2")
+    readonly.session.close()
+
+
+def test_engine_optionen():
+    """Testet die Engine-Konfiguration je Datenbank-URL.
+
+    Verifiziert:
+        - dass Server-Datenbanken einen ``QueuePool`` mit Pre-Ping erhalten,
+        - dass einzelne Pool-Einstellungen überschrieben werden können,
+        - dass SQLite den Standard-Pool behält,
+        - dass es für jedes Engine-Profil Einstellungen für Server-Datenbanken gibt.
+    """
+    optionen = engine_optionen(
+        "postgresql+psycopg://user@localhost/iu_dashboard", {"pool_size": 20}
+    )
+    assert optionen["poolclass"] is QueuePool
+    assert optionen["pool_pre_ping"] is True
+    assert optionen["pool_size"] == 20
+    assert optionen["max_overflow"] == POOL_KONFIGURATION["max_overflow"]
+    assert "poolclass" not in engine_optionen("sqlite+pysqlite:///:memory:")
+    assert set(SERVER_PROFILE) == set(ENGINE_PROFILE)
+
+
+def test_migration_bestehender_datenbank(tmp_path):
+    """Testet das Upgrade einer Datenbank ohne Indizes und ohne Schema-Version beim Start.
+
+    Verifiziert:
+        - dass eine neue Datenbank direkt die aktuelle Schema-Version erhält,
+        - dass fehlende Fremdschlüssel-Indizes nachträglich angelegt werden,
+        - dass vorhandene Daten erhalten bleiben.
+    """
+    url = f"sqlite+pysqlite:///{tmp_path / 'alt.db'}"
+    db = DatabaseManager(url=url)
+    with db.engine.begin() as connection:
+        assert lade_schema_version(connection) == SCHEMA_VERSION
+    db.add_hochschule("HS")
+    # Zustand vor Einführung des Migrators herstellen
+    with db.engine.begin() as connection:
+        for index in ("ix_enrollment_student_id", "ix_pruefungsleistung_enrollment_id"):
+            connection.exec_driver_sql(f"DROP INDEX {index}")
+        connection.exec_driver_sql("DROP TABLE metadaten")
+    db.session.close()
+    db.engine.dispose()
+
+    migriert = DatabaseManager(url=url)
+    indizes = {
+        index["name"] for index in inspect(migriert.engine).get_indexes("enrollment")
+    }
+    assert {"ix_enrollment_student_id", "ix_enrollment_modul_id"} <= indizes
+    assert inspect(migriert.engine).get_indexes("pruefungsleistung")
+    with migriert.engine.begin() as connection:
+        assert lade_schema_version(connection) == SCHEMA_VERSION
+    assert [hs.name for hs in migriert.lade_alle_hochschulen()] == ["HS"]
+    migriert.session.close()
+
+
+def test_migration_kennzahlen(tmp_path):
+    """Testet das Ergänzen der Kennzahl-Spalten in einer Datenbank mit Schema-Version 1.
+
+    Verifiziert:
+        - dass fehlende Spalten mit ``NULL`` angelegt werden,
+        - dass die Kennzahlen bei Zugriff neu berechnet werden.
+    """
+    url = f"sqlite+pysqlite:///{tmp_path / 'alt.db'}"
+    db = DatabaseManager(url=url)
+    db.add_student(
+        "U",
+        "1",
+        "u@gmail.com",
+        "pw",
+        6,
+        36,
+        datetime.date(2024, 1, 1),
+        datetime.date(2027, 1, 1),
+        2.0,
+    )
+    with db.engine.begin() as connection:
+        for spalte in Student.KENNZAHL_SPALTEN:
+            connection.exec_driver_sql(f"ALTER TABLE student DROP COLUMN {spalte}")
+        connection.exec_driver_sql(
+            f"UPDATE metadaten SET _wert = '1' WHERE schluessel = '{SCHEMA_VERSION_SCHLUESSEL}'"
+        )
+    db.session.close()
+    db.engine.dispose()
+
+    migriert = DatabaseManager(url=url)
+    spalten = {s["name"] for s in inspect(migriert.engine).get_columns("student")}
+    assert set(Student.KENNZAHL_SPALTEN) <= spalten
+    student = migriert.lade_student("u@gmail.com")
+    assert not student.kennzahlen_gueltig
+    assert not migriert.pruefe_kennzahlen(student)
+    assert student.erarbeitete_ects == 0
+    with migriert.engine.begin() as connection:
+        assert lade_schema_version(connection) == SCHEMA_VERSION
+    migriert.session.close()
+
+
+def test_migration_von_baseline(tmp_path):
+    """Testet das Upgrade einer Datenbank der ersten Version (``fixtures/schema_baseline.sql``).
+
+    Ablauf:
+        - Schema der ersten Version ohne Metadaten-Tabelle anlegen,
+        - Student, Modul, Kurs, Semester, Enrollment und Prüfungsleistungen per SQL einfügen,
+        - Datenbank mit ``DatabaseManager`` öffnen.
+
+    Verifiziert:
+        - dass alle Migrationen bis ``SCHEMA_VERSION`` durchlaufen,
+        - dass alle Zeilen erhalten bleiben und der Login funktioniert,
+        - dass die Versionsspalten ``NOT NULL DEFAULT 1`` sind, wie in einer neuen Datenbank,
+        - dass Änderungen danach die Version hochzählen.
+    """
+    pfad = tmp_path / "baseline.db"
+    with sqlite3.connect(pfad) as verbindung:
+        verbindung.executescript(SCHEMA_BASELINE.read_text(encoding="utf-8"))
+        verbindung.executescript(
+            """
+            INSERT INTO hochschule VALUES (1, 'HS');
+            INSERT INTO studiengang VALUES (1, 'SG', 180, 1);
+            INSERT INTO modul VALUES (1, 'Data Science', 'DLBDS', 5, 1);
+            INSERT INTO kurs VALUES (1, 'Statistik', 'K1', 1);
+            INSERT INTO semester VALUES (1, 1, '2024-01-01', '2024-06-30', 1);
+            INSERT INTO enrollment
+                VALUES (1, '2024-01-02', '2024-06-01', 'ABGESCHLOSSEN', 1, 1, 1);
+            INSERT INTO pruefungsleistung VALUES (1, 0, 1.0, 1, 5.0, '2024-03-01', 1);
+            INSERT INTO pruefungsleistung VALUES (2, 0, 1.0, 2, 1.7, '2024-06-01', 1);
+            """
+        )
+        verbindung.execute(
+            "INSERT INTO student VALUES (1, 'User', '111', 'u@gmail.com', ?, 2.0,"
+            " '2024-01-01', '2027-01-01', NULL, 1, 1, 6, 36)",
+            (ph.hash("pw"),),
+        )
+    verbindung.close()
+
+    db = DatabaseManager(url=f"sqlite+pysqlite:///{pfad}")
+    with db.engine.connect() as connection:
+        assert lade_schema_version(connection) == SCHEMA_VERSION
+    inspektor = inspect(db.engine)
+    for tabelle in ("student", "enrollment", "pruefungsleistung"):
+        spalte = next(
+            s for s in inspektor.get_columns(tabelle) if s["name"] == "_version"
+        )
+        assert not spalte["nullable"], tabelle
+        assert spalte["default"] == "1", tabelle
+    with db.engine.connect() as connection:
+        for tabelle, anzahl in (
+            ("semester", 1),
+            ("enrollment", 1),
+            ("pruefungsleistung", 2),
+            ("kurs", 1),
+        ):
+            zeilen = connection.exec_driver_sql(f"SELECT COUNT(*) FROM {tabelle}")
+            assert zeilen.scalar() == anzahl, tabelle
+
+    controller = Controller(db=db, seed=False)
+    assert controller.login("u@gmail.com", "pw")
+    assert controller.get_erarbeitete_ects() == 5
+    assert controller.get_notendurchschnitt() == 1.7
+    enrollment = controller.get_list_of_enrollments()[0]
+    assert enrollment["modul_code"] == "DLBDS"
+    controller.change_pl(1, {"id": 2, "datum": "2024-06-02", "note": 1.3})
+    with db.engine.connect() as connection:
+        assert (
+            connection.exec_driver_sql(
+                "SELECT _version FROM pruefungsleistung WHERE id = 2"
+            ).scalar()
+            == 2
+        )
+    assert [m.name for m in db.suche_module("Statistik")] == ["Data Science"]
+    db.session.close()
+
+
+def test_migration_versionsspalten(tmp_path):
+    """Testet das Ergänzen der Versionsspalten in einer Datenbank mit Schema-Version 5.
+
+    Verifiziert:
+        - dass bestehende Zeilen die Version 1 erhalten,
+        - dass Änderungen danach die Version hochzählen.
+    """
+    url = f"sqlite+pysqlite:///{tmp_path / 'alt.db'}"
+    db = DatabaseManager(url=url)
+    controller = Controller(db=db, seed=False)
+    hs = db.add_hochschule("HS")
+    controller.erstelle_account(
+        {
+            "name": "User",
+            "matrikelnummer": "111",
+            "email": "u@gmail.com",
+            "password": "pw",
+            "semesteranzahl": 6,
+            "modulanzahl": 36,
+            "startdatum": "2024-01-01",
+            "zieldatum": "2028-01-01",
+            "zielnote": 2.0,
+            "hochschulid": hs.id,
+            "studiengang_id": next(iter(controller.erstelle_studiengang("SG", 180))),
+        }
+    )
+    db.session.close()
+    with db.engine.begin() as connection:
+        for tabelle in ("student", "enrollment", "pruefungsleistung"):
+            connection.exec_driver_sql(f"ALTER TABLE {tabelle} DROP COLUMN _version")
+        connection.exec_driver_sql(
+            f"UPDATE metadaten SET _wert = '5' WHERE schluessel = '{SCHEMA_VERSION_SCHLUESSEL}'"
+        )
+    db.engine.dispose()
+
+    migriert = DatabaseManager(url=url)
+    assert migriert.session.scalar(select(Student._version)) == 1
+    student = migriert.lade_student("u@gmail.com")
+    student.name = "Neu"
+    migriert.commit_or_rollback()
+    assert migriert.session.scalar(select(Student._version)) == 2
+    with migriert.engine.connect() as connection:
+        assert lade_schema_version(connection) == SCHEMA_VERSION
+    migriert.session.close()
+
+
+def test_migration_on_delete_cascade(tmp_path):
+    """Testet den Neuaufbau der Tabellen mit ``ON DELETE CASCADE`` (Schema-Version 2).
+
+    Verifiziert:
+        - dass die Fremdschlüssel nach der Migration ``ON DELETE CASCADE`` tragen,
+        - dass Daten und Indizes erhalten bleiben,
+        - dass das Löschen eines Studenten die abhängigen Zeilen mitlöscht,
+        - dass Migration 4 den Suchindex aus den vorhandenen Modulen aufbaut.
+    """
+    url = f"sqlite+pysqlite:///{tmp_path / 'alt.db'}"
+    db = DatabaseManager(url=url)
+    controller = Controller(db=db, seed=False)
+    hs = db.add_hochschule("HS")
+    controller.erstelle_account(
+        {
+            "name": "User",
+            "matrikelnummer": "111",
+            "email": "u@gmail.com",
+            "password": "pw",
+            "semesteranzahl": 6,
+            "modulanzahl": 36,
+            "startdatum": "2024-01-01",
+            "zieldatum": "2028-01-01",
+            "zielnote": 2.0,
+            "hochschulid": hs.id,
+            "studiengang_id": next(iter(controller.erstelle_studiengang("SG", 180))),
+        }
+    )
+    controller.erstelle_enrollment(
+        {
+            "modul_name": "M1",
+            "modul_code": "M1",
+            "modul_ects": 5,
+            "kurse_dict": {},
+            "pl_anzahl": 1,
+            "startdatum": "2024-01-02",
+        }
+    )
+    db.session.close()
+    # Zustand vor Migration 3: Fremdschlüssel ohne ON DELETE
+    alt = MetaData()
+    for tabelle in Student.metadata.sorted_tables:
+        kopie = tabelle.to_metadata(alt)
+        for fk in kopie.foreign_key_constraints:
+            fk.ondelete = None
+    with db.engine.connect() as connection:
+        connection.exec_driver_sql("PRAGMA foreign_keys=OFF")
+        connection.commit()
+        with connection.begin():
+            for name in ("semester", "enrollment", "pruefungsleistung"):
+                _baue_tabelle_neu(connection, alt.tables[name])
+            # Zustand vor Migration 4: keine Volltextsuche
+            for name in ("modul_suche", "kurs_suche"):
+                for suffix in ("ai", "ad", "au"):
+                    connection.exec_driver_sql(f"DROP TRIGGER {name}_{suffix}")
+                connection.exec_driver_sql(f"DROP TABLE {name}")
+            connection.exec_driver_sql(
+                f"UPDATE metadaten SET _wert = '2' WHERE schluessel = '{SCHEMA_VERSION_SCHLUESSEL}'"
+            )
+        assert not any(
+            fk["options"] for fk in inspect(connection).get_foreign_keys("enrollment")
+        )
+    db.engine.dispose()
+
+    migriert = DatabaseManager(url=url)
+    inspektor = inspect(migriert.engine)
+    for name in ("semester", "enrollment", "pruefungsleistung"):
+        fks = {
+            fk["referred_table"]: fk["options"].get("ondelete")
+            for fk in inspektor.get_foreign_keys(name)
+        }
+        assert "CASCADE" in fks.values(), name
+        assert inspektor.get_indexes(name)
+    assert fks == {"enrollment": "CASCADE"}
+    student = migriert.lade_student("u@gmail.com")
+    assert len(student.enrollments[0].pruefungsleistungen) == 3
+    with migriert.engine.begin() as connection:
+        assert lade_schema_version(connection) == SCHEMA_VERSION
+    assert [m.name for m in migriert.suche_module("M1")] == ["M1"]
+
+    migriert.loesche_student(student)
+    with migriert.engine.connect() as connection:
+        for name in ("semester", "enrollment", "pruefungsleistung"):
+            anzahl = connection.exec_driver_sql(f"SELECT COUNT(*) FROM {name}")
+            assert anzahl.scalar() == 0, name
+    migriert.session.close()
+
+
+def test_migration_studiengang_name_key(tmp_path):
+    """Testet Befüllen und Index des normalisierten Studiengang-Namens (Schema-Version 4).
+
+    Verifiziert:
+        - dass ``name_key`` für bestehende Studiengänge nachgetragen wird,
+        - dass bei Duplikaten nur der älteste Studiengang den Schlüssel erhält,
+        - dass die Suche nach Namen den eindeutigen Index verwendet,
+        - dass ein weiterer Studiengang mit gleichem Schlüssel abgelehnt wird.
+    """
+    assert (
+        normalisiere_name(" Wirtschafts-Ökonomie\tB.A. ")
+        == "wirtschafts-oekonomie b.a."
+    )
+    # zerlegtes Ö (O + Trema) und ß
+    assert normalisiere_name("O\u0308konomie Straße") == "oekonomie strasse"
+    url = f"sqlite+pysqlite:///{tmp_path / 'alt.db'}"
+    db = DatabaseManager(url=url)
+    hs = db.add_hochschule("HS")
+    for name in ("Wirtschaftsökonomie", "Informatik"):
+        sg = db.add_studiengang(name, 180)
+        sg.hochschule = hs
+    db.add_studiengang("Informatik", 180)
+    db.session.commit()
+    with db.engine.begin() as connection:
+        connection.exec_driver_sql("DROP INDEX ux_studiengang_hochschule_id_name_key")
+        connection.exec_driver_sql("ALTER TABLE studiengang DROP COLUMN _name_key")
+        # Duplikat aus der Zeit vor dem eindeutigen Index
+        connection.exec_driver_sql(
+            "INSERT INTO studiengang (_name, _gesamt_ects_punkte, hochschule_id) "
+            f"VALUES ('informatik ', 180, {hs.id})"
+        )
+        connection.exec_driver_sql(
+            f"UPDATE metadaten SET _wert = '4' WHERE schluessel = '{SCHEMA_VERSION_SCHLUESSEL}'"
+        )
+    db.session.close()
+    db.engine.dispose()
+
+    migriert = DatabaseManager(url=url)
+    schluessel = migriert.session.execute(
+        select(Studiengang.name, Studiengang.name_key).order_by(Studiengang.id)
+    ).all()
+    assert schluessel == [
+        ("Wirtschaftsökonomie", "wirtschaftsoekonomie"),
+        ("Informatik", "informatik"),
+        ("Informatik", "informatik"),
+        ("informatik ", None),
+    ]
+    gefunden = migriert.lade_studiengang_mit_name(hs.id, " WIRTSCHAFTSOEKONOMIE")
+    assert gefunden is not None and gefunden.name == "Wirtschaftsökonomie"
+    assert migriert.lade_studiengang_mit_name(hs.id, "INFORMATIK").id == 2
+    with migriert.engine.connect() as connection:
+        plan = connection.exec_driver_sql(
+            "EXPLAIN QUERY PLAN SELECT id FROM studiengang "
+            "WHERE hochschule_id = 1 AND _name_key = 'informatik'"
+        ).all()
+        assert "ux_studiengang_hochschule_id_name_key" in str(plan)
+        assert lade_schema_version(connection) == SCHEMA_VERSION
+
+    doppelt = migriert.add_studiengang("Wirtschafts\u00d6konomie", 180)
+    doppelt.hochschule_id = hs.id
+    with pytest.raises(DBTransactionError):
+        migriert.commit_or_rollback()
+    migriert.session.close()
+
+
+def test_katalog_suche(db):
+    """Testet die FTS5-Suche über Module und Kurse.
+
+    Verifiziert:
+        - Präfixsuche über Modulname, Modulcode, Kursname und Kursnummer,
+        - Ranking (Treffer im Modulcode vor Treffern im Namen),
+        - dass die Trigger den Index bei UPDATE und DELETE nachziehen,
+        - den Fallback per ``LIKE`` ohne FTS-Tabellen.
+    """
+    statistik = db.add_modul("Statistik", "DLBDSSTAT01", 5, None)
+    daten = db.add_modul("Data Science", "DLBDSDS01", 5, None)
+    db.add_modul("Datenbanken", "DLBDB01", 5, None)
+    db.add_modul("DLBDS Grundlagen", "GR01", 5, None)
+    db.add_kurse({"DLBDSSTAT01-01": "Deskriptive Statistik"}, statistik)
+
+    # Treffer im Modulcode vor Treffern im Namen
+    treffer = [m.modulcode for m in db.suche_module("DLBDS")]
+    assert set(treffer[:2]) == {"DLBDSDS01", "DLBDSSTAT01"}
+    assert treffer[2:] == ["GR01"]
+    assert {m.modulcode for m in db.suche_module("dat")} == {"DLBDSDS01", "DLBDB01"}
+    assert [m.modulcode for m in db.suche_module("data sci")] == ["DLBDSDS01"]
+    # Kurstreffer liefern das Modul inkl. Kurse
+    treffer = db.suche_module("deskriptiv")
+    assert [m.modulcode for m in treffer] == ["DLBDSSTAT01"]
+    assert [k.nummer for k in treffer[0].kurse] == ["DLBDSSTAT01-01"]
+    assert [m.modulcode for m in db.suche_module("DLBDB")] == ["DLBDB01"]
+    assert db.suche_module('"') == []
+    assert db.suche_module("dat", limit=0) == []
+
+    daten.name = "Maschinelles Lernen"
+    db.commit_or_rollback()
+    assert [m.modulcode for m in db.suche_module("masch")] == ["DLBDSDS01"]
+    assert [m.modulcode for m in db.suche_module("data")] == []
+    db.session.execute(delete(Kurs))
+    db.commit_or_rollback()
+    assert db.suche_module("deskriptiv") == []
+
+    # ohne FTS5: LIKE auf den Anfang der Felder
+    with db.engine.begin() as connection:
+        connection.exec_driver_sql("DROP TABLE modul_suche")
+    db._volltextsuche = None
+    assert [m.modulcode for m in db.suche_module("Stat")] == ["DLBDSSTAT01"]
+
+
+def test_sql_instrumentierung(controller, db, caplog):
+    """Testet die Zuordnung von SQL-Messwerten zur laufenden Controller-Operation.
+
+    Verifiziert:
+        - Statements, betroffene Zeilen und geladene Objekte pro Operation,
+        - dass verschachtelte Operationen der äußersten zugerechnet werden,
+        - das optionale Logging am Ende jeder Operation.
+    """
+    hs = db.add_hochschule("HS")
+    sg = db.add_studiengang("SG", 180)
+    sg.hochschule = hs
+    db.commit_or_rollback()
+    db.instrumentierung.zuruecksetzen()
+
+    controller.erstelle_account(
+        {
+            "name": "User",
+            "matrikelnummer": "111",
+            "email": "u@gmail.com",
+            "password": "pw",
+            "semesteranzahl": 6,
+            "modulanzahl": 36,
+            "startdatum": "2024-01-01",
+            "zieldatum": "2028-01-01",
+            "zielnote": 2.0,
+            "hochschulid": hs.id,
+            "studiengang_id": sg.id,
+        }
+    )
+    controller.logout()
+    db.recreate_session()
+    assert controller.login("u@gmail.com", "pw")
+
+    statistik = db.instrumentierung.statistik()
+    # Unteroperationen (z. B. erstelle_semester_fuer_student) zählen zu erstelle_account
+    assert set(statistik) == {"erstelle_account", "logout", "login"}
+    assert statistik["logout"].statements == 0
+    account = statistik["erstelle_account"]
+    assert account.aufrufe == 1
+    assert account.statements > 0
+    assert account.zeilen >= 1 + 6  # Student und 6 Semester
+    login = statistik["login"]
+    # Student, Hochschule, Studiengang, Semester, Enrollments (ohne Enrollments keine weiteren)
+    assert login.statements == 5
+    assert login.geladene_objekte == 1 + 1 + 1 + 6  # Student, HS, SG, Semester
+    assert login.sql_zeit <= login.gesamt_zeit
+
+    db.instrumentierung.log_operationen = True
+    with caplog.at_level(logging.INFO, logger="src.instrumentation"):
+        controller.load_dashboard_data()
+    assert "SQL-Statistik load_dashboard_data" in caplog.text
+    assert db.instrumentierung.statistik()["load_dashboard_data"].aufrufe == 1
+
+
+def test_referenz_cache(db, assert_statements):
+    """Testet den Stammdaten-Cache für Hochschule, Studiengang, Modul und Kurs.
+
+    Verifiziert:
+        - dass ``add_*`` neue Objekte in den Cache schreibt (write-through),
+        - dass wiederholte Lookups über ID und natürlichen Schlüssel kein SQL ausführen,
+        - dass ``lade_kurse`` nur fehlende Kurse abfragt,
+        - Treffer-/Fehlzugriffszähler und die LRU-Begrenzung,
+        - dass der Cache nach Rollback und mit einer neuen Session leer ist.
+    """
+    hs = db.add_hochschule("HS")
+    sg = db.add_studiengang("SG", 180)
+    modul = db.add_modul("Modul", "M1", 5, sg.id)
+    kurs = db.add_kurs("Kurs", "K1")
+
+    with assert_statements(0):
+        assert db.lade_hochschule_mit_id(hs.id) is hs
+        assert db.lade_studiengang_mit_id(sg.id) is sg
+        assert db.lade_modul("M1") is modul
+        assert db.lade_kurs("K1") is kurs
+        assert db.lade_kurse(["K1"]) == {"K1": kurs}
+    statistik = db.referenzen.statistik()
+    assert statistik["treffer"] == 5
+    assert statistik["fehlzugriffe"] == 0
+
+    # Nicht vorhandene Objekte werden nicht gecacht.
+    with assert_statements(2):
+        assert db.lade_modul("M2") is None
+        assert db.lade_modul("M2") is None
+    with assert_statements(1):
+        assert db.lade_kurse(["K1", "K2"]) == {"K1": kurs}
+
+    db.recreate_session()
+    assert len(db.referenzen) == 0
+    with assert_statements(1):
+        kurs = db.lade_kurs("K1")
+        assert db.lade_kurs("K1") is kurs
+
+    # Rollback verwirft den Cache
+    with pytest.raises(DBTransactionError):
+        db.add_kurs("Kurs", "K1")
+    assert len(db.referenzen) == 0
+
+    db.referenzen.max_eintraege = 2
+    db.lade_kurs("K1")
+    db.lade_hochschule_mit_id(hs.id)
+    db.lade_studiengang_mit_id(sg.id)
+    assert len(db.referenzen) == 2
+    with assert_statements(1):
+        db.lade_kurs("K1")
+
+
+def test_backup_und_snapshots(tmp_path):
+    """Testet Online-Backup (SQLite-Backup-API) und rotierte ``VACUUM INTO``-Snapshots.
+
+    Verifiziert:
+        - dass das Backup schrittweise im Hintergrund läuft und alle Daten enthält,
+        - dass währenddessen über die Session weiter geschrieben werden kann,
+        - dass nur die letzten ``behalte`` Snapshots erhalten bleiben,
+        - dass In-Memory-Datenbanken abgelehnt werden.
+    """
+    db = DatabaseManager(url=f"sqlite+pysqlite:///{tmp_path / 'data.db'}")
+    for i in range(200):
+        db.session.add(Hochschule(name=f"Hochschule {i:03d} " + "x" * 200))
+    db.commit_or_rollback()
+
+    schritte = []
+    future = db.backup(
+        tmp_path / "backup.db",
+        seiten_pro_schritt=1,
+        fortschritt=lambda verbleibend, gesamt: schritte.append(verbleibend),
+    )
+    db.add_hochschule("Während des Backups")
+    ergebnis = future.result(timeout=30)
+    assert ergebnis.schritte == len(schritte) > 1
+    assert ergebnis.seiten > 1
+    assert ergebnis.dauer > 0
+    assert not (tmp_path / "backup.db.tmp").exists()
+    with sqlite3.connect(tmp_path / "backup.db") as connection:
+        assert connection.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+        assert (
+            connection.execute("SELECT COUNT(*) FROM hochschule").fetchone()[0] >= 200
+        )
+
+    snapshots = [
+        db.snapshot(tmp_path / "snapshots", behalte=2).result(timeout=30)
+        for _ in range(4)
+    ]
+    vorhanden = sorted((tmp_path / "snapshots").glob("data-*.db"))
+    assert vorhanden == [snapshots[2].ziel, snapshots[3].ziel]
+    assert snapshots[3].entfernt == [snapshots[1].ziel]
+    with sqlite3.connect(snapshots[3].ziel) as connection:
+        assert (
+            connection.execute("SELECT COUNT(*) FROM hochschule").fetchone()[0] == 201
+        )
+
+    with pytest.raises(ValueError):
+        DatabaseManager(url="sqlite+pysqlite:///:memory:").snapshot(tmp_path)
+
+
+def test_wartung(tmp_path):
+    """Testet die Datenbankwartung mit Zeitbudget und den Wartungsplaner.
+
+    Verifiziert:
+        - dass ``incremental_vacuum`` alle freien Seiten freigibt und ``ANALYZE`` Statistiken anlegt,
+        - dass ein zu kleines Budget den Lauf abbricht,
+        - dass eine Datenbank ohne ``auto_vacuum=INCREMENTAL`` nicht in der Wartung, sondern
+          einmalig im Backup-Thread umgestellt wird,
+        - dass der Planer nur im Leerlauf und einmal pro Intervall wartet.
+    """
+    pfad = tmp_path / "data.db"
+    db = DatabaseManager(url=f"sqlite+pysqlite:///{pfad}")
+    for i in range(300):
+        db.session.add(Hochschule(name=f"Hochschule {i:03d} " + "x" * 500))
+    db.commit_or_rollback()
+    db.session.execute(delete(Hochschule))
+    db.commit_or_rollback()
+
+    assert db.wartung(budget=0.0).abgebrochen
+
+    ergebnis = db.wartung(budget=5.0)
+    assert not ergebnis.abgebrochen
+    assert ergebnis.freie_seiten_vorher > 0
+    assert ergebnis.freie_seiten_nachher == 0
+    assert set(ergebnis.schritte) == {"incremental_vacuum", "analyze", "optimize"}
+    with sqlite3.connect(pfad) as connection:
+        assert connection.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE name = 'sqlite_stat1'"
+        ).fetchone()[0]
+
+    alt = tmp_path / "alt.db"
+    sqlite3.connect(alt).execute("CREATE TABLE t (x)").connection.close()
+    db_alt = DatabaseManager(url=f"sqlite+pysqlite:///{alt}")
+    # Die Wartung stellt nicht selbst um (VACUUM ohne Budget), ANALYZE/optimize laufen
+    ergebnis = db_alt.wartung(budget=5.0)
+    assert not ergebnis.abgebrochen
+    assert set(ergebnis.schritte) == {"analyze", "optimize"}
+    assert db_alt.stelle_auto_vacuum_um().result(timeout=30)
+    assert not db_alt.stelle_auto_vacuum_um().result(timeout=30)
+    with sqlite3.connect(alt) as connection:
+        assert connection.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+
+    planer = WartungsPlaner(db, intervall=3600, leerlauf=60, budget=5.0)
+    db.letzte_aktivitaet = time.monotonic()
+    assert planer.takt() is None
+    db.letzte_aktivitaet = time.monotonic() - 120
+    assert planer.takt() is not None
+    assert planer.takt() is None
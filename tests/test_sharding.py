@@ -0,0 +1,256 @@
+import sqlite3
+import threading
+import pytest
+from src.database import DBTransactionError
+from src.main import Controller
+from src.sharding import KATALOG, ShardedDatabaseManager
+
+
+def _account(email: str, hochschule_id: int, studiengang_id: int) -> dict:
+    return {
+        "name": "User",
+        "matrikelnummer": "111",
+        "email": email,
+        "password": "pw",
+        "semesteranzahl": 6,
+        "modulanzahl": 36,
+        "startdatum": "2024-01-01",
+        "zieldatum": "2028-01-01",
+        "zielnote": 2.0,
+        "hochschulid": hochschule_id,
+        "studiengang_id": studiengang_id,
+    }
+
+
+def _zaehle(pfad, tabelle: str) -> int:
+    with sqlite3.connect(pfad) as connection:
+        return connection.execute(f"SELECT COUNT(*) FROM {tabelle}").fetchone()[0]
+
+
+@pytest.mark.parametrize("session_strategie", ["langlebig", "pro_operation"])
+def test_sharding_email_router(tmp_path, session_strategie):
+    """Testet den Sharding-Modus mit Routing über den Hash der E-Mail.
+
+    Verifiziert:
+        - dass Stammdaten nur im Katalog und Studentendaten nur in den Shards liegen,
+        - dass Studenten auf mehrere Shards verteilt werden,
+        - dass ``erstelle_account``, ``login`` und Dashboard/Enrollments unverändert funktionieren,
+        - die Auswertung über alle Shards per ``ATTACH``.
+    """
+    db = ShardedDatabaseManager(
+        tmp_path, anzahl_shards=3, session_strategie=session_strategie
+    )
+    controller = Controller(db=db, seed=False, offline=True)
+    hs_id = next(iter(controller.erstelle_hochschule("HS")))
+    sg_id = next(iter(controller.erstelle_studiengang("SG", 180)))
+    controller.add_studiengang_zu_hochschule(
+        {"hochschulid": hs_id, "studiengang_id": sg_id}
+    )
+
+    emails = [f"user{i}@gmail.com" for i in range(8)]
+    for i, email in enumerate(emails):
+        controller.erstelle_account(_account(email, hs_id, sg_id))
+        controller.erstelle_enrollment(
+            {
+                "modul_name": "Modul",
+                "modul_code": f"M{i}",
+                "modul_ects": 5,
+                "kurse_dict": {f"K{i}": "Kurs"},
+                "pl_anzahl": 2,
+                "startdatum": "2024-01-02",
+            }
+        )
+        controller.logout()
+
+    shard_dateien = sorted(tmp_path.glob("shard_*.db"))
+    assert len(shard_dateien) == 3
+    studenten = [_zaehle(pfad, "student") for pfad in shard_dateien]
+    assert sum(studenten) == 8
+    assert sum(1 for anzahl in studenten if anzahl) > 1
+    assert sum(_zaehle(pfad, "pruefungsleistung") for pfad in shard_dateien) == 8 * 6
+    # Katalog-Tabellen (und Fremdschlüssel darauf) gibt es in den Shards nicht
+    assert all(
+        _zaehle(pfad, "sqlite_master WHERE name = 'hochschule'") == 0
+        for pfad in shard_dateien
+    )
+    assert _zaehle(tmp_path / f"{KATALOG}.db", "student") == 0
+    assert _zaehle(tmp_path / f"{KATALOG}.db", "shard_zuordnung") == 8
+
+    for email in reversed(emails):
+        assert controller.login(email, "pw")
+        daten = controller.load_dashboard_data()
+        assert daten["hochschule"] == "HS"
+        assert daten["in_bearbeitung"] == 1
+        assert len(controller.get_list_of_enrollments()) == 1
+        controller.logout()
+    assert not controller.login("unbekannt@gmail.com", "pw")
+
+    assert db.lade_shard_bericht() == [
+        {"hochschule": "HS", "studenten": 8, "enrollments": 8, "erarbeitete_ects": 0}
+    ]
+
+    # Löschen per ON DELETE CASCADE im Shard, Zuordnung im Katalog entfällt
+    assert controller.login(emails[0], "pw")
+    controller.delete_student()
+    assert not controller.login(emails[0], "pw")
+    assert sum(_zaehle(pfad, "student") for pfad in shard_dateien) == 7
+    assert sum(_zaehle(pfad, "pruefungsleistung") for pfad in shard_dateien) == 7 * 6
+    assert _zaehle(tmp_path / f"{KATALOG}.db", "shard_zuordnung") == 7
+
+
+def test_sharding_hochschul_router(tmp_path):
+    """Testet das Routing über die Hochschule.
+
+    Verifiziert:
+        - dass alle Studenten einer Hochschule im selben Shard liegen,
+        - dass eine bereits vergebene E-Mail abgelehnt wird.
+    """
+    db = ShardedDatabaseManager(tmp_path, anzahl_shards=2, router="hochschule")
+    # Seed der Hochschulen (Bulk-INSERT) läuft gegen den Katalog
+    assert db.seed_hochschulen(["HS Seed"]) == 1
+    controller = Controller(db=db, seed=False, offline=True)
+    sg_id = next(iter(controller.erstelle_studiengang("SG", 180)))
+    hochschulen = [
+        next(iter(controller.erstelle_hochschule(f"HS {i}"))) for i in (1, 2)
+    ]
+    for hs_id in hochschulen:
+        for i in range(2):
+            controller.erstelle_account(
+                _account(f"u{hs_id}_{i}@gmail.com", hs_id, sg_id)
+            )
+            controller.logout()
+
+    for hs_id in hochschulen:
+        pfad = tmp_path / f"shard_{hs_id % 2}.db"
+        with sqlite3.connect(pfad) as connection:
+            assert (
+                connection.execute(
+                    "SELECT COUNT(*) FROM student WHERE hochschule_id = ?", (hs_id,)
+                ).fetchone()[0]
+                == 2
+            )
+
+    with pytest.raises(DBTransactionError):
+        controller.erstelle_account(
+            _account(f"u{hochschulen[1]}_0@gmail.com", hochschulen[0], sg_id)
+        )
+    assert [zeile["studenten"] for zeile in db.lade_shard_bericht()] == [2, 2]
+
+
+def test_sharding_aktiver_shard_je_session(tmp_path):
+    """Testet, dass der aktive Shard je Session gilt (zwei Threads, ``pro_operation``).
+
+    Verifiziert:
+        - dass zwei gleichzeitig eingeloggte Studenten aus verschiedenen Shards mit
+          gleicher ID jeweils ihren eigenen Student neu laden,
+        - dass neue Enrollments im Shard des jeweiligen Studenten landen.
+    """
+    db = ShardedDatabaseManager(
+        tmp_path,
+        anzahl_shards=2,
+        router="hochschule",
+        session_strategie="pro_operation",
+    )
+    setup = Controller(db=db, seed=False, offline=True)
+    sg_id = next(iter(setup.erstelle_studiengang("SG", 180)))
+    emails = {}
+    for i in (1, 2):
+        hs_id = next(iter(setup.erstelle_hochschule(f"HS {i}")))
+        emails[f"shard_{hs_id % 2}"] = f"u{i}@gmail.com"
+        setup.erstelle_account(_account(f"u{i}@gmail.com", hs_id, sg_id))
+        setup.logout()
+
+    eingeloggt = threading.Barrier(len(emails))
+    ergebnisse = {}
+
+    def arbeite(shard: str, email: str) -> None:
+        controller = Controller(db=db, seed=False, offline=True)
+        assert controller.login(email, "pw")
+        eingeloggt.wait(timeout=10)
+        controller.erstelle_enrollment(
+            {
+                "modul_name": "Modul",
+                "modul_code": f"M_{shard}",
+                "modul_ects": 5,
+                "kurse_dict": {f"K_{shard}": "Kurs"},
+                "pl_anzahl": 1,
+                "startdatum": "2024-01-02",
+            }
+        )
+        ergebnisse[shard] = (
+            controller.student.email,
+            [e["modul_code"] for e in controller.get_list_of_enrollments()],
+        )
+
+    threads = [
+        threading.Thread(target=arbeite, args=(shard, email))
+        for shard, email in emails.items()
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert ergebnisse == {
+        shard: (email, [f"M_{shard}"]) for shard, email in emails.items()
+    }
+    for shard in emails:
+        with sqlite3.connect(tmp_path / f"{shard}.db") as connection:
+            assert connection.execute(
+                "SELECT student_id FROM enrollment"
+            ).fetchall() == [(1,)]
+
+
+def test_sharding_backup_und_snapshot(tmp_path):
+    """Testet Backup und Snapshot im Sharding-Modus.
+
+    Verifiziert:
+        - dass Backup und Snapshot Katalog und alle Shards enthalten,
+        - dass ein wiederhergestellter Snapshot bzw. ein Backup den Student findet,
+        - dass nur die letzten ``behalte`` Snapshot-Verzeichnisse erhalten bleiben.
+    """
+    db = ShardedDatabaseManager(tmp_path / "shards", anzahl_shards=2)
+    controller = Controller(db=db, seed=False, offline=True)
+    hs_id = next(iter(controller.erstelle_hochschule("HS")))
+    sg_id = next(iter(controller.erstelle_studiengang("SG", 180)))
+    controller.erstelle_account(_account("user@gmail.com", hs_id, sg_id))
+    controller.erstelle_enrollment(
+        {
+            "modul_name": "Modul",
+            "modul_code": "M1",
+            "modul_ects": 5,
+            "kurse_dict": {"K1": "Kurs"},
+            "pl_anzahl": 1,
+            "startdatum": "2024-01-02",
+        }
+    )
+    controller.logout()
+
+    backup = db.backup(tmp_path / "backup").result(timeout=30)
+    snapshots = [
+        db.snapshot(tmp_path / "snapshots", behalte=2).result(timeout=30)
+        for _ in range(3)
+    ]
+    assert sorted((tmp_path / "snapshots").glob("shards-*")) == [
+        snapshots[1].ziel,
+        snapshots[2].ziel,
+    ]
+    assert snapshots[2].entfernt == [snapshots[0].ziel]
+    assert snapshots[2].groesse > 0
+
+    for ergebnis in (backup, snapshots[2]):
+        assert sorted(pfad.name for pfad in ergebnis.ziel.iterdir()) == [
+            f"{KATALOG}.db",
+            "shard_0.db",
+            "shard_1.db",
+        ]
+        wiederhergestellt = Controller(
+            db=ShardedDatabaseManager(ergebnis.ziel, anzahl_shards=2),
+            seed=False,
+            offline=True,
+        )
+        assert wiederhergestellt.login("user@gmail.com", "pw")
+        assert [
+            e["modul_code"] for e in wiederhergestellt.get_list_of_enrollments()
+        ] == ["M1"]
+        assert wiederhergestellt.load_dashboard_data()["hochschule"] == "HS"
@@ -0,0 +1,179 @@
+import datetime
+import random
+import subprocess
+import sys
+from pathlib import Path
+from fractions import Fraction
+import pytest
+from src.models import Enrollment, EnrollmentStatus, Modul, Pruefungsleistung, Student
+from src.statistik import (
+    NUMPY_AB_VERSUCHE,
+    berechne_statistik,
+    packe_versuche,
+)
+
+NOTEN = [1.0, 1.3, 1.7, 2.0, 2.3, 2.7, 3.0, 3.3, 3.7, 4.0, 4.3, 5.0, 1.15, 2.675]
+GEWICHTE = [1.0, 0.5, 0.3, 0.7, 1 / 3, 0.25]
+
+
+def _student_mit_zufallsdaten(anzahl_enrollments: int, seed: int) -> Student:
+    """Erzeugt einen Student mit zufälligen Enrollments (ohne Datenbank).
+
+    Jedes Enrollment hat 1-3 Teilprüfungen mit je 1-3 Versuchen; Noten und Daten fehlen
+    teilweise. Der gespeicherte Status wird per ``aktualisiere_status`` gesetzt.
+    """
+    zufall = random.Random(seed)
+    student = Student(
+        name="S",
+        matrikelnummer="1",
+        email="s@gmail.com",
+        password="pw",
+        semester_anzahl=6,
+        modul_anzahl=36,
+        start_datum=datetime.date(2024, 1, 1),
+        ziel_datum=datetime.date(2027, 1, 1),
+        ziel_note=2.0,
+    )
+    for nummer in range(anzahl_enrollments):
+        teilpruefungen = zufall.randint(1, 3)
+        enrollment = Enrollment(
+            modul=Modul(
+                name=f"M{nummer}",
+                modulcode=f"M{nummer}",
+                ects_punkte=zufall.choice([5, 10, 15]),
+            ),
+            status=EnrollmentStatus.IN_BEARBEITUNG,
+            einschreibe_datum=datetime.date(2024, 1, 1),
+            anzahl_pruefungsleistungen=teilpruefungen,
+        )
+        for teilpruefung in range(teilpruefungen):
+            gewicht = zufall.choice(GEWICHTE)
+            for versuch in range(1, zufall.randint(1, 3) + 1):
+                enrollment.pruefungsleistungen.append(
+                    Pruefungsleistung(
+                        teilpruefung=teilpruefung,
+                        teilpruefung_gewicht=gewicht,
+                        versuch=versuch,
+                        note=zufall.choice(NOTEN + [None]),
+                        datum=zufall.choice(
+                            [
+                                None,
+                                datetime.date(2024, 1, 1)
+                                + datetime.timedelta(zufall.randrange(700)),
+                            ]
+                        ),
+                    )
+                )
+        enrollment.aktualisiere_status()
+        student.enrollments.append(enrollment)
+    return student
+
+
+@pytest.fixture(params=[False, True], ids=["python", "numpy"])
+def vektorisiert(request):
+    if request.param:
+        pytest.importorskip("numpy")
+    return request.param
+
+
+@pytest.mark.parametrize("anzahl_enrollments,seed", [(0, 0), (1, 1), (40, 2), (400, 3)])
+def test_statistik_paritaet(vektorisiert, anzahl_enrollments, seed):
+    """Testet den Statistik-Kern gegen die Methoden der Modelle.
+
+    Verifiziert für Python- und NumPy-Weg:
+        - Bestehen je Versuch wie ``Pruefungsleistung.ist_bestanden``,
+        - Modulnote, Enddatum und Status wie ``berechne_enrollment_note``, ``set_end_date``
+          und ``aktualisiere_status``,
+        - Kennzahlen und Notendurchschnitt wie ``Student.aendere_kennzahlen``,
+        - den ECTS-gewichteten Durchschnitt gegen eine exakte Rechnung mit ``Fraction``.
+    """
+    student = _student_mit_zufallsdaten(anzahl_enrollments, seed)
+    statistik = berechne_statistik(packe_versuche(student.enrollments), vektorisiert)
+    enrollments = student.enrollments
+
+    assert statistik.bestanden == [
+        pl.ist_bestanden() for e in enrollments for pl in e.pruefungsleistungen
+    ]
+    assert statistik.enrollment_noten == [
+        e.berechne_enrollment_note() for e in enrollments
+    ]
+    assert statistik.end_daten == [e.set_end_date() for e in enrollments]
+    assert statistik.status == [e.status.name for e in enrollments]
+
+    student.setze_kennzahlen_zurueck()
+    for enrollment in enrollments:
+        student.aendere_kennzahlen(enrollment, 1)
+    erwartet = student.kennzahlen()
+    notendurchschnitt = student.notendurchschnitt
+    student.berechne_kennzahlen_neu()
+    assert student.kennzahlen() == erwartet
+    assert statistik.notendurchschnitt == notendurchschnitt
+
+    benotet = [
+        (Fraction(round(e.berechne_enrollment_note() * 100), 100), e.modul.ects_punkte)
+        for e in enrollments
+        if e.status == EnrollmentStatus.ABGESCHLOSSEN
+        and e.berechne_enrollment_note() is not None
+    ]
+    if benotet:
+        exakt = sum(note * ects for note, ects in benotet) / sum(e for _, e in benotet)
+        assert statistik.ects_gewichteter_durchschnitt == round(float(exakt), 2)
+    else:
+        assert statistik.ects_gewichteter_durchschnitt is None
+
+
+def test_statistik_auswahl_und_gespeicherter_status(monkeypatch):
+    """Testet die Wahl des Rechenwegs und die Zählung nach gespeichertem Status.
+
+    Verifiziert:
+        - dass ohne Vorgabe erst ab ``NUMPY_AB_VERSUCHE`` vektorisiert wird,
+        - dass ``vektorisiert=True`` ohne NumPy einen ``RuntimeError`` auslöst,
+        - dass Kennzahlen den gespeicherten Status zählen, der berechnete Status aber
+          aus den Versuchen folgt (wie ``Student.aendere_kennzahlen``).
+    """
+    import src.statistik as statistik_modul
+
+    aufrufe = []
+    monkeypatch.setattr(
+        statistik_modul, "_berechne_numpy", lambda daten: aufrufe.append(daten)
+    )
+    monkeypatch.setattr(statistik_modul, "NUMPY_VERFUEGBAR", True)
+    klein = packe_versuche(_student_mit_zufallsdaten(3, 4).enrollments)
+    berechne_statistik(klein)
+    assert aufrufe == []
+    gross = packe_versuche(_student_mit_zufallsdaten(NUMPY_AB_VERSUCHE, 5).enrollments)
+    berechne_statistik(gross)
+    assert aufrufe == [gross]
+
+    monkeypatch.setattr(statistik_modul, "NUMPY_VERFUEGBAR", False)
+    berechne_statistik(gross)
+    assert aufrufe == [gross]
+    with pytest.raises(RuntimeError):
+        berechne_statistik(gross, vektorisiert=True)
+
+    student = _student_mit_zufallsdaten(1, 6)
+    enrollment = student.enrollments[0]
+    for pl in enrollment.pruefungsleistungen:
+        pl.note = 1.0
+    enrollment.anzahl_pruefungsleistungen = len(enrollment.pruefungsleistungen)
+    enrollment.status = EnrollmentStatus.IN_BEARBEITUNG
+    statistik = berechne_statistik(packe_versuche(student.enrollments))
+    assert statistik.status == ["ABGESCHLOSSEN"]
+    assert statistik.anzahl_je_status["IN_BEARBEITUNG"] == 1
+    assert statistik.erarbeitete_ects == 0
+    assert statistik.notendurchschnitt is None
+
+
+def test_numpy_wird_erst_bei_bedarf_importiert():
+    """Testet, dass der Import der Anwendung NumPy nicht lädt (optionale Abhängigkeit)."""
+    ergebnis = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, src.main; assert 'numpy' not in sys.modules",
+        ],
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True,
+        text=True,
+    )
+    assert ergebnis.returncode == 0, ergebnis.stderr